@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Generic, TypeVar
+from typing import ClassVar, Generic, TypeVar
 
 from infrastructure.browser_service import BrowserService
 
@@ -10,6 +10,18 @@ T = TypeVar('T')
 
 @dataclass
 class UseCase(ABC, Generic[T]):
+    # Names of results this use case needs before it can run; those matching
+    # parameters of ``execute`` are passed in as keyword arguments.
+    requires: ClassVar[tuple[str, ...]] = ()
+    # Name under which the result of ``execute`` is published to later use cases.
+    provides: ClassVar[str | None] = None
+    # Shared resources (e.g. the primary "page") used exclusively while running. Use cases
+    # that work in leased contexts declare none and run alongside the others; the order of
+    # use cases that share a resource should still follow from ``requires``.
+    resources: ClassVar[frozenset[str]] = frozenset()
+    # Seconds a single run may take; every browser call inside gets at most what is left.
+    budget: ClassVar[float | None] = None
+
     @property
     @abstractmethod
     def browser_service(self) -> BrowserService:
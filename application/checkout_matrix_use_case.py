@@ -0,0 +1,169 @@
+import asyncio
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from itertools import product as combinations
+import logging
+import time
+from typing import ClassVar, Optional
+
+from application.base import UseCase
+from infrastructure.browser_service import BrowserService
+from infrastructure.page_objects import CartPage, CheckoutOverviewPage, CheckoutPage, InventoryPage
+from settings.configs.general import url_inventory
+
+
+CHECKOUT_FIELDS = ("first_name", "last_name", "postal_code")
+FIELD_STATES = ("valid", "missing", "invalid")
+
+VALID_VALUES = {"first_name": "John", "last_name": "Doe", "postal_code": "12345"}
+INVALID_VALUES = {"first_name": "   ", "last_name": "   ", "postal_code": "not-a-zip"}
+# Saucedemo validates the fields in form order and reports the first one left empty.
+REQUIRED_ERRORS = {
+    "first_name": "Error: First Name is required",
+    "last_name": "Error: Last Name is required",
+    "postal_code": "Error: Postal Code is required",
+}
+
+
+@dataclass
+class CheckoutCase:
+    product: str
+    states: dict[str, str]
+    errors: list[str] = field(default_factory=list)
+    # Whether the form was accepted and the overview page opened.
+    accepted: Optional[bool] = None
+    failure: Optional[str] = None
+    duration: float = 0.0
+
+    @property
+    def values(self) -> dict[str, Optional[str]]:
+        """Form values of the case; missing fields are left untouched."""
+        return {
+            name: VALID_VALUES[name] if state == "valid" else INVALID_VALUES[name] if state == "invalid" else None
+            for name, state in self.states.items()
+        }
+
+    @property
+    def expected_errors(self) -> list[str]:
+        missing = next((name for name in CHECKOUT_FIELDS if self.states[name] == "missing"), None)
+        return [REQUIRED_ERRORS[missing]] if missing else []
+
+    @property
+    def matched(self) -> bool:
+        """The site reported exactly the error of the first missing field, or accepted a complete form."""
+        return self.failure is None and self.errors == self.expected_errors
+
+    def to_dict(self) -> dict:
+        return {**asdict(self), "expected_errors": self.expected_errors, "matched": self.matched}
+
+
+def checkout_cases(products: tuple[str, ...]) -> list[CheckoutCase]:
+    """
+    Every combination of valid, missing and invalid checkout fields, for every product.
+
+    :return: ``len(products) * 27`` cases, the all-valid control case included.
+    """
+    return [
+        CheckoutCase(slug, dict(zip(CHECKOUT_FIELDS, states)))
+        for slug in products
+        for states in combinations(FIELD_STATES, repeat=len(CHECKOUT_FIELDS))
+    ]
+
+
+@dataclass
+class CheckoutMatrixReport:
+    cases: list[CheckoutCase]
+    duration: float = 0.0
+
+    @property
+    def mismatches(self) -> list[CheckoutCase]:
+        return [case for case in self.cases if not case.matched]
+
+    def summary(self) -> dict[str, int]:
+        return {
+            "cases": len(self.cases),
+            "accepted": sum(1 for case in self.cases if case.accepted),
+            "rejected": sum(1 for case in self.cases if case.accepted is False),
+            "failed": sum(1 for case in self.cases if case.failure),
+            "mismatched": len(self.mismatches),
+        }
+
+    @property
+    def errors(self) -> list[str]:
+        return [error for case in self.cases for error in case.errors]
+
+    def error_counts(self) -> dict[str, int]:
+        return dict(Counter(self.errors).most_common())
+
+    def to_dict(self) -> dict:
+        return {
+            "summary": self.summary(),
+            "duration": round(self.duration, 3),
+            "errors": self.error_counts(),
+            "cases": [case.to_dict() for case in self.cases],
+        }
+
+
+@dataclass
+class CheckoutMatrixUseCase(UseCase[CheckoutMatrixReport]):
+    requires = ("session",)
+    provides = "checkout_matrix"
+    budget = 180.0
+
+    _browser_service: BrowserService
+    logger: logging.Logger
+    # Inventory slugs to check out, e.g. "sauce-labs-backpack".
+    products: tuple[str, ...] = ("sauce-labs-backpack",)
+
+    # Fields left empty show an error; anything else should reach the overview.
+    outcomes: ClassVar[tuple[str, str]] = (CheckoutPage.ERROR, CheckoutOverviewPage.FINISH)
+
+    @property
+    def browser_service(self):
+        return self._browser_service
+
+    async def execute(self) -> CheckoutMatrixReport:
+        """
+        Submit the checkout form for every case of the matrix, each in its own signed-in context.
+
+        Cases run concurrently, as many at once as the context pool allows. A case that
+        fails to run is reported with its failure instead of aborting the matrix.
+
+        :return: The report of every case.
+        """
+        started = time.perf_counter()
+        cases = checkout_cases(self.products)
+        # Cookies only: the primary page's cart must not leak into the cases.
+        session = {"cookies": (await self.browser_service.storage_state()).get("cookies", [])}
+        await asyncio.gather(*(self._run_case(case, session) for case in cases))
+        report = CheckoutMatrixReport(cases, time.perf_counter() - started)
+
+        self.logger.info(
+            "Checkout matrix completed: %s", report.summary(),
+            extra={"use_case": "checkout_matrix", "step": "validation", "duration": round(report.duration, 3)},
+        )
+        for case in report.mismatches:
+            self.logger.warning(
+                "Checkout case %s %s: expected %s, got %s%s", case.product, case.states, case.expected_errors,
+                case.errors, f" ({case.failure})" if case.failure else "",
+            )
+        return report
+
+    async def _run_case(self, case: CheckoutCase, session: dict) -> None:
+        started = time.perf_counter()
+        try:
+            async with self.browser_service.lease() as browser:
+                await browser.restore_session(session)
+                await browser.go_to(url_inventory())
+                inventory = browser.page_object(InventoryPage)
+                await inventory.add_to_cart(case.product)
+                await inventory.open_cart()
+                await browser.page_object(CartPage).checkout()
+                await browser.page_object(CheckoutPage).submit_information(**case.values)
+                outcome = await browser.wait_for_any(*self.outcomes)
+                case.accepted = outcome == CheckoutOverviewPage.FINISH
+                case.errors = [] if case.accepted else await browser.get_validation_errors()
+        except Exception as e:
+            case.failure = str(e)
+        finally:
+            case.duration = time.perf_counter() - started
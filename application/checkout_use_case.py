@@ -1,12 +1,20 @@
 from dataclasses import dataclass
 import logging
+import time
 
 from application.base import UseCase
 from infrastructure.browser_service import BrowserService
+from infrastructure.page_objects import CartPage, CheckoutPage, InventoryPage
+from settings.configs.general import url_inventory
 
 
 @dataclass
 class CheckoutUseCase(UseCase[dict[str, str]]):
+    requires = ("session",)
+    provides = "checkout"
+    # Runs in a leased context, so it overlaps product extraction on the primary page.
+    budget = 60.0
+
     _browser_service: BrowserService
     logger: logging.Logger
     
@@ -16,43 +24,52 @@ class CheckoutUseCase(UseCase[dict[str, str]]):
 
     async def execute(self) -> dict[str, str]:
         """Simulate checkout with missing data and return validation results"""
+        # Cookies only: the primary page's cart must not leak into this checkout.
+        session = {"cookies": (await self.browser_service.storage_state()).get("cookies", [])}
+        async with self.browser_service.lease() as browser:
+            await browser.restore_session(session)
+            return await self.check_out(browser)
+
+    async def check_out(self, browser: BrowserService) -> dict[str, str]:
+        """
+        Run the checkout with a missing first name on an already signed-in ``browser``.
+
+        :return: The validation errors shown and the screenshot taken.
+        """
         result = {'errors': [], 'screenshot': None}
-        try: 
+        started = time.perf_counter()
+        try:
+            await browser.go_to(url_inventory())
+            inventory = browser.page_object(InventoryPage)
+            cart = browser.page_object(CartPage)
+            checkout = browser.page_object(CheckoutPage)
+
             # 1. Add product to cart
-            await self.browser_service.click('[data-test="add-to-cart-sauce-labs-backpack"]')
+            await inventory.add_to_cart('sauce-labs-backpack')
 
             # 2. Go to cart
-            await self.browser_service.click('.shopping_cart_link')
+            await inventory.open_cart()
 
             # 3. Proceed to checkout
-            await self.browser_service.click('[data-test="checkout"]')
-            
-            # 4. Fill in checkout information
-            await self.browser_service.fill('[data-test="lastName"]', 'Doe')
-            await self.browser_service.fill('[data-test="postalCode"]', '12345')
-            
-            # 5. Attempt to continue
-            await self.browser_service.click('[data-test="continue"]')
-            
-            # 6. Validate errors
-            errors = await self.browser_service.get_validation_errors()
+            await cart.checkout()
+
+            # 4. Fill in checkout information without a first name and attempt to continue
+            await checkout.submit_information(last_name='Doe', postal_code='12345', wait_for=CheckoutPage.ERROR)
+
+            # 5. Validate errors
+            errors = await browser.get_validation_errors()
             result['errors'] = errors
-            
-            # 7. Take screenshot
-            screenshot_path = 'automation_screenshots/checkout_validation_error.png'
-            await self.browser_service.take_screenshot(screenshot_path)
-            result['screenshot'] = screenshot_path
-            
-            # 8. Reset state
-            await self.browser_service.click('[data-test="cancel"]')
-            await self.browser_service.click('#continue-shopping')
-            await self.browser_service.page.wait_for_selector('#inventory_container', state='visible')
-            
+
+            # 6. Take screenshot
+            result['screenshot'] = await browser.take_screenshot('checkout_validation_error.png')
+
         except Exception as e:
-            self.logger.error(f'Checkout attempt failed: {str(e)}')
-            await self.browser_service.take_screenshot('automation_screenshots/checkout_attempt_failure.png')
+            self.logger.error('Checkout attempt failed: %s', e)
+            await browser.take_screenshot('checkout_attempt_failure.png')
             raise
-        
-        await self.browser_service.close()
-        self.logger.info(f"Checkout validation completed with errors: {result['errors']}")
-        return result
\ No newline at end of file
+
+        self.logger.info(
+            "Checkout validation completed with errors: %s", result['errors'],
+            extra={"use_case": "checkout", "step": "validation", "duration": round(time.perf_counter() - started, 3)},
+        )
+        return result
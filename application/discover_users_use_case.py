@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+
+from application.base import UseCase
+from application.login_use_case import LoginUseCase
+from domain.entities.user import User
+
+
+@dataclass
+class DiscoverUsersUseCase(UseCase[list[User] | None]):
+    provides = "users"
+    resources = frozenset({"page"})
+    budget = 30.0
+
+    login_use_case: LoginUseCase
+
+    @property
+    def browser_service(self):
+        return self.login_use_case.browser_service
+
+    async def execute(self) -> list[User] | None:
+        return await self.login_use_case.get_users_credentials()
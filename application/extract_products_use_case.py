@@ -1,20 +1,60 @@
+import asyncio
 from dataclasses import dataclass
 import logging
+import os
+from typing import AsyncIterator, Optional
 
 from application.base import UseCase
+from domain.entities.product import Product
+from domain.entities.product_catalog import ProductCatalog
 from infrastructure.browser_service import BrowserService
-from infrastructure.csv_exporter import ProductCSVExporter
+from infrastructure.catalog_snapshot import CatalogSnapshotStore
+from infrastructure.detail_crawler import ProductDetailCrawler
+from infrastructure.product_exporter import ProductStreamExporter
 
 
 @dataclass
-class ExtractProductsUseCase(UseCase[None]):
+class ExtractProductsUseCase(UseCase[ProductCatalog]):
+    requires = ("session",)
+    provides = "products"
+    resources = frozenset({"page"})
+    budget = 300.0
+
     _browser_service: BrowserService
-    exporter: ProductCSVExporter
+    exporter: ProductStreamExporter
+    snapshots: CatalogSnapshotStore
+    logger: logging.Logger
+    # Leave the existing export untouched when the catalog matches the previous snapshot.
+    skip_unchanged: bool = False
+    # Enriches each listing batch from the item detail pages when set.
+    details: Optional[ProductDetailCrawler] = None
 
     @property
     def browser_service(self):
         return self._browser_service
-    
-    async def execute(self) -> None:
-        products = await self.browser_service.extract_products()
-        self.exporter.export(products)
+
+    async def execute(self, filename: str = "products.csv") -> ProductCatalog:
+        """
+        Export every product of the inventory to ``filename`` and diff it against the previous run.
+
+        :return: The catalog extracted by this run.
+        """
+        snapshot = self.snapshots.begin(filename)
+        count = await self.exporter.export(
+            snapshot.track(self._products()),
+            filename,
+            keep=lambda: not (self.skip_unchanged and snapshot.finish().unchanged and os.path.exists(filename)),
+        )
+        diff = await asyncio.to_thread(self.snapshots.commit, filename, snapshot)
+        if diff.unchanged:
+            self.logger.info("Catalog unchanged since the previous run (%s products).", count)
+        else:
+            self.logger.info("Catalog changes since the previous run: %s", diff.summary())
+        return snapshot.current
+
+    async def _products(self) -> AsyncIterator[Product]:
+        async for batch in self.browser_service.paginate():
+            if self.details:
+                batch = await self.details.enrich(batch)
+            for product in batch:
+                yield product
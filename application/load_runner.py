@@ -0,0 +1,195 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+import json
+import logging
+import math
+from multiprocessing import get_context
+import os
+import tempfile
+import time
+from typing import Awaitable, Callable
+
+from application.checkout_use_case import CheckoutUseCase
+from application.login_use_case import LoginUseCase
+from domain.entities.user import User
+from infrastructure.browser_service import BrowserService
+from infrastructure.deadline import deadline
+from infrastructure.logger import configure_logger
+from infrastructure.session_store import SessionStore
+
+
+STEPS = ("login", "extract", "checkout")
+
+
+@dataclass
+class LoadProfile:
+    url: str
+    virtual_users: int = 10
+    ramp_up: float = 10.0
+    duration: float = 60.0
+    processes: int = field(default_factory=lambda: os.cpu_count() or 1)
+    username: str = "standard_user"
+    password: str = "secret_sauce"
+    think_time: float = 0.0
+    # Seconds a single step may take before it is abandoned and counted as an error.
+    step_budget: float = 60.0
+    start_at: float = 0.0
+
+    @property
+    def end_at(self) -> float:
+        return self.start_at + self.ramp_up + self.duration
+
+
+@dataclass
+class StepSamples:
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+
+    def observe(self, seconds: float, ok: bool) -> None:
+        self.latencies.append(seconds)
+        if not ok:
+            self.errors += 1
+
+    def merge(self, other: "StepSamples") -> None:
+        self.latencies.extend(other.latencies)
+        self.errors += other.errors
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[max(0, math.ceil(q * len(sorted_values)) - 1)]
+
+
+def summarize(samples: dict[str, StepSamples], elapsed: float) -> dict:
+    report = {}
+    for step, step_samples in samples.items():
+        latencies = sorted(step_samples.latencies)
+        count = len(latencies)
+        report[step] = {
+            "count": count,
+            "errors": step_samples.errors,
+            "error_rate": step_samples.errors / count if count else 0.0,
+            "throughput_per_second": count / elapsed if elapsed else 0.0,
+            "p50_seconds": percentile(latencies, 0.50),
+            "p95_seconds": percentile(latencies, 0.95),
+            "p99_seconds": percentile(latencies, 0.99),
+        }
+    return report
+
+
+@dataclass
+class LoadRunner:
+    """
+    Drives virtual users through login -> extract -> checkout across a process pool.
+
+    Each process launches one browser and runs its share of the virtual users on leased
+    contexts. Virtual user ``i`` starts ``ramp_up * i / virtual_users`` seconds in and
+    repeats the flow until ``ramp_up + duration`` has elapsed.
+    """
+    profile: LoadProfile
+    logger: logging.Logger
+
+    def run(self) -> dict:
+        processes = max(1, min(self.profile.processes, self.profile.virtual_users))
+        # Processes start a few seconds apart; a shared wall-clock start keeps the ramp aligned.
+        self.profile.start_at = time.time() + 2.0
+        shares = [list(range(i, self.profile.virtual_users, processes)) for i in range(processes)]
+        self.logger.info(
+            "Starting load test: %s virtual users on %s processes against %s",
+            self.profile.virtual_users, processes, self.profile.url,
+        )
+
+        samples = {step: StepSamples() for step in STEPS}
+        with ProcessPoolExecutor(max_workers=processes, mp_context=get_context("spawn")) as pool:
+            futures = [pool.submit(run_worker, self.profile, index, share) for index, share in enumerate(shares)]
+            for future in futures:
+                for step, step_samples in future.result().items():
+                    samples[step].merge(step_samples)
+
+        elapsed = time.time() - self.profile.start_at
+        report = {
+            "virtual_users": self.profile.virtual_users,
+            "processes": processes,
+            "elapsed_seconds": elapsed,
+            "steps": summarize(samples, elapsed),
+        }
+        self.logger.info("Load test finished: %s", report["steps"])
+        return report
+
+
+def run_worker(profile: LoadProfile, index: int, virtual_users: list[int]) -> dict[str, StepSamples]:
+    return asyncio.run(_worker(profile, index, virtual_users))
+
+
+async def _worker(profile: LoadProfile, index: int, virtual_users: list[int]) -> dict[str, StepSamples]:
+    os.environ["URL_LOG"] = profile.url
+    from settings.containers import _init_container
+
+    container = _init_container()
+    logger = configure_logger(filename=f"loadgen-worker-{index}.log")
+    browser_service = container.resolve(BrowserService)
+    browser_service.config.pool_size = len(virtual_users)
+    session_store = SessionStore(directory=tempfile.mkdtemp(prefix="loadgen-sessions-"), ttl=0)
+
+    samples = {step: StepSamples() for step in STEPS}
+    await browser_service.initialize()
+    try:
+        await asyncio.gather(*(
+            _virtual_user(browser_service, logger, session_store, profile, vu, samples) for vu in virtual_users
+        ))
+    finally:
+        await browser_service.close()
+    return samples
+
+
+async def _virtual_user(
+    browser_service: BrowserService,
+    logger: logging.Logger,
+    session_store: SessionStore,
+    profile: LoadProfile,
+    vu: int,
+    samples: dict[str, StepSamples],
+) -> None:
+    await asyncio.sleep(max(0.0, profile.start_at + profile.ramp_up * vu / profile.virtual_users - time.time()))
+    user = User(profile.username, profile.password)
+
+    while time.time() < profile.end_at:
+        async with browser_service.lease() as browser:
+            login_uc = LoginUseCase(browser, logger, session_store)
+
+            async def login() -> bool:
+                await browser.go_to(profile.url)
+                return await login_uc.login(user)
+
+            async def extract() -> bool:
+                return bool(await browser.extract_products())
+
+            async def checkout() -> bool:
+                # Already signed in on this leased page, so there is no context to lease.
+                await CheckoutUseCase(browser, logger).check_out(browser)
+                return True
+
+            for step, action in zip(STEPS, (login, extract, checkout)):
+                if not await _timed(samples[step], action, profile.step_budget):
+                    break
+        if profile.think_time:
+            await asyncio.sleep(profile.think_time)
+
+
+async def _timed(samples: StepSamples, action: Callable[[], Awaitable[bool]], budget: float) -> bool:
+    started = time.perf_counter()
+    try:
+        with deadline(budget):
+            ok = await action()
+    except Exception:
+        ok = False
+    samples.observe(time.perf_counter() - started, ok)
+    return ok
+
+
+def write_report(report: dict, path: str = "load_report.json") -> None:
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
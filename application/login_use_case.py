@@ -1,68 +1,163 @@
+import asyncio
 from dataclasses import dataclass
 import logging
 import time
+from typing import Awaitable
 
 from application.base import UseCase
 from domain.entities.user import User
 from infrastructure.browser_service import BrowserService
-from settings.configs.general import url_login
+from infrastructure.page_objects import InventoryPage, LoginPage
+from infrastructure.session_store import SessionStore
+from settings.configs.general import url_inventory, url_login
 
 
 @dataclass
-class LoginUseCase(UseCase[None]):
+class LoginUseCase(UseCase[dict[str, bool]]):
+    requires = ("users",)
+    provides = "session"
+    resources = frozenset({"page"})
+    budget = 60.0
+
     _browser_service: BrowserService
     logger: logging.Logger
-    
+    session_store: SessionStore
+
     @property
     def browser_service(self):
-        return self._browser_service        
+        return self._browser_service
+
+    async def execute(self, users: list[User]) -> dict[str, bool]:
+        """
+        Try every user concurrently and report each outcome.
+
+        The first user is tried on the shared page, the rest on leased pool contexts; the
+        shared page counts towards ``pool_size``, so at most that many attempts run at once.
+        If the shared page did not end up logged in, it is signed in with the first
+        user that succeeded so later use cases can continue on it.
 
-    async def execute(self,users: list[User]) -> None:
-        self.logger.info(f"Found {len(users)} users to test. Logging in...{users}")
+        :return: Mapping of username to login success.
+        """
+        if not users:
+            return {}
+        self.logger.info("Found %s users to test. Logging in...%s", len(users), users)
 
-        for user in users:
-            result = await self._attempt_login(self.browser_service, user)
-            if result:
-                return 
+        primary, *others = users
+        attempts = asyncio.Semaphore(self.browser_service.config.pool_size)
+        outcomes = await asyncio.gather(
+            self._limited(attempts, self._attempt_login(self.browser_service, primary)),
+            *(self._limited(attempts, self._attempt_leased_login(user)) for user in others),
+        )
+        results = {user.username: outcome for user, outcome in zip(users, outcomes)}
 
-    async def get_users_credentials(self, url: str = url_login()) -> list[User] | None:
+        if not outcomes[0]:
+            winner = next((user for user, outcome in zip(users, outcomes) if outcome), None)
+            if winner:
+                await self.browser_service.go_to(url_login())
+                await self._attempt_login(self.browser_service, winner)
+
+        self.logger.info("Login outcomes: %s", results)
+        return results
+
+    async def get_users_credentials(self, url: str | None = None) -> list[User] | None:
+        url = url or url_login()
         async with self.browser_service as browser:
             await browser.go_to(url)
-            return await browser.get_users_credentials()
+            users = self.session_store.load_users(url)
+            if users:
+                self.logger.info("Using %s cached users for %s", len(users), url)
+                return users
+            users = await browser.get_users_credentials()
+            if users:
+                self.session_store.save_users(url, users)
+            return users
+
+    async def login(self, user: User) -> bool:
+        """
+        Sign a single user in on this use case's page, resuming a stored session when one is valid.
+
+        :return: Whether the user ended up logged in.
+        """
+        return await self._attempt_login(self.browser_service, user)
+
+    @staticmethod
+    async def _limited(semaphore: asyncio.Semaphore, attempt: Awaitable[bool]) -> bool:
+        async with semaphore:
+            return await attempt
+
+    async def _attempt_leased_login(self, user: User) -> bool:
+        async with self.browser_service.lease() as browser:
+            try:
+                await browser.go_to(url_login())
+            except Exception as e:
+                self._critical_error(e)
+                return False
+            return await self._attempt_login(browser, user)
 
     async def _attempt_login(self, browser: BrowserService, user: User) -> bool:
+        started = time.perf_counter()
         try:
-            await self._fill_credentials(user)
-            await self._submit_login()
+            if await self._resume_session(browser, user):
+                self.logger.info(
+                    "User %s resumed a stored session.", user.username,
+                    extra=self._log_fields(user, "resume_session", started),
+                )
+                return True
 
-            if await self._is_login_successful():
-                self._log_success(browser, user)
+            await self._submit_credentials(browser, user)
+
+            if await self._is_login_successful(browser):
+                self.session_store.save_state(url_login(), user.username, await browser.storage_state())
+                await self._log_success(browser, user, started)
                 return True
             else:
-                self._log_failure(browser, user)
+                await self._log_failure(browser, user, started)
                 return False
 
         except Exception as e:
             self._critical_error(e)
             return False
 
-    async def _fill_credentials(self, user: User):
-        await self.browser_service.fill('#user-name', user.username)
-        await self.browser_service.fill('#password', user.password)
+    async def _resume_session(self, browser: BrowserService, user: User) -> bool:
+        state = self.session_store.load_state(url_login(), user.username)
+        if not state:
+            return False
+        await browser.restore_session(state, url_inventory())
+        if await browser.wait_for_any(InventoryPage.CONTAINER, LoginPage.SUBMIT) == InventoryPage.CONTAINER:
+            return True
+        self.logger.info("Stored session of %s has expired.", user.username)
+        self.session_store.invalidate(url_login(), user.username)
+        # Reload the form so the redirect's error message cannot be mistaken for a login outcome.
+        await browser.go_to(url_login())
+        return False
+
+    async def _submit_credentials(self, browser: BrowserService, user: User):
+        await browser.page_object(LoginPage).submit_credentials(user.username, user.password)
 
-    async def _submit_login(self):
-        await self.browser_service.click('[data-test="login-button"]')
+    async def _is_login_successful(self, browser: BrowserService) -> bool:
+        await browser.wait_for_outcome("inventory", LoginPage.ERROR)
+        return "inventory" in browser.current_url
 
-    async def _is_login_successful(self) -> bool:
-        return "inventory" in self.browser_service.current_url
+    async def _log_success(self, browser: BrowserService, user: User, started: float) -> None:
+        self.logger.info(
+            "User %s logged in successfully.", user.username, extra=self._log_fields(user, "login", started)
+        )
+        await browser.take_screenshot(f"success_{user.username}.png")
 
-    async def _log_success(self, browser: BrowserService, user: User) -> None:
-        self.logger.info(f"User {user.username} logged in successfully.")
-        await browser.take_screenshot(f"automation_screenshots/success_{user.username}.png")
+    async def _log_failure(self, browser: BrowserService, user: User, started: float) -> None:
+        self.logger.warning(
+            "User %s failed to log in.", user.username, extra=self._log_fields(user, "login", started)
+        )
+        await browser.take_screenshot(f"failed_{user.username}.png")
 
-    async def _log_failure(self, browser: BrowserService, user: User) -> None:
-        self.logger.warning(f"User {user.username} failed to log in.")
-        await browser.take_screenshot(f"automation_screenshots/failed_{user.username}.png")
+    @staticmethod
+    def _log_fields(user: User, step: str, started: float) -> dict:
+        return {
+            "use_case": "login",
+            "step": step,
+            "user": user.username,
+            "duration": round(time.perf_counter() - started, 3),
+        }
 
     def _critical_error(self, error: Exception) -> None:
-        self.logger.critical(f"Login failed: {str(error)}")
+        self.logger.critical("Login failed: %s", error)
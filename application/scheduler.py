@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import asyncio
+from contextlib import AsyncExitStack
+from dataclasses import dataclass, field
+import inspect
+import logging
+import time
+from typing import TYPE_CHECKING, Any, Optional, Sequence
+
+from application.base import UseCase
+from infrastructure.deadline import deadline
+
+if TYPE_CHECKING:
+    import punq
+
+
+@dataclass
+class StepTiming:
+    name: str
+    status: str = "pending"
+    queued: Optional[float] = None
+    started: Optional[float] = None
+    finished: Optional[float] = None
+    error: Optional[str] = None
+
+    @property
+    def waited(self) -> float:
+        """Seconds spent waiting for a free slot and exclusive resources once dependencies were met."""
+        return self.started - self.queued if self.started and self.queued else 0.0
+
+    @property
+    def duration(self) -> float:
+        return self.finished - self.started if self.started and self.finished else 0.0
+
+
+@dataclass
+class ScheduleResult:
+    results: dict[str, Any]
+    timings: list[StepTiming]
+
+    def report(self) -> str:
+        width = max((len(timing.name) for timing in self.timings), default=4)
+        lines = [f"{'step':<{width}}  {'status':<9}  {'waited':>8}  {'duration':>8}"]
+        for timing in self.timings:
+            lines.append(
+                f"{timing.name:<{width}}  {timing.status:<9}  {timing.waited:>7.3f}s  {timing.duration:>7.3f}s"
+                + (f"  {timing.error}" if timing.error else "")
+            )
+        return "\n".join(lines)
+
+
+class SchedulingError(Exception):
+    pass
+
+
+@dataclass
+class UseCaseScheduler:
+    """
+    Runs use cases as a DAG built from their ``requires``/``provides`` declarations.
+
+    Use cases whose requirements are met run concurrently, bounded by ``max_parallel``
+    and by exclusive access to the ``resources`` they declare. Each step runs under its
+    deadline budget. The first failure cancels every step that is still waiting or running.
+    """
+    container: punq.Container
+    logger: logging.Logger
+    max_parallel: int = 4
+    # Budget of use cases that do not declare their own; None leaves them unbounded.
+    step_budget: Optional[float] = None
+    # Steps and results of the latest run, kept when it fails.
+    last: Optional[ScheduleResult] = field(default=None, init=False)
+
+    async def run(self, scenario: Sequence[type[UseCase]]) -> ScheduleResult:
+        self._validate(scenario)
+        results: dict[str, Any] = {}
+        timings = [StepTiming(use_case.__name__) for use_case in scenario]
+        ready = {use_case.provides: asyncio.Event() for use_case in scenario if use_case.provides}
+        locks = {resource: asyncio.Lock() for use_case in scenario for resource in use_case.resources}
+        slots = asyncio.Semaphore(self.max_parallel)
+        self.last = ScheduleResult(results, timings)
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                for use_case, timing in zip(scenario, timings):
+                    group.create_task(self._run_step(use_case, timing, results, ready, locks, slots))
+        except BaseExceptionGroup as errors:
+            self.logger.error("Scenario failed:\n%s", self.last.report())
+            raise errors.exceptions[0]
+
+        self.logger.info("Scenario completed:\n%s", self.last.report())
+        return self.last
+
+    async def _run_step(
+        self,
+        use_case: type[UseCase],
+        timing: StepTiming,
+        results: dict[str, Any],
+        ready: dict[str, asyncio.Event],
+        locks: dict[str, asyncio.Lock],
+        slots: asyncio.Semaphore,
+    ) -> None:
+        try:
+            for requirement in use_case.requires:
+                await ready[requirement].wait()
+            timing.queued = time.perf_counter()
+            async with AsyncExitStack() as stack:
+                # Resources first, so a step blocked on a resource does not hold a slot.
+                for resource in sorted(use_case.resources):
+                    await stack.enter_async_context(locks[resource])
+                await stack.enter_async_context(slots)
+                timing.started, timing.status = time.perf_counter(), "running"
+                instance = self.container.resolve(use_case)
+                parameters = inspect.signature(instance.execute).parameters
+                with deadline(use_case.budget or self.step_budget):
+                    result = await instance.execute(
+                        **{name: results[name] for name in use_case.requires if name in parameters}
+                    )
+            timing.status = "ok"
+        except asyncio.CancelledError:
+            timing.status = "cancelled"
+            raise
+        except Exception as e:
+            timing.status, timing.error = "failed", str(e)
+            raise
+        finally:
+            if timing.started:
+                timing.finished = time.perf_counter()
+
+        if use_case.provides:
+            results[use_case.provides] = result
+            ready[use_case.provides].set()
+
+    @staticmethod
+    def _validate(scenario: Sequence[type[UseCase]]) -> None:
+        providers: dict[str, str] = {}
+        for use_case in scenario:
+            if use_case.provides in providers:
+                raise SchedulingError(
+                    f"{use_case.__name__} and {providers[use_case.provides]} both provide {use_case.provides!r}"
+                )
+            if use_case.provides:
+                providers[use_case.provides] = use_case.__name__
+
+        available: set[str] = set()
+        pending = list(scenario)
+        while pending:
+            runnable = [use_case for use_case in pending if set(use_case.requires) <= available]
+            if not runnable:
+                missing = {
+                    use_case.__name__: sorted(set(use_case.requires) - available) for use_case in pending
+                }
+                raise SchedulingError(f"Unsatisfiable or cyclic requirements: {missing}")
+            for use_case in runnable:
+                pending.remove(use_case)
+                if use_case.provides:
+                    available.add(use_case.provides)
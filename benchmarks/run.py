@@ -0,0 +1,194 @@
+import argparse
+import asyncio
+from dataclasses import dataclass, field
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import AsyncIterator
+
+from benchmarks.standin_server import PASSWORD, StandInServer
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BASELINE = os.path.join(ROOT, "benchmarks", "baseline.json")
+BENCHMARKS = ("login", "extract", "export", "e2e")
+
+
+@dataclass
+class BenchmarkSettings:
+    sizes: tuple[int, ...] = (10, 1000, 50000)
+    page_size: int = 1000
+    repeat: int = 3
+    only: tuple[str, ...] = BENCHMARKS
+    workdir: str = field(default_factory=lambda: tempfile.mkdtemp(prefix="automation-bench-"))
+
+
+def _fresh_container():
+    """A container that is not the process-wide cached one, with its own empty session store."""
+    from infrastructure.session_store import SessionStore
+    from settings.containers import _init_container
+
+    container = _init_container()
+    container.register(SessionStore, instance=SessionStore(directory=tempfile.mkdtemp(prefix="sessions-")))
+    return container
+
+
+async def bench_login(settings: BenchmarkSettings) -> dict:
+    from application.login_use_case import LoginUseCase
+    from domain.entities.user import User
+    from infrastructure.session_store import SessionStore
+
+    with StandInServer(catalog_size=10) as standin:
+        os.environ["URL_LOG"] = standin.url
+        container = _fresh_container()
+        login_uc = container.resolve(LoginUseCase)
+        store = container.resolve(SessionStore)
+        samples = []
+        async with login_uc.browser_service as browser:
+            for _ in range(settings.repeat):
+                store.clear()
+                await browser._context.clear_cookies()
+                await browser.go_to(standin.url)
+                started = time.perf_counter()
+                outcomes = await login_uc.execute([User("standard_user", PASSWORD)])
+                samples.append(time.perf_counter() - started)
+                if not outcomes.get("standard_user"):
+                    raise RuntimeError("Login failed against the stand-in server")
+            await browser.close()
+    return {"seconds": statistics.median(samples), "samples": samples}
+
+
+async def bench_extract(settings: BenchmarkSettings, size: int) -> dict:
+    from application.login_use_case import LoginUseCase
+    from domain.entities.user import User
+
+    with StandInServer(catalog_size=size, page_size=settings.page_size) as standin:
+        os.environ["URL_LOG"] = standin.url
+        login_uc = _fresh_container().resolve(LoginUseCase)
+        async with login_uc.browser_service as browser:
+            await browser.go_to(standin.url)
+            await login_uc.execute([User("standard_user", PASSWORD)])
+            started = time.perf_counter()
+            count = sum([len(batch) async for batch in browser.paginate()])
+            elapsed = time.perf_counter() - started
+            await browser.close()
+    if count != size:
+        raise RuntimeError(f"Extracted {count} of {size} products")
+    return {"seconds": elapsed, "items_per_second": count / elapsed if elapsed else 0.0}
+
+
+async def bench_export(settings: BenchmarkSettings, size: int) -> dict:
+    import logging
+
+    from benchmarks.standin_server import generate_catalog
+    from domain.entities.product import Product
+    from infrastructure.product_exporter import ProductStreamExporter
+
+    catalog = generate_catalog(size)
+
+    async def products() -> AsyncIterator[Product]:
+        for item in catalog:
+            yield Product(item.name, item.price.lstrip("$"), item.id)
+
+    exporter = ProductStreamExporter(logger=logging.getLogger("benchmarks"))
+    samples = []
+    for _ in range(settings.repeat):
+        path = os.path.join(settings.workdir, f"products-{size}.csv")
+        started = time.perf_counter()
+        await exporter.export(products(), path)
+        samples.append(time.perf_counter() - started)
+    seconds = statistics.median(samples)
+    return {"seconds": seconds, "items_per_second": size / seconds if seconds else 0.0}
+
+
+def bench_e2e(settings: BenchmarkSettings) -> dict:
+    samples = []
+    with StandInServer(catalog_size=10) as standin:
+        env = {**os.environ, "URL_LOG": standin.url, "PYTHONPATH": ROOT}
+        for _ in range(settings.repeat):
+            started = time.perf_counter()
+            subprocess.run(
+                [sys.executable, os.path.join(ROOT, "main.py")],
+                cwd=settings.workdir, env=env, check=True, capture_output=True,
+            )
+            samples.append(time.perf_counter() - started)
+    return {"seconds": statistics.median(samples), "samples": samples}
+
+
+async def run_benchmarks(settings: BenchmarkSettings) -> dict:
+    results: dict = {"created_at": time.strftime("%Y-%m-%dT%H:%M:%S"), "python": sys.version.split()[0]}
+    if "login" in settings.only:
+        results["login"] = await bench_login(settings)
+    if "extract" in settings.only:
+        results["extract"] = {str(size): await bench_extract(settings, size) for size in settings.sizes}
+    if "export" in settings.only:
+        results["export"] = {str(size): await bench_export(settings, size) for size in settings.sizes}
+    if "e2e" in settings.only:
+        results["e2e"] = await asyncio.to_thread(bench_e2e, settings)
+    return results
+
+
+def _timings(results: dict, prefix: str = "") -> dict[str, float]:
+    """Flatten every ``seconds`` entry of a result tree into ``path -> seconds``."""
+    timings = {}
+    for key, value in results.items():
+        if isinstance(value, dict):
+            timings.update(_timings(value, f"{prefix}{key}."))
+        elif key == "seconds":
+            timings[prefix.rstrip(".")] = value
+    return timings
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """
+    Compare timings against a baseline.
+
+    :return: One message per timing that is slower than the baseline by more than ``tolerance``.
+    """
+    current, previous = _timings(results), _timings(baseline)
+    return [
+        f"{name}: {current[name]:.3f}s vs baseline {previous[name]:.3f}s (+{(current[name] / previous[name] - 1) * 100:.0f}%)"
+        for name in sorted(current.keys() & previous.keys())
+        if previous[name] and current[name] > previous[name] * (1 + tolerance)
+    ]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Offline performance benchmarks against a local saucedemo stand-in.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(BenchmarkSettings.sizes))
+    parser.add_argument("--page-size", type=int, default=BenchmarkSettings.page_size)
+    parser.add_argument("--repeat", type=int, default=BenchmarkSettings.repeat)
+    parser.add_argument("--only", nargs="+", choices=BENCHMARKS, default=list(BENCHMARKS))
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--update-baseline", action="store_true", help="Write the results as the new baseline.")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed slowdown before failing, e.g. 0.2 = 20%%.")
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, ROOT)
+    args.baseline = os.path.abspath(args.baseline)
+    settings = BenchmarkSettings(
+        sizes=tuple(args.sizes), page_size=args.page_size, repeat=args.repeat, only=tuple(args.only)
+    )
+    os.chdir(settings.workdir)
+    results = asyncio.run(run_benchmarks(settings))
+    print(json.dumps(results, indent=2))
+
+    if args.update_baseline or not os.path.exists(args.baseline):
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    with open(args.baseline) as f:
+        regressions = compare(results, json.load(f), args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
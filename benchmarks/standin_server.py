@@ -0,0 +1,377 @@
+from dataclasses import dataclass, field
+from functools import lru_cache
+from html import escape
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import random
+import re
+import threading
+import time
+from typing import Optional
+from urllib.parse import parse_qs, urlparse
+
+
+USERS = (
+    "standard_user",
+    "locked_out_user",
+    "problem_user",
+    "performance_glitch_user",
+    "error_user",
+    "visual_user",
+)
+PASSWORD = "secret_sauce"
+
+# The six items of the real inventory, in listing order, followed by generated ones.
+BASE_ITEMS = (
+    (4, "Sauce Labs Backpack", 2999),
+    (0, "Sauce Labs Bike Light", 999),
+    (1, "Sauce Labs Bolt T-Shirt", 1599),
+    (5, "Sauce Labs Fleece Jacket", 4999),
+    (2, "Sauce Labs Onesie", 799),
+    (3, "Test.allTheThings() T-Shirt (Red)", 1599),
+)
+
+
+@dataclass(frozen=True)
+class CatalogItem:
+    id: int
+    name: str
+    price_cents: int
+    description: str
+
+    @property
+    def slug(self) -> str:
+        return re.sub(r"[^a-z0-9]+", "-", self.name.lower()).strip("-")
+
+    @property
+    def price(self) -> str:
+        return f"${self.price_cents // 100}.{self.price_cents % 100:02d}"
+
+
+@lru_cache(maxsize=8)
+def generate_catalog(size: int) -> tuple[CatalogItem, ...]:
+    items = [
+        CatalogItem(item_id, name, cents, f"Description of {name}.")
+        for item_id, name, cents in BASE_ITEMS[:size]
+    ]
+    rng = random.Random(size)
+    for item_id in range(len(BASE_ITEMS), size):
+        name = f"Sauce Labs Item {item_id}"
+        items.append(CatalogItem(item_id, name, rng.randint(199, 9999), f"Description of {name}."))
+    return tuple(items)
+
+
+APP_JS = """
+function cart() { return JSON.parse(localStorage.getItem('cart-contents') || '[]'); }
+function saveCart(items) { localStorage.setItem('cart-contents', JSON.stringify(items)); }
+
+function showError(message) {
+    document.querySelector('.error-message-container').innerHTML = '<h3 data-test="error">' + message + '</h3>';
+}
+
+function login(event) {
+    event.preventDefault();
+    const username = document.getElementById('user-name').value;
+    const password = document.getElementById('password').value;
+    const users = JSON.parse(document.body.dataset.users);
+    if (!username) return showError('Epic sadface: Username is required');
+    if (!password) return showError('Epic sadface: Password is required');
+    if (!users.includes(username) || password !== document.body.dataset.password) {
+        return showError('Epic sadface: Username and password do not match any user in this service');
+    }
+    if (username === 'locked_out_user') return showError('Epic sadface: Sorry, this user has been locked out.');
+    document.cookie = 'session-username=' + username + '; path=/';
+    location.href = '/inventory.html';
+}
+
+function toggleCart(button) {
+    const id = Number(button.dataset.id);
+    const slug = button.dataset.slug;
+    const items = cart();
+    const added = items.includes(id);
+    saveCart(added ? items.filter((item) => item !== id) : items.concat([id]));
+    button.dataset.test = (added ? 'add-to-cart-' : 'remove-') + slug;
+    button.id = button.dataset.test;
+    button.textContent = added ? 'Add to cart' : 'Remove';
+    document.querySelector('.shopping_cart_badge').textContent = cart().length || '';
+}
+
+function renderCart() {
+    document.querySelector('.cart_list').innerHTML = cart()
+        .map((id) => '<div class="cart_item" data-test="inventory-item">' + id + '</div>').join('');
+}
+
+function continueCheckout(event) {
+    event.preventDefault();
+    const value = (name) => document.querySelector('[data-test="' + name + '"]').value;
+    if (!value('firstName')) return showError('Error: First Name is required');
+    if (!value('lastName')) return showError('Error: Last Name is required');
+    if (!value('postalCode')) return showError('Error: Postal Code is required');
+    location.href = '/checkout-step-two.html';
+}
+"""
+
+APP_CSS = """
+.inventory_item { display: inline-block; width: 240px; margin: 8px; }
+.error-message-container h3 { color: #e2231a; }
+"""
+
+ITEM_SVG = '<svg xmlns="http://www.w3.org/2000/svg" width="8" height="8"><rect width="8" height="8" fill="#{color}"/></svg>'
+
+
+def _document(title: str, body: str, body_attrs: str = "") -> str:
+    return (
+        "<!DOCTYPE html><html><head><meta charset=\"utf-8\">"
+        f"<title>{escape(title)}</title>"
+        '<link rel="stylesheet" href="/static/app.css"><script src="/static/app.js"></script>'
+        f"</head><body {body_attrs}>{body}</body></html>"
+    )
+
+
+def _header() -> str:
+    return (
+        '<div class="primary_header"><a class="shopping_cart_link" data-test="shopping-cart-link" href="/cart.html">'
+        '<span class="shopping_cart_badge" data-test="shopping-cart-badge"></span></a></div>'
+    )
+
+
+@dataclass
+class StandInServer:
+    """
+    Local stand-in for the login, inventory, cart and checkout pages of saucedemo.com.
+
+    The inventory is generated with ``catalog_size`` items and split into pages of
+    ``page_size`` items linked by a ``[data-test="pagination-next"]`` link.
+    """
+    catalog_size: int = 6
+    page_size: Optional[int] = None
+    latency: float = 0.0
+    host: str = "127.0.0.1"
+    port: int = 0
+    _server: Optional[ThreadingHTTPServer] = field(default=None, init=False, repr=False)
+    _thread: Optional[threading.Thread] = field(default=None, init=False, repr=False)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    @property
+    def catalog(self) -> tuple[CatalogItem, ...]:
+        return generate_catalog(self.catalog_size)
+
+    def start(self) -> str:
+        server = self
+
+        class Handler(_StandInHandler):
+            standin = server
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self.url
+
+    def stop(self) -> None:
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "StandInServer":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+    def render_login(self, error: Optional[str]) -> str:
+        message = (
+            f"<h3 data-test=\"error\">Epic sadface: You can only access '/{escape(error)}.html' when you are logged in.</h3>"
+            if error else ""
+        )
+        return _document(
+            "Swag Labs",
+            '<div class="login_container"><form onsubmit="login(event)">'
+            '<input id="user-name" data-test="username" name="user-name" placeholder="Username">'
+            '<input id="password" data-test="password" name="password" type="password" placeholder="Password">'
+            f'<div class="error-message-container">{message}</div>'
+            '<input type="submit" id="login-button" data-test="login-button" value="Login">'
+            '</form></div>'
+            '<div class="login_credentials_wrap">'
+            '<div class="login_credentials" data-test="login-credentials"><h4>Accepted usernames are:</h4>'
+            + "<br>".join(USERS) +
+            '</div><div class="login_password" data-test="login-password"><h4>Password for all users:</h4>'
+            f'{PASSWORD}</div></div>',
+            body_attrs=f'data-users="{escape(json.dumps(USERS))}" data-password="{PASSWORD}"',
+        )
+
+    def render_inventory(self, page: int) -> str:
+        catalog = self.catalog
+        size = self.page_size or len(catalog) or 1
+        items = catalog[(page - 1) * size:page * size]
+        rendered = "".join(
+            '<div class="inventory_item" data-test="inventory-item">'
+            f'<div class="inventory_item_img"><a href="./inventory-item.html?id={item.id}" id="item_{item.id}_img_link">'
+            f'<img class="inventory_item_img" src="/static/item_{item.id}.svg" alt="{escape(item.name)}"></a></div>'
+            f'<div class="inventory_item_description"><a href="./inventory-item.html?id={item.id}" id="item_{item.id}_title_link">'
+            f'<div class="inventory_item_name" data-test="inventory-item-name">{escape(item.name)}</div></a>'
+            f'<div class="inventory_item_desc" data-test="inventory-item-desc">{escape(item.description)}</div>'
+            f'<div class="inventory_item_price" data-test="inventory-item-price">{item.price}</div>'
+            f'<button data-test="add-to-cart-{item.slug}" id="add-to-cart-{item.slug}" data-id="{item.id}"'
+            f' data-slug="{item.slug}" onclick="toggleCart(this)">Add to cart</button></div></div>'
+            for item in items
+        )
+        pagination = (
+            f'<a data-test="pagination-next" href="/inventory.html?page={page + 1}">Next</a>'
+            if page * size < len(catalog) else ""
+        )
+        return _document(
+            "Swag Labs",
+            f'{_header()}<div id="inventory_container" class="inventory_container">'
+            f'<div class="inventory_list" data-test="inventory-list">{rendered}</div></div>{pagination}',
+        )
+
+    def render_item(self, item_id: int) -> Optional[str]:
+        item = next((item for item in self.catalog if item.id == item_id), None)
+        if item is None:
+            return None
+        return _document(
+            item.name,
+            f'{_header()}<div class="inventory_details" data-test="inventory-item">'
+            f'<img class="inventory_details_img" src="/static/item_{item.id}.svg" alt="{escape(item.name)}">'
+            f'<div class="inventory_details_name large_size" data-test="inventory-item-name">{escape(item.name)}</div>'
+            f'<div class="inventory_details_desc large_size" data-test="inventory-item-desc">{escape(item.description)}</div>'
+            f'<div class="inventory_details_price" data-test="inventory-item-price">{item.price}</div>'
+            f'<button data-test="back-to-products" id="back-to-products" onclick="location.href=\'/inventory.html\'">'
+            'Back to products</button></div>',
+        )
+
+    def render_cart(self) -> str:
+        return _document(
+            "Swag Labs",
+            f'{_header()}<div class="cart_list" data-test="cart-list"></div>'
+            '<button data-test="continue-shopping" id="continue-shopping" onclick="location.href=\'/inventory.html\'">'
+            'Continue Shopping</button>'
+            '<button data-test="checkout" id="checkout" onclick="location.href=\'/checkout-step-one.html\'">Checkout</button>'
+            '<script>renderCart()</script>',
+        )
+
+    def render_checkout(self) -> str:
+        return _document(
+            "Swag Labs",
+            f'{_header()}<form onsubmit="continueCheckout(event)">'
+            '<input id="first-name" data-test="firstName" placeholder="First Name">'
+            '<input id="last-name" data-test="lastName" placeholder="Last Name">'
+            '<input id="postal-code" data-test="postalCode" placeholder="Zip/Postal Code">'
+            '<div class="error-message-container"></div>'
+            '<button type="button" data-test="cancel" id="cancel" onclick="location.href=\'/cart.html\'">Cancel</button>'
+            '<input type="submit" data-test="continue" id="continue" value="Continue"></form>',
+        )
+
+    def render_overview(self) -> str:
+        return _document(
+            "Swag Labs",
+            f'{_header()}<div class="summary_info" data-test="checkout-summary"></div>'
+            '<button data-test="finish" id="finish">Finish</button>',
+        )
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    standin: StandInServer
+    protocol_version = "HTTP/1.1"
+
+    PROTECTED = {
+        "/inventory.html": "inventory",
+        "/inventory-item.html": "inventory-item",
+        "/cart.html": "cart",
+        "/checkout-step-one.html": "checkout-step-one",
+        "/checkout-step-two.html": "checkout-step-two",
+    }
+
+    def do_GET(self) -> None:
+        if self.standin.latency:
+            time.sleep(self.standin.latency)
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+
+        if url.path.startswith("/static/"):
+            return self._static(url.path)
+        if url.path in self.PROTECTED and not self._username():
+            return self._redirect(f"/?error={self.PROTECTED[url.path]}")
+
+        try:
+            body = self._render(url.path, query)
+        except ValueError:
+            # A non-numeric page or item id.
+            return self._send(400, "text/plain", b"Bad request")
+        if body is None:
+            return self._send(404, "text/plain", b"Not found")
+        self._send(200, "text/html; charset=utf-8", body.encode("utf-8"))
+
+    def _render(self, path: str, query: dict[str, list[str]]) -> Optional[str]:
+        if path in ("/", "/index.html"):
+            return self.standin.render_login(query.get("error", [None])[0])
+        if path == "/inventory.html":
+            return self.standin.render_inventory(max(1, int(query.get("page", ["1"])[0])))
+        if path == "/inventory-item.html":
+            return self.standin.render_item(int(query.get("id", ["-1"])[0]))
+        if path == "/cart.html":
+            return self.standin.render_cart()
+        if path == "/checkout-step-one.html":
+            return self.standin.render_checkout()
+        if path == "/checkout-step-two.html":
+            return self.standin.render_overview()
+        return None
+
+    def _static(self, path: str) -> None:
+        match = re.fullmatch(r"/static/item_(\d+)\.svg", path)
+        if path == "/static/app.js":
+            self._send(200, "application/javascript", APP_JS.encode("utf-8"), cache=True)
+        elif path == "/static/app.css":
+            self._send(200, "text/css", APP_CSS.encode("utf-8"), cache=True)
+        elif match:
+            color = f"{int(match.group(1)) * 2654435761 % 0xFFFFFF:06x}"
+            self._send(200, "image/svg+xml", ITEM_SVG.format(color=color).encode("utf-8"), cache=True)
+        else:
+            self._send(404, "text/plain", b"Not found")
+
+    def _username(self) -> Optional[str]:
+        cookie = SimpleCookie(self.headers.get("Cookie", ""))
+        morsel = cookie.get("session-username")
+        return morsel.value if morsel and morsel.value in USERS else None
+
+    def _redirect(self, location: str) -> None:
+        self.send_response(302)
+        self.send_header("Location", location)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def _send(self, status: int, content_type: str, body: bytes, cache: bool = False) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "public, max-age=3600" if cache else "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Serve a local saucedemo stand-in.")
+    parser.add_argument("--items", type=int, default=6)
+    parser.add_argument("--page-size", type=int, default=None)
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+
+    with StandInServer(catalog_size=args.items, page_size=args.page_size, port=args.port) as standin:
+        print(f"Serving {args.items} items at {standin.url}")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
@@ -1,10 +1,14 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Product:
     name: str
-    price: float
+    # As displayed on the site, e.g. "29.99"; ProductCatalog parses it into cents.
+    price: str | float
+    id: int | None = None
+    image_url: str | None = None
+    description: str | None = None
 
     def __post_init__(self):
         if not self.name:
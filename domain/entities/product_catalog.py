@@ -0,0 +1,219 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+import re
+from typing import Iterable, Iterator, Optional
+
+from domain.entities.product import Product
+
+
+NO_ID = -1
+# Field names of a catalog row, matching the ``Product`` attributes.
+FIELDS = ("name", "price", "id", "image_url", "description")
+_PRICE = re.compile(r"^\s*\$?\s*(\d+)(?:\.(\d{1,2}))?\s*$")
+
+
+class CatalogValidationError(ValueError):
+    def __init__(self, errors: list[str]):
+        super().__init__(f"{len(errors)} invalid catalog rows: {'; '.join(errors[:10])}")
+        self.errors = errors
+
+
+def parse_prices(values: Iterable[str | float], first_row: int = 0) -> tuple[array, list[str]]:
+    """
+    Parse displayed prices such as ``"$29.99"`` into integer cents.
+
+    :return: The cents of every value (0 where invalid) and the errors found.
+    """
+    cents, errors = array("q"), []
+    for row, value in enumerate(values, first_row):
+        parsed = _parse_price(value)
+        if parsed is None:
+            errors.append(f"row {row}: invalid price {value!r}")
+        cents.append(parsed or 0)
+    return cents, errors
+
+
+def _parse_price(value: str | float) -> Optional[int]:
+    if isinstance(value, (int, float)):
+        return round(value * 100)
+    match = _PRICE.match(value or "")
+    return None if match is None else int(match[1]) * 100 + int((match[2] or "0").ljust(2, "0"))
+
+
+def format_price(cents: int) -> str:
+    return f"{cents // 100}.{cents % 100:02d}"
+
+
+@dataclass(frozen=True, slots=True)
+class CatalogStats:
+    count: int
+    min_cents: int
+    max_cents: int
+    mean_cents: float
+
+
+class ProductCatalog:
+    """
+    Column-oriented product list with prices held as integer cents.
+
+    Rows are stored across one ``array`` or list per field instead of one ``Product``
+    per item, and are validated in bulk when added. Name and price indexes are built
+    on first use and dropped whenever rows are appended.
+    """
+    __slots__ = ("names", "price_cents", "ids", "image_urls", "descriptions", "_by_name", "_by_price")
+
+    def __init__(self):
+        self.names: list[str] = []
+        self.price_cents = array("q")
+        self.ids = array("q")
+        self.image_urls: list[Optional[str]] = []
+        self.descriptions: list[Optional[str]] = []
+        self._by_name: Optional[dict[str, list[int]]] = None
+        self._by_price: Optional[tuple[array, array]] = None
+
+    @classmethod
+    def from_products(cls, products: Iterable[Product]) -> "ProductCatalog":
+        catalog = cls()
+        catalog.extend(products)
+        return catalog
+
+    @classmethod
+    def from_records(
+        cls, records: Iterable[dict], image_key: str = "image", skip_invalid: bool = False
+    ) -> "ProductCatalog":
+        """
+        Build a catalog straight from extracted or stored records, without creating ``Product`` objects.
+        """
+        records = list(records)
+        catalog = cls()
+        catalog.add_columns(
+            [record["name"] for record in records],
+            [record["price"] for record in records],
+            [record.get("id") for record in records],
+            [record.get(image_key) for record in records],
+            [record.get("description") for record in records],
+            skip_invalid=skip_invalid,
+        )
+        return catalog
+
+    def extend(self, products: Iterable[Product], skip_invalid: bool = False, first_row: int = 0) -> list[str]:
+        products = list(products)
+        return self.add_columns(
+            [product.name for product in products],
+            [product.price for product in products],
+            [product.id for product in products],
+            [product.image_url for product in products],
+            [product.description for product in products],
+            skip_invalid=skip_invalid,
+            first_row=first_row,
+        )
+
+    def add_columns(
+        self,
+        names: list[str],
+        prices: list[str | float],
+        ids: list[Optional[int]],
+        image_urls: list[Optional[str]],
+        descriptions: list[Optional[str]],
+        skip_invalid: bool = False,
+        first_row: int = 0,
+    ) -> list[str]:
+        """
+        Validate and append whole columns at once; nothing is added if any row is invalid,
+        unless ``skip_invalid`` is set and only the valid rows are. Errors number the rows
+        from ``first_row``.
+
+        :return: The errors of the skipped rows.
+        :raises CatalogValidationError: Listing every invalid row, unless ``skip_invalid`` is set.
+        """
+        cents, errors = parse_prices(prices, first_row)
+        errors += [f"row {row}: empty name" for row, name in enumerate(names, first_row) if not name]
+        if errors and not skip_invalid:
+            raise CatalogValidationError(errors)
+        if errors:
+            keep = [
+                row for row, (name, price) in enumerate(zip(names, prices))
+                if name and _parse_price(price) is not None
+            ]
+            names, ids, image_urls, descriptions = (
+                [column[row] for row in keep] for column in (names, ids, image_urls, descriptions)
+            )
+            cents = array("q", (cents[row] for row in keep))
+
+        self.names.extend(names)
+        self.price_cents.extend(cents)
+        self.ids.extend(NO_ID if item_id is None else int(item_id) for item_id in ids)
+        self.image_urls.extend(image_urls)
+        self.descriptions.extend(descriptions)
+        self._by_name = self._by_price = None
+        return errors
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getitem__(self, index: int) -> Product:
+        return Product(*self.row(index))
+
+    def row(self, index: int) -> tuple:
+        item_id = self.ids[index]
+        return (
+            self.names[index],
+            format_price(self.price_cents[index]),
+            None if item_id == NO_ID else item_id,
+            self.image_urls[index],
+            self.descriptions[index],
+        )
+
+    def __iter__(self) -> Iterator[Product]:
+        return (self[index] for index in range(len(self)))
+
+    def rows(self) -> Iterator[tuple]:
+        """
+        Rows as ``(name, price, id, image_url, description)`` tuples, prices formatted from cents.
+        """
+        ids = (None if item_id == NO_ID else item_id for item_id in self.ids)
+        return zip(self.names, map(format_price, self.price_cents), ids, self.image_urls, self.descriptions)
+
+    def find(self, name: str) -> list[Product]:
+        if self._by_name is None:
+            self._by_name = {}
+            for index, product_name in enumerate(self.names):
+                self._by_name.setdefault(product_name, []).append(index)
+        return [self[index] for index in self._by_name.get(name, ())]
+
+    def price_range(self, low_cents: int, high_cents: int) -> list[Product]:
+        """
+        Products priced between ``low_cents`` and ``high_cents`` inclusive, cheapest first.
+        """
+        if self._by_price is None:
+            order = array("q", sorted(range(len(self)), key=self.price_cents.__getitem__))
+            self._by_price = (order, array("q", (self.price_cents[index] for index in order)))
+        order, sorted_cents = self._by_price
+        start, end = bisect_left(sorted_cents, low_cents), bisect_right(sorted_cents, high_cents)
+        return [self[order[position]] for position in range(start, end)]
+
+    def stats(self) -> CatalogStats:
+        if not self.price_cents:
+            return CatalogStats(0, 0, 0, 0.0)
+        cents = self.price_cents
+        return CatalogStats(len(cents), min(cents), max(cents), sum(cents) / len(cents))
+
+    def histogram(self, bins: int = 10) -> list[tuple[int, int, int]]:
+        """
+        Split the price range into ``bins`` equal-width buckets.
+
+        :return: ``(low_cents, high_cents, count)`` per bucket.
+        """
+        if not self.price_cents:
+            return []
+        low, high = min(self.price_cents), max(self.price_cents)
+        width = max(1, -(-(high - low + 1) // bins))
+        counts = [0] * bins
+        for cents in self.price_cents:
+            counts[(cents - low) // width] += 1
+        return [
+            (low + i * width, min(high, low + (i + 1) * width - 1), count)
+            for i, count in enumerate(counts)
+            if low + i * width <= high
+        ]
@@ -0,0 +1,167 @@
+from dataclasses import dataclass
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from typing import Optional
+from urllib.parse import urlparse
+
+from settings.configs.browser_config import BrowserConfig
+
+
+def launch_options(config: BrowserConfig) -> dict:
+    options = {
+        "headless": config.headless,
+        "proxy": {"server": config.proxy} if config.proxy else None,
+        "timeout": config.timeout
+    }
+
+    if config.browser_type == "firefox" and config.stealth_mode:
+        options.update({
+            "firefox_user_prefs": {
+                "privacy.resistFingerprinting": True,
+                "privacy.trackingprotection.enabled": True
+            }
+        })
+    return options
+
+
+def is_healthy(endpoint: str, timeout: float = 1.0) -> bool:
+    url = urlparse(endpoint)
+    try:
+        with socket.create_connection((url.hostname, url.port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
+@dataclass
+class BrowserServer:
+    """A launched browser server that outlives the processes connecting to it."""
+    state_file: str = ".browser_server.json"
+    log_file: str = ".browser_server.log"
+    options_file: str = ".browser_server.options.json"
+    host: str = "127.0.0.1"
+    port: int = 0
+    startup_timeout: float = 30.0
+
+    def start(self, config: BrowserConfig) -> str:
+        endpoint = self.endpoint()
+        if endpoint:
+            return endpoint
+
+        options = {
+            _camel_case(key): value for key, value in launch_options(config).items() if value is not None
+        }
+        options.update({"host": self.host, "port": self.port} if self.port else {"host": self.host})
+        with open(self.options_file, "w") as f:
+            json.dump(options, f)
+        with open(self.log_file, "w") as log:
+            process = subprocess.Popen(
+                self.command(config.browser_type),
+                stdout=log,
+                stderr=subprocess.STDOUT,
+                stdin=subprocess.DEVNULL,
+                start_new_session=True,
+            )
+
+        endpoint = self._wait_for_endpoint(process)
+        with open(self.state_file, "w") as f:
+            json.dump({"pid": process.pid, "ws_endpoint": endpoint, "browser_type": config.browser_type}, f)
+        return endpoint
+
+    def command(self, browser_type: str) -> list[str]:
+        """
+        The playwright CLI of this interpreter runs the server on its bundled driver, so the
+        server always speaks the same protocol version as the client connecting to it.
+        """
+        return [
+            sys.executable, "-m", "playwright", "launch-server",
+            "--browser", browser_type, "--config", self.options_file,
+        ]
+
+    def stop(self) -> bool:
+        state = self._read_state()
+        if os.path.exists(self.state_file):
+            os.unlink(self.state_file)
+        if not state:
+            return False
+        try:
+            # The CLI wraps the driver process; both lead the session the server was started in.
+            os.killpg(state["pid"], signal.SIGTERM)
+        except ProcessLookupError:
+            return False
+        return True
+
+    def endpoint(self) -> Optional[str]:
+        state = self._read_state()
+        if not state:
+            return None
+        if not _is_running(state["pid"]):
+            # Left behind by a server that crashed or a host that rebooted.
+            os.unlink(self.state_file)
+            return None
+        return state["ws_endpoint"] if is_healthy(state["ws_endpoint"]) else None
+
+    def pid(self) -> Optional[int]:
+        """
+        :return: The process id of the running server, or None.
+        """
+        state = self._read_state()
+        return state["pid"] if state and _is_running(state["pid"]) else None
+
+    def _wait_for_endpoint(self, process: subprocess.Popen) -> str:
+        deadline = time.monotonic() + self.startup_timeout
+        while time.monotonic() < deadline:
+            with open(self.log_file) as log:
+                for line in log:
+                    if line.startswith("ws://"):
+                        return line.strip()
+            if process.poll() is not None:
+                break
+            time.sleep(0.1)
+        if process.poll() is None:
+            os.killpg(process.pid, signal.SIGKILL)
+        with open(self.log_file) as log:
+            raise RuntimeError(f"Browser server failed to start: {log.read().strip()}")
+
+    def _read_state(self) -> Optional[dict]:
+        try:
+            with open(self.state_file) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+
+def _camel_case(name: str) -> str:
+    head, *tail = name.split("_")
+    return head + "".join(part.title() for part in tail)
+
+
+def _is_running(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+if __name__ == "__main__":
+    from settings.containers import get_container
+    from infrastructure.browser_service import BrowserService
+
+    command = sys.argv[1] if len(sys.argv) > 1 else "status"
+    server = BrowserServer()
+    if command == "start":
+        print(server.start(get_container().resolve(BrowserService).config))
+    elif command == "stop":
+        print("stopped" if server.stop() else "not running")
+    elif command == "status":
+        print(server.endpoint() or "not running")
+    else:
+        sys.exit("Usage: python -m infrastructure.browser_server [start|stop|status]")
@@ -1,28 +1,82 @@
+from __future__ import annotations
+
 import asyncio
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from itertools import zip_longest
 import logging
 import random
-from typing import Any, Optional
-from playwright.async_api import async_playwright, Page, Browser, BrowserContext, ElementHandle
+import time
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Optional
 
 from domain.entities.product import Product
+from domain.entities.product_catalog import ProductCatalog
 from domain.entities.user import User
-from infrastructure.handle_errors import handle_errors
+from infrastructure.browser_server import BrowserServer, is_healthy, launch_options
+from infrastructure.context_pool import BrowserContextPool
+from infrastructure.deadline import CircuitBreaker, effective_timeout
+from infrastructure.handle_errors import exclude_from_latency, handle_errors
+from infrastructure.har import HarArchive
+from infrastructure.pacing import PacingPolicy, pacing_policy
+from infrastructure.page_objects import FILL_FORM_SCRIPT, PageObject, PageObjectError
+from infrastructure.request_router import RequestRouter
+from infrastructure.screenshot_service import ScreenshotService
 from infrastructure.logger import configure_logger
+from infrastructure.metrics import OperationMetrics
+from infrastructure.watchdog import ResourceWatchdog
 from settings.configs.browser_config import BrowserConfig
 
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, BrowserContext, ElementHandle, Locator, Page
+
+
+# Reads every item of the listing in one evaluation. The detail id comes from an
+# ``inventory-item.html?id=`` link when present, otherwise from ``item_<id>_title_link``.
+EXTRACT_PRODUCTS_SCRIPT = """
+(items) => items.map((item) => {
+    const text = (selector) => (item.querySelector(selector)?.innerText || '').replace('$', '').trim();
+    const link = item.querySelector('a[href*="inventory-item.html?id="]');
+    const titleLink = item.querySelector('a[id^="item_"]');
+    const match = (link?.getAttribute('href') || '').match(/[?&]id=(\\d+)/)
+        || (titleLink?.id || '').match(/^item_(\\d+)_/);
+    const image = item.querySelector('img.inventory_item_img, img');
+    return {
+        name: text('[data-test="inventory-item-name"]'),
+        price: text('.inventory_item_price'),
+        id: match ? Number(match[1]) : null,
+        image: image ? image.src : null,
+    };
+})
+"""
+
+EXTRACT_PRODUCT_DETAIL_SCRIPT = """
+() => {
+    const text = (selector) => (document.querySelector(selector)?.innerText || '').trim();
+    const image = document.querySelector('img.inventory_details_img');
+    return {
+        name: text('[data-test="inventory-item-name"]'),
+        price: text('[data-test="inventory-item-price"]').replace('$', ''),
+        description: text('[data-test="inventory-item-desc"]'),
+        image: image ? image.src : null,
+    };
+}
+"""
+
 
 @dataclass
 class BrowserServiceState:
     current_url: str = ""
     page_count: int = 0
     error_count: int = 0
+    metrics: OperationMetrics = field(default_factory=OperationMetrics)
+    breaker: CircuitBreaker = field(default_factory=CircuitBreaker)
+    watchdog: ResourceWatchdog = field(default_factory=ResourceWatchdog)
     
     def reset(self):
         self.current_url = ""
         self.page_count = 0
         self.error_count = 0
+        self.metrics = OperationMetrics()
 
 
 @dataclass
@@ -34,6 +88,33 @@ class BrowserService:
     _browser: Optional[Browser] = field(default=None, init=False, repr=False)
     _context: Optional[BrowserContext] = field(default=None, init=False, repr=False)
     page: Optional[Page] = field(default=None, init=False, repr=False)
+    _pool: Optional[BrowserContextPool] = field(default=None, init=False, repr=False)
+    _leased: bool = field(default=False, init=False, repr=False)
+    pacing: PacingPolicy = field(init=False, repr=False)
+    router: RequestRouter = field(init=False, repr=False)
+    har: HarArchive = field(init=False, repr=False)
+    screenshots: ScreenshotService = field(init=False, repr=False)
+    _locators: dict[str, Locator] = field(default_factory=dict, init=False, repr=False)
+    _page_objects: dict[type, PageObject] = field(default_factory=dict, init=False, repr=False)
+    _bound_page: Optional[Page] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self):
+        self.state.breaker.threshold = self.config.breaker_threshold
+        self.state.breaker.reset_after = self.config.breaker_reset_after
+        self.state.watchdog.max_operations = self.config.recycle_max_operations
+        self.state.watchdog.max_rss_bytes = self.config.recycle_max_rss_bytes
+        self.state.watchdog.interval = self.config.watchdog_interval
+        self.pacing = pacing_policy(self.config)
+        self.router = RequestRouter(self.config, self.logger)
+        self.har = HarArchive(self.config, self.logger, router=self.router)
+        self.screenshots = ScreenshotService(
+            logger=self.logger,
+            directory=self.config.screenshot_dir,
+            fmt=self.config.screenshot_format,
+            quality=self.config.screenshot_quality,
+            max_files=self.config.screenshot_max_files,
+            max_bytes=self.config.screenshot_max_bytes,
+        )
 
     async def __aenter__(self):
         await self.initialize()
@@ -42,40 +123,138 @@ class BrowserService:
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         if exc_type is not None:
             self.state.error_count += 1
-            await self.take_screenshot(f"automation_screenshots/error_{self.state.error_count}.png")
+            await self.take_screenshot(f"error_{self.state.error_count}.png")
         # await self.close()
 
     async def initialize(self) -> None:
         if not self.page or self.page.is_closed():
+            from playwright.async_api import async_playwright
+
             self._playwright = await async_playwright().start()
-            
-            launch_options = {
-                "headless": self.config.headless,
-                "proxy": {"server": self.config.proxy} if self.config.proxy else None,
-                "timeout": self.config.timeout
-            }
-            
-            if self.config.browser_type == "firefox" and self.config.stealth_mode:
-                launch_options.update({
-                    "firefox_user_prefs": {
-                        "privacy.resistFingerprinting": True,
-                        "privacy.trackingprotection.enabled": True
-                    }
-                })
-            
-            self._browser = await getattr(self._playwright, self.config.browser_type).launch(**launch_options)
-            self._context = await self._browser.new_context(
-                user_agent=self.config.user_agent,
-                extra_http_headers=self.config.custom_headers,
+            self._browser = await self._launch_browser()
+            self._context, self.page = await self._new_page()
+            self._pool = BrowserContextPool(
+                self._new_page, size=self.config.pool_size, should_retire=self._should_retire
             )
-            self.page = await self._context.new_page()
-            await self._apply_stealth()
             self.state.page_count += 1
 
+    async def _launch_browser(self) -> Browser:
+        browser_type = getattr(self._playwright, self.config.browser_type)
+        if self.config.browser_server:
+            # Reads the state file and probes the socket, so it stays off the event loop.
+            endpoint, pid = await asyncio.to_thread(self._find_browser_server)
+            if endpoint:
+                try:
+                    browser = await browser_type.connect(endpoint, timeout=self.config.timeout)
+                    self.logger.info("Connected to browser server at %s", endpoint)
+                    # The browser runs under the server process rather than ours.
+                    self.state.watchdog.root_pid = pid or self.state.watchdog.root_pid
+                    return browser
+                except Exception as e:
+                    self.logger.warning("Failed to connect to browser server at %s: %s", endpoint, e)
+            else:
+                self.logger.info("Browser server is not running, launching a local browser")
 
-    async def _apply_stealth(self):
+        return await browser_type.launch(**launch_options(self.config))
+
+    def _find_browser_server(self) -> tuple[Optional[str], Optional[int]]:
+        """
+        :return: The endpoint of a healthy browser server, or None, and the pid of the one this host started.
+        """
+        server = BrowserServer()
+        endpoint = self.config.browser_server_endpoint or server.endpoint()
+        if not endpoint or not is_healthy(endpoint):
+            return None, None
+        return endpoint, server.pid()
+
+    async def _new_page(self) -> tuple[BrowserContext, Page]:
+        context = await self._browser.new_context(
+            user_agent=self.config.user_agent,
+            extra_http_headers=self.config.custom_headers,
+            **self.har.context_options(),
+        )
+        if self.har.replaying:
+            await self.har.attach(context)
+        else:
+            await self.router.attach(context)
+        page = await context.new_page()
+        await self._apply_stealth(page)
+        return context, page
+
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator["BrowserService"]:
+        """
+        Lease an isolated context/page pair from the pool.
+
+        At most ``config.pool_size`` leases are active at once; further callers wait.
+
+        :return: A browser service bound to the leased page.
+        :raises RuntimeError: On a leased or uninitialized service, which has no pool.
+        """
+        if self._pool is None:
+            raise RuntimeError("No context pool to lease from: lease from the initialized main browser service")
+        async with self._pool.lease() as (context, page):
+            service = BrowserService(
+                config=self.config,
+                logger=self.logger,
+                state=BrowserServiceState(metrics=self.state.metrics, breaker=self.state.breaker),
+            )
+            service._context, service.page, service._leased = context, page, True
+            service.screenshots = self.screenshots
+            service.state.watchdog = self.state.watchdog
+            yield service
+
+    def _should_retire(self, slot: tuple[BrowserContext, Page]) -> bool:
+        context, page = slot
+        reason = self.state.watchdog.recycle_reason(context)
+        if reason:
+            self.state.watchdog.record_recycle(context, reason, page.url)
+            self.logger.info("Retiring pooled browser context after %s", reason)
+        return bool(reason)
+
+    async def _before_operation(self) -> None:
+        """
+        Count the operation against the current context and, on the primary service,
+        swap the context for a fresh one once the watchdog asks for it.
+
+        The storage state and URL carry over, so callers keep their session and page.
+        """
+        watchdog = self.state.watchdog
+        if not watchdog.enabled or self._context is None:
+            return
+        watchdog.count(self._context)
+        if self._leased:
+            # Leased contexts are retired by the pool when they are released.
+            return
+        reason = watchdog.recycle_reason(self._context)
+        if reason:
+            await self._recycle_context(reason)
+
+    async def _recycle_context(self, reason: str) -> None:
+        old_context, old_page = self._context, self.page
+        url = old_page.url
+        try:
+            state = await old_context.storage_state()
+            self._context, self.page = await self._new_page()
+            await self.restore_session(state, url if url != "about:blank" else None)
+        except Exception as e:
+            self.logger.warning("Failed to recycle the browser context after %s: %s", reason, e)
+            if self._context is not old_context:
+                await self._context.close()
+                self._context, self.page = old_context, old_page
+            # Start counting afresh rather than retrying on every operation.
+            self.state.watchdog.forget(old_context)
+            return
+        self.state.watchdog.record_recycle(old_context, reason, url)
+        self.logger.info("Recycled the browser context after %s, resumed at %s", reason, url)
+        try:
+            await old_context.close()
+        except Exception as e:
+            self.logger.warning("Failed to close the recycled browser context: %s", e)
+
+    async def _apply_stealth(self, page: Page):
         if self.config.stealth_mode:
-            await self.page.add_init_script("""
+            await page.add_init_script("""
                 () => {
                     delete navigator.__proto__.webdriver;
                     Object.defineProperty(navigator, 'webdriver', {
@@ -99,7 +278,7 @@ class BrowserService:
                 }
             """)
             if self.config.browser_type == "firefox":
-                await self.page.add_init_script(
+                await page.add_init_script(
                     """
                     WebGLRenderingContext.prototype.getParameter = function(parameter) {
                         if (parameter === 37445) return 'Intel Inc.'; // UNMASKED_VENDOR_WEBGL
@@ -109,25 +288,151 @@ class BrowserService:
                     """
                 )
 
+    def operation_timeout(self) -> float:
+        """
+        Timeout of the next operation: ``config.timeout`` capped by the remaining deadline budget.
+
+        :return: The timeout in milliseconds.
+        """
+        return effective_timeout(self.config.timeout)
+
+    def locator(self, selector: str) -> Locator:
+        """
+        Cached locator of the first match of ``selector`` on the current page.
+
+        :return: The locator, created once per page.
+        """
+        self._bind_page()
+        locator = self._locators.get(selector)
+        if locator is None:
+            locator = self._locators[selector] = self.page.locator(selector).first
+        return locator
+
+    def page_object(self, page_object: type[PageObject]) -> PageObject:
+        """
+        Page object bound to this service, with locators for its selectors created once per page.
+
+        :return: The cached page object.
+        """
+        self._bind_page()
+        instance = self._page_objects.get(page_object)
+        if instance is None:
+            for selector in page_object.selectors().values():
+                self.locator(selector)
+            instance = self._page_objects[page_object] = page_object(self)
+        return instance
+
+    def _bind_page(self) -> None:
+        if self._bound_page is not self.page:
+            self._locators.clear()
+            self._page_objects.clear()
+            self._bound_page = self.page
+
+    async def _pace(self, selector: str, pause: Awaitable[None]) -> None:
+        """
+        Run a pacing pause as its own "pacing" operation, left out of the latency of the operation around it.
+
+        Only the artificial pauses go through here; waiting for the outcome of a click is part of its latency.
+        """
+        started = time.perf_counter()
+        try:
+            await pause
+        finally:
+            elapsed = time.perf_counter() - started
+            exclude_from_latency(elapsed)
+            self.state.metrics.observe("pacing", selector, elapsed)
+
     @handle_errors(log_message="Navigation failed")
     async def go_to(self, url: str) -> None:
-        await self.page.goto(url)
+        await self.page.goto(url, timeout=self.operation_timeout())
         self.state.current_url = url
         
 
     @handle_errors(log_message="Failed to fill input")
     async def fill(self, selector: str, value: str) -> None:
-        await self.page.fill(selector, value)
-        await self.page.wait_for_timeout(random.randint(100, 500))
+        await self.locator(selector).fill(value, timeout=self.operation_timeout())
+        await self._pace(selector, self.pacing.after_fill(self.page, selector))
         
     @handle_errors(log_message="Failed to click element")
-    async def click(self, selector: str) -> None:
-        await self.page.click(selector)
-        await self.page.wait_for_timeout(random.randint(200, 800))    
+    async def click(self, selector: str, wait_for: str | None = None) -> None:
+        await self.locator(selector).click(timeout=self.operation_timeout())
+        await self._pace(selector, self.pacing.after_click(self.page, selector))
+        await self.pacing.settle(self.page, wait_for)
+
+    @handle_errors(log_message="Failed to fill form")
+    async def fill_form(self, fields: dict[str, str], submit: str | None = None, wait_for: str | None = None) -> None:
+        """
+        Fill several fields and click ``submit``.
+
+        Each field goes through ``Locator.fill``, which waits until it is visible and
+        enabled. With ``config.form_fill = "script"`` the whole form is filled in a single
+        in-page evaluation instead, without those checks. Pacing runs once for the whole
+        form, then once more after the submit click before waiting for ``wait_for``.
+        """
+        if self.config.form_fill == "script":
+            missing = await self.page.evaluate(FILL_FORM_SCRIPT, [list(fields.items()), submit])
+            if missing:
+                raise PageObjectError(f"Form elements not found: {missing}")
+        else:
+            for selector, value in fields.items():
+                await self.locator(selector).fill(value, timeout=self.operation_timeout())
+            if submit:
+                await self.locator(submit).click(timeout=self.operation_timeout())
+        if fields:
+            last = next(reversed(fields))
+            await self._pace(last, self.pacing.after_fill(self.page, last))
+        if submit:
+            await self._pace(submit, self.pacing.after_click(self.page, submit))
+            await self.pacing.settle(self.page, wait_for)
+
+    @handle_errors(log_message="Failed waiting for selectors")
+    async def wait_for_any(self, *selectors: str) -> str:
+        """
+        Wait for the first visible match of any selector.
+
+        :return: The selector that matched.
+        """
+        element = await self.page.wait_for_selector(
+            ", ".join(selectors), state="visible", timeout=self.operation_timeout()
+        )
+        return await element.evaluate("(el, selectors) => selectors.find((s) => el.matches(s))", list(selectors))
+
+    @handle_errors(log_message="Failed waiting for outcome")
+    async def wait_for_outcome(self, url_part: str, selector: str) -> None:
+        """
+        Wait until the URL contains ``url_part`` or ``selector`` shows text, whichever comes first.
+        """
+        await self.page.wait_for_function(
+            "([urlPart, selector]) => location.href.includes(urlPart)"
+            " || !!document.querySelector(selector)?.innerText?.trim()",
+            arg=[url_part, selector],
+            timeout=self.operation_timeout(),
+        )
+
+    async def paginate(
+        self, selector: str = '[data-test="pagination-next"]', batch_size: int = 500
+    ) -> AsyncIterator[list[Product]]:
+        """
+        Stream the inventory as product batches, page by page.
+
+        Every page is read in a single in-page evaluation and validated in batches of
+        at most ``batch_size`` items; then the ``selector`` link is followed until it disappears.
+
+        :return: Async iterator of product batches.
+        """
+        while True:
+            records = await self._extract_product_records()
+            for start in range(0, len(records), batch_size):
+                yield self._to_products(records[start:start + batch_size])
 
-    async def paginate(self, selector: str) -> None:
-        #TODO implement pagination logic
-        ...
+            url = self.page.url
+            if not await self.page.query_selector(selector):
+                break
+            await self.click(selector)
+            await self.page.wait_for_load_state(timeout=self.operation_timeout())
+            if self.page.url == url:
+                break
+            self.state.current_url = self.page.url
     
     @handle_errors(log_message="Failed to get element text")
     async def get_element_text(self, page: Page, selector: str) -> str:
@@ -151,7 +456,7 @@ class BrowserService:
         ]
 
         if not usernames or not password:
-            self.logger.error(f'Username or password elements not found on the page: {self.page.url}')
+            self.logger.error('Username or password elements not found on the page: %s', self.page.url)
             return None
 
         users = [
@@ -160,7 +465,7 @@ class BrowserService:
         ]
         # users.sort(key=lambda x: x.username)
         random.shuffle(users)
-        self.logger.info(f"Found {len(users)} users on the page: {self.page.url}")
+        self.logger.info("Found %s users on the page: %s", len(users), self.page.url)
         return users
 
     async def extract_elements(self, elements: list[ElementHandle]) -> list[str]:
@@ -168,41 +473,98 @@ class BrowserService:
         return [text.split('\n') for text in texts][0]
 
     async def extract_products(self) -> list[Product]:
-        items = await self.page.query_selector_all('div.inventory_item')
-        # https://www.saucedemo.com/inventory-item.html?id=4
-        self.logger.info(f"Found {len(items)} items on the page: {self.page.url}")
-        return [
-            Product(
-                await self.get_element_text(item, '[data-test="inventory-item-name"]'),
-                await self.get_element_text(item, '.inventory_item_price'),
+        records = await self._extract_product_records()
+        self.logger.info("Found %s items on the page: %s", len(records), self.page.url)
+        return self._to_products(records)
+
+    async def extract_catalog(self) -> ProductCatalog:
+        """
+        Read the listing of the current page into catalog columns, without per-item objects.
+
+        :return: The bulk-validated catalog of the page.
+        """
+        return ProductCatalog.from_records(await self._extract_product_records())
+
+    @handle_errors(log_message="Failed to extract products")
+    async def _extract_product_records(self) -> list[dict]:
+        return await self.page.eval_on_selector_all('div.inventory_item', EXTRACT_PRODUCTS_SCRIPT)
+
+    @handle_errors(log_message="Failed to extract product detail")
+    async def extract_product_detail(self, url: str) -> dict:
+        """
+        Open an ``inventory-item.html?id=`` page and read its name, price, description and image.
+
+        :return: The detail record of the item.
+        """
+        await self.go_to(url)
+        await self.page.wait_for_selector('[data-test="inventory-item-desc"]', timeout=self.operation_timeout())
+        return await self.page.evaluate(EXTRACT_PRODUCT_DETAIL_SCRIPT)
+
+    def _to_products(self, records: list[dict]) -> list[Product]:
+        """
+        Bulk-validate extracted records as a ``ProductCatalog``; invalid rows are logged and left out.
+        """
+        catalog = ProductCatalog.from_records(records, skip_invalid=True)
+        if len(catalog) < len(records):
+            self.logger.warning(
+                "Skipped %s invalid product rows on the page: %s", len(records) - len(catalog), self.page.url
             )
-            for item in items
-        ]
+        return list(catalog)
 
     async def get_validation_errors(self) -> list[str]:
         elements = await self.page.query_selector_all(".error-message-container")
         return [await element.inner_text() for element in elements]
 
-    async def take_screenshot(self, path: str) -> None:
-        await self.page.screenshot(path=path)
+    async def take_screenshot(self, path: str, full_page: bool = False, selector: str | None = None) -> str:
+        """
+        :return: Where the screenshot is written; a bare file name goes to ``config.screenshot_dir``.
+        """
+        return await self.screenshots.capture(self.page, path, full_page=full_page, selector=selector)
 
     async def _capture_error_evidence(self):
         try:
             await self.take_screenshot(
-                f"automation_screenshots/error_{self.state.error_count}.png"
-            )
-            await self.page.screenshot(
-                path=f"automation_screenshots/fullpage_{self.state.error_count}.png",
-                full_page=True
+                f"error_{self.state.error_count}.png",
+                full_page=self.config.full_page_evidence,
             )
         except Exception as capture_error:
-            self.logger.error(f"Failed to capture evidence: {str(capture_error)}")
+            self.logger.error("Failed to capture evidence: %s", capture_error)
+
+    async def storage_state(self) -> dict:
+        return await self._context.storage_state()
+
+    @handle_errors(log_message="Failed to restore session")
+    async def restore_session(self, state: dict, url: str | None = None) -> None:
+        """
+        Load the cookies of a saved storage state, open ``url`` and restore its localStorage.
+
+        Without ``url`` only the cookies are loaded, ahead of the next navigation.
+        """
+        if state.get("cookies"):
+            await self._context.add_cookies(state["cookies"])
+        if url is None:
+            return
+        await self.go_to(url)
+        for origin in state.get("origins", []):
+            if self.page.url.startswith(origin["origin"]) and origin.get("localStorage"):
+                await self.page.evaluate(
+                    "(items) => items.forEach(({name, value}) => localStorage.setItem(name, value))",
+                    origin["localStorage"],
+                )
 
     @property
     def current_url(self) -> str:
         return self.page.url
 
     async def close(self) -> None:
+        if self._leased or self._playwright is None:
+            return
+        await self.screenshots.close()
+        if self.router.enabled:
+            self.logger.info("Request routing stats: %s", self.router.stats)
+        await self._pool.close()
         await self._context.close()
+        self.har.finish()
         await self._browser.close()
         await self._playwright.stop()
+        self._playwright = None
@@ -0,0 +1,174 @@
+from dataclasses import asdict, dataclass, field
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+from typing import AsyncIterable, AsyncIterator
+
+from domain.entities.product import Product
+from domain.entities.product_catalog import FIELDS, ProductCatalog
+from infrastructure.product_exporter import FORMATS
+
+
+def row_key(row: tuple) -> str:
+    """Inventory item id, falling back to the name for items rendered without one."""
+    name, _, item_id = row[:3]
+    return str(item_id) if item_id is not None else f"name:{name}"
+
+
+def row_hash(row: tuple) -> str:
+    return hashlib.sha1(json.dumps(row).encode("utf-8")).hexdigest()
+
+
+def diff_filename(filename: str) -> str:
+    """``products.csv`` -> ``products.diff.json``, next to the export."""
+    name = str(filename)
+    for fmt in sorted(FORMATS, key=len, reverse=True):
+        if name.lower().endswith(f".{fmt}"):
+            name = name[: -len(fmt) - 1]
+            break
+    return f"{name}.diff.json"
+
+
+@dataclass
+class CatalogDiff:
+    added: list[Product] = field(default_factory=list)
+    removed: list[Product] = field(default_factory=list)
+    repriced: list[tuple[Product, Product]] = field(default_factory=list)
+    changed: list[Product] = field(default_factory=list)
+
+    @property
+    def unchanged(self) -> bool:
+        return not (self.added or self.removed or self.repriced or self.changed)
+
+    def summary(self) -> dict[str, int]:
+        return {
+            "added": len(self.added),
+            "removed": len(self.removed),
+            "repriced": len(self.repriced),
+            "changed": len(self.changed),
+        }
+
+    def to_dict(self) -> dict:
+        return {
+            "added": [asdict(product) for product in self.added],
+            "removed": [asdict(product) for product in self.removed],
+            "repriced": [
+                {**asdict(current), "previous_price": previous.price} for previous, current in self.repriced
+            ],
+            "changed": [asdict(product) for product in self.changed],
+        }
+
+
+@dataclass
+class CatalogSnapshot:
+    """
+    Products of the current run, compared against the snapshot of the previous one.
+
+    Both runs are held as ``ProductCatalog`` columns; rows are matched by key and
+    compared by a hash of their normalized values, so full ``Product`` objects are
+    only created for the items that differ.
+    """
+    previous: ProductCatalog
+    current: ProductCatalog = field(default_factory=ProductCatalog)
+    diff: CatalogDiff = field(default_factory=CatalogDiff)
+    _previous_rows: dict[str, tuple[str, int]] = field(default_factory=dict, init=False, repr=False)
+    _current_keys: set[str] = field(default_factory=set, init=False, repr=False)
+
+    def __post_init__(self):
+        for index in range(len(self.previous)):
+            row = self.previous.row(index)
+            self._previous_rows[row_key(row)] = (row_hash(row), index)
+
+    async def track(self, products: AsyncIterable[Product]) -> AsyncIterator[Product]:
+        async for product in products:
+            self.observe(product)
+            yield product
+
+    def observe(self, product: Product) -> None:
+        # Invalid products are not exported either; the exporter reports them.
+        if self.current.extend([product], skip_invalid=True):
+            return
+        index = len(self.current) - 1
+        row = self.current.row(index)
+        key = row_key(row)
+        self._current_keys.add(key)
+        previous = self._previous_rows.get(key)
+        if previous is None:
+            self.diff.added.append(self.current[index])
+        elif previous[0] != row_hash(row):
+            before = self.previous[previous[1]]
+            if self.previous.price_cents[previous[1]] != self.current.price_cents[index]:
+                self.diff.repriced.append((before, self.current[index]))
+            else:
+                self.diff.changed.append(self.current[index])
+
+    def finish(self) -> CatalogDiff:
+        """
+        Record the products that disappeared since the previous snapshot.
+
+        :return: The complete diff against the previous snapshot.
+        """
+        self.diff.removed = [
+            self.previous[index] for key, (_, index) in self._previous_rows.items() if key not in self._current_keys
+        ]
+        return self.diff
+
+
+@dataclass
+class CatalogSnapshotStore:
+    """File-backed snapshots of extracted catalogs, one per export file."""
+    directory: str = ".catalog"
+
+    def begin(self, filename: str) -> CatalogSnapshot:
+        return CatalogSnapshot(previous=self.load(filename))
+
+    def load(self, filename: str) -> ProductCatalog:
+        catalog = ProductCatalog()
+        try:
+            with open(self._path(filename), encoding="utf-8") as f:
+                payload = json.load(f)
+        except (OSError, ValueError):
+            return catalog
+        rows = payload.get("rows", [])
+        if rows:
+            catalog.add_columns(*(list(column) for column in zip(*rows)), skip_invalid=True)
+        return catalog
+
+    def commit(self, filename: str, snapshot: CatalogSnapshot) -> CatalogDiff:
+        """
+        Save the snapshot of this run if anything changed, and write the diff next to ``filename``.
+
+        The diff is written on every run, empty when nothing changed, so it never shows
+        the changes of an earlier run.
+
+        :return: The diff against the previous snapshot.
+        """
+        diff = snapshot.finish()
+        if not diff.unchanged:
+            self._write_json(
+                self._path(filename),
+                {"saved_at": time.time(), "fields": FIELDS, "rows": list(snapshot.current.rows())},
+            )
+        self._write_json(diff_filename(filename), {"saved_at": time.time(), **diff.to_dict()})
+        return diff
+
+    def clear(self, filename: str) -> None:
+        try:
+            os.unlink(self._path(filename))
+        except FileNotFoundError:
+            pass
+
+    def _path(self, filename: str) -> str:
+        return os.path.join(self.directory, re.sub(r"[^\w.-]", "_", os.path.abspath(filename)) + ".json")
+
+    @staticmethod
+    def _write_json(path: str, payload: dict) -> None:
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(payload, f)
+        os.replace(tmp_path, path)
@@ -0,0 +1,78 @@
+import asyncio
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, AsyncIterator, Awaitable, Callable, Optional
+
+if TYPE_CHECKING:
+    from playwright.async_api import BrowserContext, Page
+
+
+Slot = tuple["BrowserContext", "Page"]
+
+
+@dataclass
+class BrowserContextPool:
+    """Leases isolated context/page pairs created on a single launched browser."""
+    factory: Callable[[], Awaitable[Slot]]
+    size: int = 4
+    # Released slots for which this returns True are closed instead of reused.
+    should_retire: Optional[Callable[[Slot], bool]] = None
+    _idle: list[Slot] = field(default_factory=list, init=False, repr=False)
+    _slots: list[Slot] = field(default_factory=list, init=False, repr=False)
+    _semaphore: asyncio.Semaphore = field(init=False, repr=False)
+
+    def __post_init__(self):
+        if self.size < 1:
+            raise ValueError("Pool size must be at least 1")
+        self._semaphore = asyncio.Semaphore(self.size)
+
+    async def acquire(self) -> Slot:
+        await self._semaphore.acquire()
+        try:
+            if self._idle:
+                return self._idle.pop()
+            slot = await self.factory()
+            self._slots.append(slot)
+            return slot
+        except BaseException:
+            self._semaphore.release()
+            raise
+
+    async def release(self, slot: Slot) -> None:
+        context, page = slot
+        try:
+            if page.is_closed():
+                raise RuntimeError("Leased page was closed")
+            if self.should_retire and self.should_retire(slot):
+                await self._discard(slot)
+                return
+            # Wipe per-origin storage before leaving the origin, then the cookie jar.
+            await page.evaluate("() => { try { localStorage.clear(); sessionStorage.clear(); } catch (e) {} }")
+            await page.goto("about:blank")
+            await context.clear_cookies()
+            self._idle.append(slot)
+        except Exception:
+            await self._discard(slot)
+        finally:
+            self._semaphore.release()
+
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator[Slot]:
+        slot = await self.acquire()
+        try:
+            yield slot
+        finally:
+            await self.release(slot)
+
+    async def close(self) -> None:
+        for slot in list(self._slots):
+            await self._discard(slot)
+        self._idle.clear()
+
+    async def _discard(self, slot: Slot) -> None:
+        if slot in self._slots:
+            self._slots.remove(slot)
+        try:
+            await slot[0].close()
+        except Exception:
+            pass
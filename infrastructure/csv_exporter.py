@@ -25,7 +25,7 @@ class ProductCSVExporter:
                         product.price,
                     ])
 
-            self.logger.info(f"Exported {len(products)} products to {filename}.")
+            self.logger.info("Exported %s products to %s.", len(products), filename)
         except Exception as e:
-            self.logger.error(f"Failed to export products to CSV: {str(e)}")
+            self.logger.error("Failed to export products to CSV: %s", e)
 
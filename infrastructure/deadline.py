@@ -0,0 +1,107 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+import time
+from typing import Iterator, Optional
+
+
+# Monotonic time by which the current use case run must finish; inherited by child tasks.
+_deadline: ContextVar[Optional[float]] = ContextVar("deadline", default=None)
+
+
+class DeadlineExceeded(TimeoutError):
+    pass
+
+
+class CircuitOpenError(Exception):
+    pass
+
+
+@contextmanager
+def deadline(seconds: Optional[float]) -> Iterator[None]:
+    """
+    Give the enclosed code at most ``seconds``; nested budgets never extend an outer one.
+    """
+    if seconds is None:
+        yield
+        return
+    current = _deadline.get()
+    token = _deadline.set(min(current, time.monotonic() + seconds) if current else time.monotonic() + seconds)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """
+    :return: Seconds left in the current budget, or None without one.
+    """
+    current = _deadline.get()
+    return None if current is None else current - time.monotonic()
+
+
+def effective_timeout(limit_ms: float) -> float:
+    """
+    The lesser of an operation's own limit and the remaining budget, in milliseconds.
+
+    :raises DeadlineExceeded: When the budget is already spent.
+    """
+    left = remaining()
+    if left is None:
+        return limit_ms
+    if left <= 0:
+        raise DeadlineExceeded("Deadline budget exhausted")
+    return min(limit_ms, left * 1000)
+
+
+@dataclass
+class _Circuit:
+    failures: int = 0
+    opened_at: Optional[float] = None
+    # When the trial call of a half-open circuit was let through.
+    probing_since: Optional[float] = None
+
+
+@dataclass
+class CircuitBreaker:
+    """
+    Fails fast on a target after ``threshold`` consecutive failures.
+
+    Once open, calls are rejected for ``reset_after`` seconds; the next call after that
+    is let through as a trial that closes the circuit on success or reopens it. Other
+    calls keep failing fast while the trial is in flight, unless it has not reported
+    back within another ``reset_after``.
+    """
+    threshold: int = 5
+    reset_after: float = 30.0
+    _circuits: dict[str, _Circuit] = field(default_factory=dict, init=False, repr=False)
+
+    def check(self, target: str) -> None:
+        circuit = self._circuits.get(target)
+        if circuit is None or circuit.opened_at is None:
+            return
+        now = time.monotonic()
+        waited = now - circuit.opened_at
+        if waited < self.reset_after:
+            raise CircuitOpenError(
+                f"Circuit for {target or 'the page'} is open after {circuit.failures} failures, "
+                f"retrying in {self.reset_after - waited:.1f}s"
+            )
+        if circuit.probing_since is not None and now - circuit.probing_since < self.reset_after:
+            raise CircuitOpenError(f"Circuit for {target or 'the page'} is half-open, a trial call is in flight")
+        circuit.probing_since = now
+
+    def record(self, target: str, ok: bool) -> None:
+        circuit = self._circuits.setdefault(target, _Circuit())
+        circuit.probing_since = None
+        if ok:
+            circuit.failures, circuit.opened_at = 0, None
+            return
+        circuit.failures += 1
+        if circuit.failures >= self.threshold:
+            circuit.opened_at = time.monotonic()
+
+    def is_open(self, target: str) -> bool:
+        circuit = self._circuits.get(target)
+        return bool(circuit and circuit.opened_at is not None)
@@ -0,0 +1,100 @@
+import asyncio
+from dataclasses import dataclass, field, replace
+import logging
+
+from domain.entities.product import Product
+from infrastructure.browser_service import BrowserService
+
+
+@dataclass
+class CrawlStats:
+    crawled: int = 0
+    retried: int = 0
+    failed: int = 0
+    skipped: int = 0
+
+
+@dataclass
+class ProductDetailCrawler:
+    """
+    Enriches listing products with their ``inventory-item.html?id=`` detail pages.
+
+    Up to ``concurrency`` workers each lease a page from the browser service pool,
+    seed it with the session cookies of the primary page and pull items off a shared
+    queue. Every item gets ``timeout`` seconds per attempt and ``retries`` extra
+    attempts; items that still fail, or that no worker could take because leasing or
+    seeding a page failed, are passed through with their listing data.
+    """
+    browser_service: BrowserService
+    logger: logging.Logger
+    base_url: str
+    concurrency: int = 4
+    timeout: float = 15.0
+    retries: int = 2
+    backoff: float = 0.5
+    stats: CrawlStats = field(default_factory=CrawlStats)
+
+    def detail_url(self, product: Product) -> str:
+        return f"{self.base_url.rstrip('/')}/inventory-item.html?id={product.id}"
+
+    async def enrich(self, products: list[Product]) -> list[Product]:
+        """
+        Crawl the detail page of every product that has an id.
+
+        :return: The products in their original order, enriched where the crawl succeeded.
+        """
+        enriched = list(products)
+        queue: asyncio.Queue[int] = asyncio.Queue()
+        for index, product in enumerate(products):
+            if product.id is None:
+                self.stats.skipped += 1
+            else:
+                queue.put_nowait(index)
+        if queue.empty():
+            return enriched
+
+        session = await self.browser_service.storage_state()
+        queued = queue.qsize()
+        workers = min(self.concurrency, queued)
+        await asyncio.gather(*(self._worker(queue, session, enriched) for _ in range(workers)))
+        if not queue.empty():
+            # Every worker failed to get a page; the rest keep their listing data.
+            self.stats.failed += queue.qsize()
+            self.logger.warning("No crawl worker left for %s product details", queue.qsize())
+        self.logger.info("Crawled %s product details with %s workers: %s", queued, workers, self.stats)
+        return enriched
+
+    async def _worker(self, queue: asyncio.Queue[int], session: dict, enriched: list[Product]) -> None:
+        try:
+            async with self.browser_service.lease() as browser:
+                await browser.restore_session(session)
+                while not queue.empty():
+                    index = queue.get_nowait()
+                    enriched[index] = await self._crawl(browser, enriched[index])
+        except Exception as e:
+            # Items this worker did not take stay queued for the other workers.
+            self.logger.warning("Product detail worker stopped: %s", e)
+
+    async def _crawl(self, browser: BrowserService, product: Product) -> Product:
+        url = self.detail_url(product)
+        for attempt in range(self.retries + 1):
+            try:
+                record = await asyncio.wait_for(browser.extract_product_detail(url), self.timeout)
+            except Exception as e:
+                if attempt == self.retries:
+                    self.stats.failed += 1
+                    self.logger.warning("Giving up on product detail %s after %s attempts: %s", url, attempt + 1, e)
+                    return product
+                self.stats.retried += 1
+                await asyncio.sleep(self.backoff * 2 ** attempt)
+                continue
+
+            self.stats.crawled += 1
+            return replace(
+                product,
+                name=record["name"] or product.name,
+                price=record["price"] or product.price,
+                description=record["description"] or None,
+                image_url=record["image"] or product.image_url,
+            )
+        return product
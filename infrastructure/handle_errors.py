@@ -1,40 +1,125 @@
+import asyncio
+from contextvars import ContextVar
 from dataclasses import dataclass
 from functools import wraps
-from typing import Any, Callable, Coroutine, ParamSpec
-from playwright.async_api import ElementHandle, JSHandle
+import time
+from typing import Any, Callable, Coroutine, Optional, ParamSpec
+from urllib.parse import urlparse
+
+from infrastructure.deadline import CircuitOpenError, DeadlineExceeded, remaining
 
 
 P = ParamSpec('P')
 
+# Set while a decorated operation runs. Operations it calls internally run undecorated, so a
+# failure is recorded, logged and wrapped once, by the outermost operation.
+_in_operation: ContextVar[bool] = ContextVar("in_operation", default=False)
+# Seconds of artificial delay (pacing) spent inside the running operation, left out of its latency.
+_excluded: ContextVar[Optional[list[float]]] = ContextVar("excluded", default=None)
+
+
+def exclude_from_latency(seconds: float) -> None:
+    """Leave ``seconds`` out of the latency observed for the operation that is running."""
+    excluded = _excluded.get()
+    if excluded is not None:
+        excluded[0] += seconds
+
 
 def handle_errors(log_message: str = 'Operation failed') -> Callable:
     def decorator(func: Callable[..., Coroutine[Any, Any, None]]) -> Callable:
         @wraps(func)
         async def wrapper(self, *args: P.args, **kwargs: P.kwargs) -> None:
-            try:
+            if _in_operation.get():
                 return await func(self, *args, **kwargs)
-            except Exception as e:
-                safe_args = [
-                    f"Element<{await arg.get_attribute('data-test')}>" if isinstance(arg, (ElementHandle, JSHandle)) else arg 
-                    for arg in args
-                ]
-                
-                error_details = {
-                    "operation": func.__name__,
-                    "args": safe_args,
-                    "kwargs": kwargs,
-                    "error_type": type(e).__name__,
-                    "error": str(e),
-                }
-                self.logger.error(f"{log_message}: {error_details}")
-                await self._capture_error_evidence()
-                raise BrowserOperationError(error_details) from e
+            token = _in_operation.set(True)
+            try:
+                before_operation = getattr(self, "_before_operation", None)
+                if before_operation is not None:
+                    await before_operation()
+                return await _run(self, func, log_message, args, kwargs)
+            finally:
+                _in_operation.reset(token)
+        wrapper.log_message = log_message
         return wrapper
     return decorator
 
 
+async def _run(service: Any, func: Callable, log_message: str, args: tuple, kwargs: dict) -> Any:
+    started = time.perf_counter()
+    excluded = [0.0]
+    token = _excluded.set(excluded)
+
+    def elapsed() -> float:
+        return time.perf_counter() - started - excluded[0]
+
+    circuit = _circuit(service, args, kwargs)
+    try:
+        # Fail fast on an open circuit or a spent budget, and never outlive the budget.
+        service.state.breaker.check(circuit)
+        result = await _within_budget(func(service, *args, **kwargs))
+    except (CircuitOpenError, DeadlineExceeded) as e:
+        service.state.metrics.observe(func.__name__, _target(args, kwargs), elapsed(), ok=False)
+        service.logger.error("%s: %s", log_message, e)
+        raise
+    except Exception as e:
+        from playwright.async_api import ElementHandle, JSHandle
+
+        service.state.metrics.observe(func.__name__, _target(args, kwargs), elapsed(), ok=False)
+        service.state.breaker.record(circuit, ok=False)
+        safe_args = [
+            f"Element<{await arg.get_attribute('data-test')}>" if isinstance(arg, (ElementHandle, JSHandle)) else arg
+            for arg in args
+        ]
+
+        error_details = {
+            "operation": func.__name__,
+            "args": safe_args,
+            "kwargs": kwargs,
+            "error_type": type(e).__name__,
+            "error": str(e),
+        }
+        service.logger.error("%s: %s", log_message, error_details)
+        await service._capture_error_evidence()
+        raise BrowserOperationError(error_details) from e
+    finally:
+        _excluded.reset(token)
+    service.state.metrics.observe(func.__name__, _target(args, kwargs), elapsed())
+    service.state.breaker.record(circuit, ok=True)
+    return result
+
+
+async def _within_budget(operation: Coroutine) -> Any:
+    left = remaining()
+    if left is not None and left <= 0:
+        operation.close()
+        raise DeadlineExceeded("Deadline budget exhausted")
+    try:
+        async with asyncio.timeout(left):
+            return await operation
+    except DeadlineExceeded:
+        raise
+    except TimeoutError as e:
+        if left is None or remaining() > 0:
+            raise
+        raise DeadlineExceeded(f"Deadline budget exhausted after {left:.1f}s") from e
+
+
+def _target(args: tuple, kwargs: dict) -> str:
+    """The selector or URL an operation acted on: its first string argument."""
+    return next((arg for arg in (*args, *kwargs.values()) if isinstance(arg, str)), "")
+
+
+def _circuit(service: Any, args: tuple, kwargs: dict) -> str:
+    """Host an operation talks to: that of the URL it opens, else that of the current page."""
+    target = _target(args, kwargs)
+    if not target.startswith(("http://", "https://")):
+        page = getattr(service, "page", None)
+        target = getattr(page, "url", "") if page else ""
+    return urlparse(target).netloc
+
+
 @dataclass
 class BrowserOperationError(Exception):
     error_info: dict
     def __str__(self):
-        return f"Browser operation failed with error: {self.error_info}"
\ No newline at end of file
+        return f"Browser operation failed with error: {self.error_info}"
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import json
+import logging
+import os
+import shutil
+from typing import TYPE_CHECKING
+
+from infrastructure.request_router import RequestRouter
+from settings.configs.browser_config import BrowserConfig
+
+if TYPE_CHECKING:
+    from playwright.async_api import BrowserContext, Route
+
+
+HAR_MODES = ("off", "record", "replay")
+
+
+def merge_har(parts: list[str], target: str) -> int:
+    """
+    Combine the per-context archives of a run into a single HAR file.
+
+    :return: The number of entries written.
+    """
+    merged = None
+    for part in parts:
+        try:
+            with open(part, encoding="utf-8") as f:
+                log = json.load(f)["log"]
+        except (OSError, ValueError, KeyError):
+            continue
+        if merged is None:
+            merged = {**log, "pages": [], "entries": []}
+        merged["pages"].extend(log.get("pages", []))
+        merged["entries"].extend(log.get("entries", []))
+    if merged is None:
+        return 0
+    merged["entries"].sort(key=lambda entry: entry.get("startedDateTime", ""))
+    os.makedirs(os.path.dirname(os.path.abspath(target)), exist_ok=True)
+    tmp_path = f"{target}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"log": merged}, f)
+    os.replace(tmp_path, target)
+    return len(merged["entries"])
+
+
+@dataclass
+class HarArchive:
+    """
+    Records the traffic of every browser context into ``config.har_path``, or replays it.
+
+    Recording gives each context its own archive, since Playwright writes one per context
+    on close, and merges them in ``finish``. Replay serves requests from the archive
+    only: anything it does not contain is aborted and reported as missing.
+    """
+    config: BrowserConfig
+    logger: logging.Logger
+    # Requests the router blocks are aborted on replay without being reported missing.
+    router: RequestRouter | None = None
+    missing: list[str] = field(default_factory=list)
+    _parts: list[str] = field(default_factory=list, init=False, repr=False)
+
+    def __post_init__(self):
+        if self.config.har_mode not in HAR_MODES:
+            raise ValueError(f"Unknown HAR mode {self.config.har_mode!r}, expected one of {HAR_MODES}")
+
+    @property
+    def recording(self) -> bool:
+        return self.config.har_mode == "record"
+
+    @property
+    def replaying(self) -> bool:
+        return self.config.har_mode == "replay"
+
+    @property
+    def parts_dir(self) -> str:
+        return f"{self.config.har_path}.parts"
+
+    def context_options(self) -> dict:
+        """
+        :return: Extra ``new_context`` options of the next context.
+        """
+        if not self.recording:
+            return {}
+        if not self._parts:
+            shutil.rmtree(self.parts_dir, ignore_errors=True)
+            os.makedirs(self.parts_dir)
+        part = os.path.join(self.parts_dir, f"context-{len(self._parts)}.har")
+        self._parts.append(part)
+        return {"record_har_path": part, "record_har_content": "embed"}
+
+    async def attach(self, context: BrowserContext) -> None:
+        if not self.replaying:
+            return
+        if not os.path.exists(self.config.har_path):
+            raise FileNotFoundError(f"HAR archive {self.config.har_path} does not exist, record it first")
+        # Routes registered later take precedence: the archive answers first and falls
+        # back to the catch-all for anything it does not contain.
+        await context.route("**/*", self._abort_missing)
+        await context.route_from_har(self.config.har_path, not_found="fallback")
+
+    async def _abort_missing(self, route: Route) -> None:
+        request = route.request
+        if self.router and self.router.blocks(request):
+            await route.abort("blockedbyclient")
+            return
+        missing = f"{request.method} {request.url}"
+        if missing not in self.missing:
+            self.missing.append(missing)
+            self.logger.warning("Request missing from HAR archive: %s", missing)
+        await route.abort("internetdisconnected")
+
+    def finish(self) -> None:
+        """
+        Merge the recorded archives, or report what replay could not serve; call once contexts are closed.
+        """
+        if self.recording and self._parts:
+            entries = merge_har(self._parts, self.config.har_path)
+            shutil.rmtree(self.parts_dir, ignore_errors=True)
+            self._parts.clear()
+            self.logger.info("Recorded %s requests to %s", entries, self.config.har_path)
+        elif self.replaying:
+            if self.missing:
+                self.logger.warning(
+                    "%s requests were missing from %s: %s", len(self.missing), self.config.har_path, self.missing
+                )
+            else:
+                self.logger.info("Replayed every request from %s", self.config.har_path)
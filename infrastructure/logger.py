@@ -1,23 +1,113 @@
+import atexit
+import copy
+import json
 import logging
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler, TimedRotatingFileHandler
+import queue
 import sys
 
 
-def configure_logger(name: str = "automation"):
+STRUCTURED_FIELDS = ("use_case", "step", "user", "duration")
+
+_listeners: dict[str, QueueListener] = {}
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats records as JSON lines, including the structured fields passed via ``extra``."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record),
+            "logger": record.name,
+            "level": record.levelname,
+            "message": record.getMessage(),
+        }
+        for name in STRUCTURED_FIELDS:
+            value = getattr(record, name, None)
+            if value is not None:
+                entry[name] = value
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class _UnformattedQueueHandler(QueueHandler):
+    """
+    Enqueues records with their message merged but not formatted.
+
+    ``QueueHandler.prepare`` runs the formatter in the calling thread; here only the
+    ``%`` arguments are merged, so later changes to them cannot alter the message.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg, record.args = record.getMessage(), None
+        return record
+
+
+def configure_logger(
+    name: str = "automation",
+    filename: str = "automation.log",
+    structured: bool = False,
+    max_bytes: int = 10 * 1024 * 1024,
+    backup_count: int = 5,
+    when: str | None = None,
+):
+    """
+    Route the logger through a queue drained by a listener thread.
+
+    Calling the logger merges the message arguments and enqueues the record; formatting,
+    including timestamps, JSON encoding and tracebacks, and file/console I/O happen on
+    the listener thread. Files rotate by size, or by time when ``when`` is given.
+    Reconfiguring a logger replaces its previous queue and listener.
+
+    :return: The configured logger.
+    """
     logger = logging.getLogger(name)
     logger.setLevel(logging.DEBUG)
-    
-    formatter = logging.Formatter(
+
+    listener = _listeners.pop(name, None)
+    if listener:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+    for handler in list(logger.handlers):
+        if isinstance(handler, QueueHandler):
+            logger.removeHandler(handler)
+
+    formatter = JsonFormatter() if structured else logging.Formatter(
         "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     )
 
     # File handler
-    file_handler = logging.FileHandler("automation.log")
+    if when:
+        file_handler = TimedRotatingFileHandler(filename, when=when, backupCount=backup_count, encoding="utf-8")
+    else:
+        file_handler = RotatingFileHandler(
+            filename, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
+        )
     file_handler.setFormatter(formatter)
-    
+
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
 
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
-    return logger
\ No newline at end of file
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(_UnformattedQueueHandler(log_queue))
+    listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    listener.start()
+    _listeners[name] = listener
+    return logger
+
+
+def shutdown_logging(name: str | None = None) -> None:
+    for key in [name] if name else list(_listeners):
+        listener = _listeners.pop(key, None)
+        if listener is None:
+            continue
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+atexit.register(shutdown_logging)
@@ -0,0 +1,132 @@
+from bisect import bisect_left
+from dataclasses import dataclass, field
+import json
+import os
+import tempfile
+
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+@dataclass
+class LatencyHistogram:
+    buckets: tuple[float, ...] = LATENCY_BUCKETS
+    counts: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+    total: float = 0.0
+    count: int = 0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.total += seconds
+        self.count += 1
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.total += other.total
+        self.count += other.count
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile as the upper bound of the bucket it falls in.
+        """
+        if not self.count:
+            return 0.0
+        rank, seen = q * self.count, 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+
+@dataclass
+class OperationStats:
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    success: int = 0
+    error: int = 0
+
+    def to_dict(self) -> dict:
+        return {
+            "success": self.success,
+            "error": self.error,
+            "count": self.latency.count,
+            "total_seconds": round(self.latency.total, 6),
+            "mean_seconds": round(self.latency.total / self.latency.count, 6) if self.latency.count else 0.0,
+            "p50_seconds": self.latency.quantile(0.5),
+            "p95_seconds": self.latency.quantile(0.95),
+            "buckets": dict(zip([*map(str, self.latency.buckets), "+Inf"], self.latency.counts)),
+        }
+
+
+@dataclass
+class OperationMetrics:
+    """Latency histograms and success/error counts keyed by operation and selector."""
+    stats: dict[tuple[str, str], OperationStats] = field(default_factory=dict)
+
+    def observe(self, operation: str, selector: str, seconds: float, ok: bool = True) -> None:
+        stats = self.stats.get((operation, selector))
+        if stats is None:
+            stats = self.stats[(operation, selector)] = OperationStats()
+        stats.latency.observe(seconds)
+        if ok:
+            stats.success += 1
+        else:
+            stats.error += 1
+
+    def by_operation(self) -> dict[str, OperationStats]:
+        totals: dict[str, OperationStats] = {}
+        for (operation, _), stats in self.stats.items():
+            total = totals.setdefault(operation, OperationStats())
+            total.latency.merge(stats.latency)
+            total.success += stats.success
+            total.error += stats.error
+        return totals
+
+    def to_dict(self) -> dict:
+        return {
+            "operations": {operation: stats.to_dict() for operation, stats in self.by_operation().items()},
+            "selectors": [
+                {"operation": operation, "selector": selector, **stats.to_dict()}
+                for (operation, selector), stats in self.stats.items()
+            ],
+        }
+
+    def to_prometheus(self, prefix: str = "browser_operation") -> str:
+        lines = [
+            f"# HELP {prefix}_duration_seconds Latency of browser operations.",
+            f"# TYPE {prefix}_duration_seconds histogram",
+        ]
+        for (operation, selector), stats in self.stats.items():
+            labels = f'operation="{_escape(operation)}",selector="{_escape(selector)}"'
+            cumulative = 0
+            for bound, count in zip([*map(str, stats.latency.buckets), "+Inf"], stats.latency.counts):
+                cumulative += count
+                lines.append(f'{prefix}_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f"{prefix}_duration_seconds_sum{{{labels}}} {stats.latency.total}")
+            lines.append(f"{prefix}_duration_seconds_count{{{labels}}} {stats.latency.count}")
+
+        lines += [
+            f"# HELP {prefix}_total Browser operations by outcome.",
+            f"# TYPE {prefix}_total counter",
+        ]
+        for (operation, selector), stats in self.stats.items():
+            labels = f'operation="{_escape(operation)}",selector="{_escape(selector)}"'
+            lines.append(f'{prefix}_total{{{labels},outcome="success"}} {stats.success}')
+            lines.append(f'{prefix}_total{{{labels},outcome="error"}} {stats.error}')
+        return "\n".join(lines) + "\n"
+
+    def dump(self, json_path: str = "metrics.json", prometheus_path: str = "metrics.prom") -> None:
+        _write_atomic(json_path, json.dumps(self.to_dict(), indent=2))
+        _write_atomic(prometheus_path, self.to_prometheus())
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _write_atomic(path: str, content: str) -> None:
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(content)
+    os.replace(tmp_path, path)
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+import random
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
+from infrastructure.deadline import effective_timeout
+from settings.configs.browser_config import BrowserConfig
+
+
+@dataclass
+class PacingPolicy(ABC):
+    timeout: int = 30000
+
+    @abstractmethod
+    async def after_fill(self, page: Page, selector: str) -> None:
+        """
+        Pause after a field has been filled.
+        """
+        pass
+
+    @abstractmethod
+    async def after_click(self, page: Page, selector: str) -> None:
+        """
+        Pause after a click.
+        """
+        pass
+
+    async def settle(self, page: Page, wait_for: str | None = None) -> None:
+        """
+        Wait for the outcome of a click: ``wait_for`` is the selector the click is expected to reveal.
+
+        Unlike the pauses, this waits on the page and so counts towards the click's latency.
+        """
+        if wait_for:
+            await page.wait_for_selector(wait_for, state="visible", timeout=effective_timeout(self.timeout))
+
+
+@dataclass
+class HumanPacing(PacingPolicy):
+    fill_delay: tuple[int, int] = (100, 500)
+    click_delay: tuple[int, int] = (200, 800)
+
+    async def after_fill(self, page: Page, selector: str) -> None:
+        await page.wait_for_timeout(random.randint(*self.fill_delay))
+
+    async def after_click(self, page: Page, selector: str) -> None:
+        await page.wait_for_timeout(random.randint(*self.click_delay))
+
+
+@dataclass
+class FastPacing(PacingPolicy):
+    async def after_fill(self, page: Page, selector: str) -> None:
+        pass
+
+    async def after_click(self, page: Page, selector: str) -> None:
+        pass
+
+
+@dataclass
+class AdaptivePacing(PacingPolicy):
+    async def after_fill(self, page: Page, selector: str) -> None:
+        pass
+
+    async def after_click(self, page: Page, selector: str) -> None:
+        pass
+
+    async def settle(self, page: Page, wait_for: str | None = None) -> None:
+        if wait_for:
+            await super().settle(page, wait_for)
+        else:
+            await page.wait_for_load_state("networkidle", timeout=effective_timeout(self.timeout))
+
+
+PACING_POLICIES: dict[str, type[PacingPolicy]] = {
+    "human": HumanPacing,
+    "fast": FastPacing,
+    "adaptive": AdaptivePacing,
+}
+
+
+def pacing_policy(config: BrowserConfig) -> PacingPolicy:
+    try:
+        return PACING_POLICIES[config.pacing](timeout=config.timeout)
+    except KeyError:
+        raise ValueError(f"Unknown pacing mode {config.pacing!r}, expected one of {list(PACING_POLICIES)}") from None
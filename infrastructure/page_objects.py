@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, ClassVar
+
+if TYPE_CHECKING:
+    from infrastructure.browser_service import BrowserService
+
+
+# Fills every field and optionally clicks submit in one evaluation, for ``form_fill="script"``.
+# Values go through the native ``value`` setter followed by input/change events, so
+# React-controlled inputs pick them up as if typed. Nothing is submitted when a field is
+# missing. Unlike ``Locator.fill`` it does not wait for the fields to be visible and enabled.
+FILL_FORM_SCRIPT = """
+([fields, submit]) => {
+    const missing = fields.map(([selector]) => selector).filter((selector) => !document.querySelector(selector));
+    if (submit && !document.querySelector(submit)) missing.push(submit);
+    if (missing.length) return missing;
+    for (const [selector, value] of fields) {
+        const input = document.querySelector(selector);
+        const prototype = input instanceof HTMLTextAreaElement ? HTMLTextAreaElement : HTMLInputElement;
+        input.focus();
+        Object.getOwnPropertyDescriptor(prototype.prototype, 'value').set.call(input, value);
+        input.dispatchEvent(new Event('input', { bubbles: true }));
+        input.dispatchEvent(new Event('change', { bubbles: true }));
+    }
+    if (submit) document.querySelector(submit).click();
+    return [];
+}
+"""
+
+class PageObjectError(ValueError):
+    pass
+
+
+@dataclass
+class PageObject:
+    """
+    Selectors and actions of one saucedemo page, bound to a browser service.
+
+    Selectors are the upper-case class attributes. Obtain instances through
+    ``BrowserService.page_object``, which caches them per page.
+    """
+    browser: BrowserService
+
+    @classmethod
+    def selectors(cls) -> dict[str, str]:
+        return {
+            name: value
+            for klass in reversed(cls.__mro__)
+            for name, value in vars(klass).items()
+            if name.isupper() and isinstance(value, str)
+        }
+
+
+@dataclass
+class LoginPage(PageObject):
+    USERNAME: ClassVar[str] = '#user-name'
+    PASSWORD: ClassVar[str] = '#password'
+    SUBMIT: ClassVar[str] = '[data-test="login-button"]'
+    ERROR: ClassVar[str] = '.error-message-container'
+
+    async def submit_credentials(self, username: str, password: str) -> None:
+        await self.browser.fill_form({self.USERNAME: username, self.PASSWORD: password}, submit=self.SUBMIT)
+
+
+@dataclass
+class InventoryPage(PageObject):
+    CONTAINER: ClassVar[str] = '#inventory_container'
+    CART_LINK: ClassVar[str] = '.shopping_cart_link'
+
+    @staticmethod
+    def add_to_cart_button(slug: str) -> str:
+        return f'[data-test="add-to-cart-{slug}"]'
+
+    @staticmethod
+    def remove_button(slug: str) -> str:
+        return f'[data-test="remove-{slug}"]'
+
+    async def add_to_cart(self, slug: str) -> None:
+        await self.browser.click(self.add_to_cart_button(slug), wait_for=self.remove_button(slug))
+
+    async def open_cart(self) -> None:
+        await self.browser.click(self.CART_LINK, wait_for=CartPage.CHECKOUT)
+
+    async def wait_until_visible(self) -> None:
+        locator = self.browser.locator(self.CONTAINER)
+        await locator.wait_for(state="visible", timeout=self.browser.operation_timeout())
+
+
+@dataclass
+class CartPage(PageObject):
+    CHECKOUT: ClassVar[str] = '[data-test="checkout"]'
+    CONTINUE_SHOPPING: ClassVar[str] = '#continue-shopping'
+
+    async def checkout(self) -> None:
+        await self.browser.click(self.CHECKOUT, wait_for=CheckoutPage.FIRST_NAME)
+
+    async def continue_shopping(self) -> None:
+        await self.browser.click(self.CONTINUE_SHOPPING, wait_for=InventoryPage.CONTAINER)
+
+
+@dataclass
+class CheckoutPage(PageObject):
+    FIRST_NAME: ClassVar[str] = '[data-test="firstName"]'
+    LAST_NAME: ClassVar[str] = '[data-test="lastName"]'
+    POSTAL_CODE: ClassVar[str] = '[data-test="postalCode"]'
+    CONTINUE: ClassVar[str] = '[data-test="continue"]'
+    CANCEL: ClassVar[str] = '[data-test="cancel"]'
+    ERROR: ClassVar[str] = '.error-message-container'
+
+    async def submit_information(
+        self,
+        first_name: str | None = None,
+        last_name: str | None = None,
+        postal_code: str | None = None,
+        wait_for: str | None = None,
+    ) -> None:
+        """
+        Fill the given fields, leave the others untouched and press continue.
+        """
+        fields = {self.FIRST_NAME: first_name, self.LAST_NAME: last_name, self.POSTAL_CODE: postal_code}
+        await self.browser.fill_form(
+            {selector: value for selector, value in fields.items() if value is not None},
+            submit=self.CONTINUE,
+            wait_for=wait_for,
+        )
+
+    async def cancel(self) -> None:
+        await self.browser.click(self.CANCEL, wait_for=CartPage.CONTINUE_SHOPPING)
+
+
+@dataclass
+class CheckoutOverviewPage(PageObject):
+    FINISH: ClassVar[str] = '[data-test="finish"]'
+    CANCEL: ClassVar[str] = '[data-test="cancel"]'
@@ -0,0 +1,158 @@
+import asyncio
+import csv
+from dataclasses import dataclass, field
+import gzip
+import io
+import json
+import logging
+import os
+import tempfile
+from typing import IO, AsyncIterable, Callable, Optional
+
+from domain.entities.product import Product
+from domain.entities.product_catalog import FIELDS, ProductCatalog
+
+
+HEADERS = ["Product Name", "Price", "Id", "Image", "Description"]
+FORMATS = ("csv", "jsonl", "csv.gz", "jsonl.gz")
+
+
+def detect_format(filename: str) -> str:
+    name = str(filename).lower()
+    for fmt in sorted(FORMATS, key=len, reverse=True):
+        if name.endswith(f".{fmt}"):
+            return fmt
+    raise ValueError(f"Cannot detect export format of {filename}, expected one of {FORMATS}")
+
+
+def _encode_csv(catalog: ProductCatalog) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(catalog.rows())
+    return buffer.getvalue().encode("utf-8")
+
+
+def _encode_jsonl(catalog: ProductCatalog) -> bytes:
+    return "".join(json.dumps(dict(zip(FIELDS, row))) + "\n" for row in catalog.rows()).encode("utf-8")
+
+
+@dataclass
+class _ExportSink:
+    """Blocking file side of an export; every method is meant to run in a worker thread."""
+    filename: str
+    fmt: str
+    append: bool = False
+    _raw: Optional[IO[bytes]] = field(default=None, init=False, repr=False)
+    _stream: Optional[IO[bytes]] = field(default=None, init=False, repr=False)
+    _tmp_path: Optional[str] = field(default=None, init=False, repr=False)
+
+    def open(self) -> None:
+        directory = os.path.dirname(os.path.abspath(self.filename))
+        os.makedirs(directory, exist_ok=True)
+        if self.append:
+            is_new = not os.path.exists(self.filename) or os.path.getsize(self.filename) == 0
+            self._raw = open(self.filename, "ab")
+        else:
+            is_new = True
+            fd, self._tmp_path = tempfile.mkstemp(dir=directory, prefix=".export-", suffix=".tmp")
+            self._raw = os.fdopen(fd, "wb")
+        self._stream = gzip.GzipFile(fileobj=self._raw, mode="wb") if self.fmt.endswith(".gz") else self._raw
+        if is_new and self.fmt.startswith("csv"):
+            buffer = io.StringIO()
+            csv.writer(buffer).writerow(HEADERS)
+            self._stream.write(buffer.getvalue().encode("utf-8"))
+
+    def write(self, products: list[Product], first_row: int = 0) -> tuple[int, list[str]]:
+        """
+        Write the valid products of a chunk.
+
+        :return: The number of products written and the errors of the skipped ones.
+        """
+        catalog = ProductCatalog()
+        errors = catalog.extend(products, skip_invalid=True, first_row=first_row)
+        encode = _encode_csv if self.fmt.startswith("csv") else _encode_jsonl
+        self._stream.write(encode(catalog))
+        return len(catalog), errors
+
+    def commit(self) -> None:
+        self._close()
+        if self._tmp_path:
+            os.replace(self._tmp_path, self.filename)
+            self._tmp_path = None
+
+    def abort(self) -> None:
+        self._close()
+        if self._tmp_path and os.path.exists(self._tmp_path):
+            os.unlink(self._tmp_path)
+
+    def _close(self) -> None:
+        if self._stream is not self._raw:
+            self._stream.close()
+        self._raw.flush()
+        os.fsync(self._raw.fileno())
+        self._raw.close()
+
+
+@dataclass
+class ProductStreamExporter:
+    logger: logging.Logger
+    chunk_size: int = 1000
+
+    async def export(
+        self,
+        products: AsyncIterable[Product],
+        filename: str = "products.csv",
+        fmt: str | None = None,
+        append: bool = False,
+        keep: Callable[[], bool] | None = None,
+    ) -> int:
+        """
+        Stream products to ``filename`` without blocking the event loop.
+
+        Chunks of ``chunk_size`` products are validated and encoded as a ``ProductCatalog``
+        and written in a worker thread while the next chunk is collected. Invalid products
+        are left out and reported in a warning rather than failing the export. A full export goes
+        to a temp file that atomically replaces ``filename``; ``append`` writes straight to
+        the end of the existing file.
+        If ``keep`` returns False once every product is written, the temp file is
+        discarded and ``filename`` is left untouched.
+
+        :return: The number of exported products.
+        """
+        sink = _ExportSink(str(filename), fmt or detect_format(filename), append)
+        await asyncio.to_thread(sink.open)
+        seen, count, skipped, chunk, pending = 0, 0, [], [], None
+
+        def written(result: tuple[int, list[str]]) -> int:
+            skipped.extend(result[1])
+            return result[0]
+
+        try:
+            async for product in products:
+                chunk.append(product)
+                if len(chunk) >= self.chunk_size:
+                    if pending:
+                        count += written(await pending)
+                    pending = asyncio.ensure_future(asyncio.to_thread(sink.write, chunk, seen))
+                    seen, chunk = seen + len(chunk), []
+            if pending:
+                count += written(await pending)
+            if chunk:
+                count += written(await asyncio.to_thread(sink.write, chunk, seen))
+            if skipped:
+                self.logger.warning(
+                    "Skipped %s invalid product rows of %s: %s", len(skipped), filename, "; ".join(skipped[:10])
+                )
+            if keep is not None and not append and not keep():
+                await asyncio.to_thread(sink.abort)
+                self.logger.info("Kept the existing %s, discarded the export of %s products.", filename, count)
+                return count
+            await asyncio.to_thread(sink.commit)
+        except BaseException as e:
+            if pending:
+                await asyncio.gather(pending, return_exceptions=True)
+            await asyncio.to_thread(sink.abort)
+            self.logger.error("Failed to export products to %s: %s", filename, e)
+            raise
+
+        self.logger.info("Exported %s products to %s.", count, filename)
+        return count
@@ -0,0 +1,189 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import wraps
+import inspect
+import os
+import time
+from typing import Any, Callable, Iterator
+
+
+# Names of the spans enclosing the running code. Tasks copy it when created, so work
+# started by gather or a task group is attributed to the span that started it.
+_stack: ContextVar[tuple[str, ...]] = ContextVar("profile_stack", default=())
+
+
+@dataclass
+class _Span:
+    calls: int = 0
+    total: float = 0.0
+    children: float = 0.0
+
+    @property
+    def own(self) -> float:
+        # Concurrent children can overlap and add up to more than the wall time of their parent.
+        return max(0.0, self.total - self.children)
+
+
+@dataclass
+class Profiler:
+    """
+    Wall-clock profile of spans, nested per coroutine.
+
+    Nothing is measured until ``instrument`` wraps the methods of interest; the
+    originals are put back by ``restore``, so a run without profiling pays nothing.
+    """
+    spans: dict[tuple[str, ...], _Span] = field(default_factory=dict)
+    _patched: list[tuple[Any, str, Any]] = field(default_factory=list, init=False, repr=False)
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        stack = _stack.get() + (name,)
+        token = _stack.set(stack)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            _stack.reset(token)
+            span = self.spans.setdefault(stack, _Span())
+            span.calls += 1
+            span.total += elapsed
+            if len(stack) > 1:
+                self.spans.setdefault(stack[:-1], _Span()).children += elapsed
+
+    def wrap(self, name: str, func: Callable) -> Callable:
+        """
+        :return: ``func`` timed under the span ``name``; async generators are returned as they are.
+        """
+        if inspect.isasyncgenfunction(func):
+            return func
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def timed_coroutine(*args, **kwargs):
+                with self.span(name):
+                    return await func(*args, **kwargs)
+            return timed_coroutine
+
+        @wraps(func)
+        def timed(*args, **kwargs):
+            with self.span(name):
+                return func(*args, **kwargs)
+        return timed
+
+    def instrument(self, owner: Any, *names: str, prefix: str | None = None) -> None:
+        """
+        Time the named methods of a class or functions of a module.
+
+        Methods decorated with ``handle_errors`` are timed twice: the decorator as a whole
+        under ``handle_errors[<name>]`` and the method body beneath it, so the decorator's
+        own time is its overhead.
+        """
+        from infrastructure.handle_errors import handle_errors
+
+        prefix = prefix or getattr(owner, "__name__", type(owner).__name__)
+        for name in names:
+            original = inspect.getattr_static(owner, name)
+            func = original.__func__ if isinstance(original, (staticmethod, classmethod)) else original
+            log_message = getattr(func, "log_message", None)
+            if log_message is not None:
+                body = self.wrap(f"{prefix}.{name}", func.__wrapped__)
+                timed = self.wrap(f"handle_errors[{name}]", handle_errors(log_message)(body))
+            else:
+                timed = self.wrap(f"{prefix}.{name}", func)
+            if isinstance(original, (staticmethod, classmethod)):
+                timed = type(original)(timed)
+            self._patched.append((owner, name, original))
+            setattr(owner, name, timed)
+
+    def instrument_coroutines(self, cls: type) -> None:
+        """Time every coroutine method ``cls`` defines."""
+        self.instrument(cls, *(
+            name for name, value in vars(cls).items()
+            if not name.startswith("__") and inspect.iscoroutinefunction(value)
+        ))
+
+    def restore(self) -> None:
+        for owner, name, original in reversed(self._patched):
+            setattr(owner, name, original)
+        self._patched.clear()
+
+    def folded(self) -> str:
+        """
+        Own time of every stack in microseconds, in the folded format of flamegraph.pl and speedscope.
+        """
+        lines = [
+            f"{';'.join(stack)} {round(span.own * 1_000_000)}"
+            for stack, span in sorted(self.spans.items())
+            if round(span.own * 1_000_000)
+        ]
+        return "\n".join(lines) + "\n"
+
+    def summary(self, limit: int = 40) -> str:
+        """
+        Spans by total time. A span nested in itself is counted once, at its outermost call;
+        the times of concurrent calls add up and may exceed the wall time.
+        """
+        calls: dict[str, int] = {}
+        total: dict[str, float] = {}
+        own: dict[str, float] = {}
+        for stack, span in self.spans.items():
+            name = stack[-1]
+            calls[name] = calls.get(name, 0) + span.calls
+            own[name] = own.get(name, 0.0) + span.own
+            total[name] = total.get(name, 0.0) + (span.total if name not in stack[:-1] else 0.0)
+        wall = sum(span.total for stack, span in self.spans.items() if len(stack) == 1)
+        overhead = [name for name in calls if name.startswith("handle_errors[")]
+
+        width = max((len(name) for name in calls), default=4)
+        lines = [
+            f"Wall-clock profile: {wall:.3f}s in {len(self.spans)} stacks",
+            f"{'span':<{width}}  {'calls':>7}  {'total s':>9}  {'own s':>9}",
+        ]
+        for name in sorted(total, key=total.get, reverse=True)[:limit]:
+            lines.append(f"{name:<{width}}  {calls[name]:>7}  {total[name]:>9.3f}  {own[name]:>9.3f}")
+        lines.append(
+            f"handle_errors overhead: {sum(own[name] for name in overhead):.3f}s "
+            f"over {sum(calls[name] for name in overhead)} calls"
+        )
+        return "\n".join(lines) + "\n"
+
+    def dump(self, prefix: str = "profile") -> tuple[str, str]:
+        """
+        Write ``<prefix>.folded`` and ``<prefix>.txt``.
+
+        :return: The paths written.
+        """
+        from infrastructure.metrics import _write_atomic
+
+        if os.path.dirname(prefix):
+            os.makedirs(os.path.dirname(prefix), exist_ok=True)
+        paths = f"{prefix}.folded", f"{prefix}.txt"
+        _write_atomic(paths[0], self.folded())
+        _write_atomic(paths[1], self.summary())
+        return paths
+
+
+def instrument_run(profiler: Profiler, scenario: list[type]) -> None:
+    """
+    Time a ``main`` run: browser operations, building the container and resolving from it,
+    exports and use cases.
+    """
+    import punq
+
+    from infrastructure.browser_service import BrowserService
+    from infrastructure.catalog_snapshot import CatalogSnapshotStore
+    from infrastructure.csv_exporter import ProductCSVExporter
+    from infrastructure.detail_crawler import ProductDetailCrawler
+    from infrastructure.product_exporter import ProductStreamExporter
+    from settings import containers
+
+    profiler.instrument_coroutines(BrowserService)
+    profiler.instrument(containers, "_init_container", prefix="settings.containers")
+    profiler.instrument(punq.Container, "resolve", prefix="container")
+    profiler.instrument(ProductStreamExporter, "export")
+    profiler.instrument(ProductCSVExporter, "export")
+    profiler.instrument(CatalogSnapshotStore, "begin", "load", "commit")
+    profiler.instrument(ProductDetailCrawler, "enrich")
+    for use_case in scenario:
+        profiler.instrument(use_case, "execute")
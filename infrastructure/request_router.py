@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+import logging
+import re
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from playwright.async_api import BrowserContext, Request, Route
+
+from settings.configs.browser_config import BrowserConfig
+
+
+CACHEABLE_RESOURCE_TYPES = frozenset({"script", "stylesheet"})
+# The cached body is already decoded, so transfer headers must not be replayed.
+_DROPPED_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+@dataclass
+class RoutingStats:
+    blocked: int = 0
+    cached: int = 0
+    passed: int = 0
+    # Static assets that could not be fetched for the cache and were left to the browser.
+    failed: int = 0
+
+
+@dataclass
+class CachedResponse:
+    status: int
+    headers: dict[str, str]
+    body: bytes
+
+
+@dataclass
+class StaticAssetCache:
+    """In-process LRU of static responses, bounded by total body size."""
+    max_bytes: int = 16 * 1024 * 1024
+    _entries: OrderedDict[str, CachedResponse] = field(default_factory=OrderedDict, init=False, repr=False)
+    _size: int = field(default=0, init=False)
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        entry = self._entries.get(url)
+        if entry is not None:
+            self._entries.move_to_end(url)
+        return entry
+
+    def put(self, url: str, entry: CachedResponse) -> None:
+        if len(entry.body) > self.max_bytes:
+            return
+        if url in self._entries:
+            self._size -= len(self._entries.pop(url).body)
+        while self._entries and self._size + len(entry.body) > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted.body)
+        self._entries[url] = entry
+        self._size += len(entry.body)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+@dataclass
+class RequestRouter:
+    config: BrowserConfig
+    logger: logging.Logger
+    stats: RoutingStats = field(default_factory=RoutingStats)
+    cache: StaticAssetCache = field(init=False)
+    _blocked_urls: Optional[re.Pattern] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self):
+        self.cache = StaticAssetCache(max_bytes=self.config.static_cache_bytes)
+        if self.config.blocked_url_patterns:
+            self._blocked_urls = re.compile("|".join(f"(?:{p})" for p in self.config.blocked_url_patterns))
+
+    @property
+    def enabled(self) -> bool:
+        return bool(
+            self.config.blocked_resource_types or self._blocked_urls or self.config.static_cache_bytes
+        )
+
+    async def attach(self, context: BrowserContext) -> None:
+        if self.enabled:
+            await context.route("**/*", self.handle)
+
+    async def handle(self, route: Route) -> None:
+        request = route.request
+        if self._is_blocked(request.resource_type, request.url):
+            self.stats.blocked += 1
+            await route.abort("blockedbyclient")
+            return
+
+        if (
+            self.config.static_cache_bytes
+            and request.method == "GET"
+            and request.resource_type in CACHEABLE_RESOURCE_TYPES
+        ):
+            cached = self.cache.get(request.url)
+            if cached:
+                self.stats.cached += 1
+                await route.fulfill(status=cached.status, headers=cached.headers, body=cached.body)
+                return
+
+            try:
+                response = await route.fetch()
+                body = await response.body()
+            except Exception as e:
+                self.stats.failed += 1
+                self.logger.warning("Failed to fetch %s for the static asset cache: %s", request.url, e)
+                await route.continue_()
+                return
+            if response.ok:
+                headers = {k: v for k, v in response.headers.items() if k.lower() not in _DROPPED_HEADERS}
+                self.cache.put(request.url, CachedResponse(response.status, headers, body))
+            self.stats.passed += 1
+            await route.fulfill(response=response, body=body)
+            return
+
+        self.stats.passed += 1
+        await route.continue_()
+
+    def blocks(self, request: Request) -> bool:
+        return self._is_blocked(request.resource_type, request.url)
+
+    def _is_blocked(self, resource_type: str, url: str) -> bool:
+        return resource_type in self.config.blocked_resource_types or bool(
+            self._blocked_urls and self._blocked_urls.search(url)
+        )
@@ -0,0 +1,232 @@
+from dataclasses import dataclass, field
+import math
+import os
+import sqlite3
+import time
+from typing import Iterable, Optional, Protocol, Sequence
+
+from domain.entities.product_catalog import NO_ID, ProductCatalog
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    started_at REAL NOT NULL,
+    finished_at REAL,
+    status TEXT NOT NULL DEFAULT 'running',
+    scenario TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS runs_by_time ON runs (started_at);
+
+CREATE TABLE IF NOT EXISTS steps (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    status TEXT NOT NULL,
+    waited REAL NOT NULL,
+    duration REAL NOT NULL,
+    error TEXT,
+    recorded_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS steps_by_run ON steps (run_id);
+CREATE INDEX IF NOT EXISTS steps_by_name ON steps (name, run_id);
+
+CREATE TABLE IF NOT EXISTS login_outcomes (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    username TEXT NOT NULL,
+    success INTEGER NOT NULL,
+    recorded_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS logins_by_run ON login_outcomes (run_id);
+CREATE INDEX IF NOT EXISTS logins_by_user ON login_outcomes (username, recorded_at);
+
+CREATE TABLE IF NOT EXISTS validation_errors (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    step TEXT NOT NULL,
+    message TEXT NOT NULL,
+    recorded_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS errors_by_run ON validation_errors (run_id);
+CREATE INDEX IF NOT EXISTS errors_by_time ON validation_errors (recorded_at);
+
+CREATE TABLE IF NOT EXISTS product_snapshots (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    product_id INTEGER,
+    name TEXT NOT NULL,
+    price_cents INTEGER NOT NULL,
+    image_url TEXT,
+    description TEXT,
+    recorded_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS products_by_run ON product_snapshots (run_id);
+CREATE INDEX IF NOT EXISTS products_by_name ON product_snapshots (name, run_id);
+"""
+
+_INSERT_STEP = "INSERT INTO steps VALUES (?, ?, ?, ?, ?, ?, ?)"
+_INSERT_LOGIN = "INSERT INTO login_outcomes VALUES (?, ?, ?, ?)"
+_INSERT_ERROR = "INSERT INTO validation_errors VALUES (?, ?, ?, ?)"
+_INSERT_PRODUCT = "INSERT INTO product_snapshots VALUES (?, ?, ?, ?, ?, ?, ?)"
+
+
+class StepRecord(Protocol):
+    name: str
+    status: str
+    waited: float
+    duration: float
+    error: Optional[str]
+
+
+def quantile(values: Sequence[float], q: float) -> float:
+    """
+    Nearest-rank quantile of ``values``.
+
+    :return: The quantile, or 0.0 for no values.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))]
+
+
+@dataclass
+class RunStore:
+    """
+    SQLite history of runs: step timings, login outcomes, validation errors and product snapshots.
+
+    The database runs in WAL mode, so reports can read it while a run writes. Rows are
+    buffered and inserted in batches of ``batch_size``, each batch in one transaction;
+    ``finish_run`` and ``close`` flush what is left.
+    """
+    path: str = ".runs.db"
+    batch_size: int = 500
+    _db: Optional[sqlite3.Connection] = field(default=None, init=False, repr=False)
+    _pending: dict[str, list[tuple]] = field(default_factory=dict, init=False, repr=False)
+    _pending_rows: int = field(default=0, init=False, repr=False)
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._db is None:
+            if os.path.dirname(self.path):
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._db = sqlite3.connect(self.path)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute("PRAGMA foreign_keys=ON")
+            self._db.executescript(SCHEMA)
+        return self._db
+
+    def start_run(self, scenario: Iterable[str] = ()) -> int:
+        db = self._connection()
+        with db:
+            cursor = db.execute(
+                "INSERT INTO runs (started_at, scenario) VALUES (?, ?)", (time.time(), ",".join(scenario))
+            )
+        return cursor.lastrowid
+
+    def finish_run(self, run_id: int, status: str = "ok") -> None:
+        self.flush()
+        db = self._connection()
+        with db:
+            db.execute("UPDATE runs SET finished_at = ?, status = ? WHERE id = ?", (time.time(), status, run_id))
+
+    def record_steps(self, run_id: int, steps: Iterable[StepRecord]) -> None:
+        now = time.time()
+        self._queue(_INSERT_STEP, [
+            (run_id, step.name, step.status, step.waited, step.duration, step.error, now) for step in steps
+        ])
+
+    def record_logins(self, run_id: int, outcomes: dict[str, bool]) -> None:
+        now = time.time()
+        self._queue(_INSERT_LOGIN, [(run_id, user, int(ok), now) for user, ok in outcomes.items()])
+
+    def record_validation_errors(self, run_id: int, step: str, errors: Iterable[str]) -> None:
+        now = time.time()
+        self._queue(_INSERT_ERROR, [(run_id, step, message, now) for message in errors])
+
+    def record_products(self, run_id: int, catalog: ProductCatalog) -> None:
+        now = time.time()
+        ids = (None if item_id == NO_ID else item_id for item_id in catalog.ids)
+        rows = zip(catalog.names, catalog.price_cents, ids, catalog.image_urls, catalog.descriptions)
+        self._queue(_INSERT_PRODUCT, [
+            (run_id, item_id, name, cents, image_url, description, now)
+            for name, cents, item_id, image_url, description in rows
+        ])
+
+    def _queue(self, sql: str, rows: list[tuple]) -> None:
+        self._pending.setdefault(sql, []).extend(rows)
+        self._pending_rows += len(rows)
+        if self._pending_rows >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._pending_rows:
+            return
+        db = self._connection()
+        with db:
+            for sql, rows in self._pending.items():
+                for start in range(0, len(rows), self.batch_size):
+                    db.executemany(sql, rows[start:start + self.batch_size])
+        self._pending.clear()
+        self._pending_rows = 0
+
+    def close(self) -> None:
+        if self._db is not None:
+            self.flush()
+            self._db.close()
+            self._db = None
+
+    def _last_runs(self, runs: int) -> str:
+        return f"SELECT id FROM runs ORDER BY started_at DESC LIMIT {int(runs)}"
+
+    def recent_runs(self, limit: int = 10) -> list[dict]:
+        db = self._connection()
+        cursor = db.execute(
+            "SELECT id, started_at, finished_at, status, scenario FROM runs ORDER BY started_at DESC LIMIT ?",
+            (limit,),
+        )
+        columns = [column[0] for column in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor]
+
+    def step_latency(self, q: float = 0.95, runs: int = 20, name: Optional[str] = None) -> dict[str, float]:
+        """
+        Quantile of the duration of each successful step over the last ``runs`` runs.
+
+        :return: Mapping of step name to seconds.
+        """
+        sql = f"SELECT name, duration FROM steps WHERE status = 'ok' AND run_id IN ({self._last_runs(runs)})"
+        params: tuple = ()
+        if name is not None:
+            sql, params = sql + " AND name = ?", (name,)
+        durations: dict[str, list[float]] = {}
+        for step, duration in self._connection().execute(sql, params):
+            durations.setdefault(step, []).append(duration)
+        return {step: quantile(values, q) for step, values in sorted(durations.items())}
+
+    def login_success_rate(self, runs: int = 20) -> dict[str, float]:
+        """
+        :return: Share of successful logins per user over the last ``runs`` runs.
+        """
+        cursor = self._connection().execute(
+            "SELECT username, AVG(success) FROM login_outcomes "
+            f"WHERE run_id IN ({self._last_runs(runs)}) GROUP BY username ORDER BY username"
+        )
+        return dict(cursor.fetchall())
+
+    def validation_error_counts(self, runs: int = 20) -> dict[str, int]:
+        """
+        :return: How often each validation message appeared over the last ``runs`` runs.
+        """
+        cursor = self._connection().execute(
+            "SELECT message, COUNT(*) FROM validation_errors "
+            f"WHERE run_id IN ({self._last_runs(runs)}) GROUP BY message ORDER BY COUNT(*) DESC"
+        )
+        return dict(cursor.fetchall())
+
+    def price_history(self, name: str, runs: int = 20) -> list[tuple[int, int]]:
+        """
+        :return: ``(run_id, price_cents)`` of a product over the last ``runs`` runs, oldest first.
+        """
+        cursor = self._connection().execute(
+            "SELECT run_id, price_cents FROM product_snapshots "
+            f"WHERE name = ? AND run_id IN ({self._last_runs(runs)}) ORDER BY run_id",
+            (name,),
+        )
+        return cursor.fetchall()
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+import hashlib
+import logging
+import os
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
+
+IMAGE_SUFFIXES = (".png", ".jpeg", ".jpg")
+
+
+@dataclass
+class ScreenshotStats:
+    saved: int = 0
+    deduplicated: int = 0
+    evicted: int = 0
+
+
+@dataclass
+class ScreenshotService:
+    """
+    Captures screenshots and hands hashing, disk writes and retention to a background worker.
+
+    Only the capture round trip to the browser is awaited by callers.
+    """
+    logger: logging.Logger
+    directory: str = "automation_screenshots"
+    fmt: str = "png"
+    quality: int = 70
+    max_files: int = 200
+    max_bytes: int = 50 * 1024 * 1024
+    stats: ScreenshotStats = field(default_factory=ScreenshotStats)
+    _queue: Optional[asyncio.Queue] = field(default=None, init=False, repr=False)
+    _worker: Optional[asyncio.Task] = field(default=None, init=False, repr=False)
+    _hashes: dict[str, str] = field(default_factory=dict, init=False, repr=False)
+    # Digest last written to each path, so an overwritten file stops standing for its old frame.
+    _digests: dict[str, str] = field(default_factory=dict, init=False, repr=False)
+
+    async def capture(
+        self, page: Page, path: str, full_page: bool = False, selector: str | None = None
+    ) -> str:
+        """
+        Capture the page, or only the element matching ``selector``, and queue it for writing.
+
+        A bare file name is written to ``directory``, where retention applies to it.
+
+        :return: The path the screenshot will be written to, with the suffix of the configured format.
+        """
+        if not os.path.dirname(path):
+            path = os.path.join(self.directory, path)
+        path = f"{os.path.splitext(path)[0]}.{self.fmt}"
+        options = {"type": self.fmt}
+        if self.fmt == "jpeg":
+            options["quality"] = self.quality
+        if selector:
+            data = await page.locator(selector).first.screenshot(**options)
+        else:
+            data = await page.screenshot(full_page=full_page, **options)
+        self.submit(path, data)
+        return path
+
+    def submit(self, path: str, data: bytes) -> None:
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+        self._queue.put_nowait((path, data))
+
+    async def flush(self) -> None:
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def close(self) -> None:
+        await self.flush()
+        if self._worker is not None:
+            self._worker.cancel()
+            await asyncio.gather(self._worker, return_exceptions=True)
+            self._worker = None
+
+    async def _run(self) -> None:
+        while True:
+            path, data = await self._queue.get()
+            try:
+                await asyncio.to_thread(self._store, path, data)
+            except Exception as e:
+                self.logger.error("Failed to save screenshot %s: %s", path, e)
+            finally:
+                self._queue.task_done()
+
+    def _store(self, path: str, data: bytes) -> None:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        digest = hashlib.sha256(data).hexdigest()
+        target = os.path.abspath(path)
+        previous = self._digests.pop(target, None)
+        if previous and previous != digest and os.path.abspath(self._hashes.get(previous, "")) == target:
+            del self._hashes[previous]
+        existing = self._hashes.get(digest)
+        if existing and os.path.exists(existing):
+            if os.path.abspath(existing) != target:
+                if os.path.exists(path):
+                    os.unlink(path)
+                os.link(existing, path)
+            self._digests[target] = digest
+            self.stats.deduplicated += 1
+        else:
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            self._hashes[digest] = path
+            self._digests[target] = digest
+            self.stats.saved += 1
+        self._enforce_retention()
+
+    def _enforce_retention(self) -> None:
+        if not os.path.isdir(self.directory):
+            return
+        files = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and entry.name.lower().endswith(IMAGE_SUFFIXES):
+                stat = entry.stat()
+                files.append((stat.st_mtime, entry.path, stat.st_size, stat.st_ino))
+        files.sort()
+
+        # Hard-linked duplicates share an inode and only count once towards the size budget.
+        inode_links = {}
+        for _, _, _, inode in files:
+            inode_links[inode] = inode_links.get(inode, 0) + 1
+        total = sum(size for _, _, size, inode in {f[3]: f for f in files}.values())
+
+        while files and (len(files) > self.max_files or total > self.max_bytes):
+            _, path, size, inode = files.pop(0)
+            os.unlink(path)
+            inode_links[inode] -= 1
+            if not inode_links[inode]:
+                total -= size
+            self.stats.evicted += 1
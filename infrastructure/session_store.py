@@ -0,0 +1,71 @@
+from dataclasses import asdict, dataclass
+import json
+import os
+import re
+import tempfile
+import time
+from typing import Any, Optional
+from urllib.parse import urlparse
+
+from domain.entities.user import User
+
+
+@dataclass
+class SessionStore:
+    """File-backed cache of authenticated storage states and discovered users, with a TTL."""
+    directory: str = ".sessions"
+    ttl: float = 3600.0
+
+    def save_state(self, url: str, username: str, state: dict) -> None:
+        self._write(self._state_key(url, username), state)
+
+    def load_state(self, url: str, username: str) -> Optional[dict]:
+        return self._read(self._state_key(url, username))
+
+    def invalidate(self, url: str, username: str) -> None:
+        self._remove(self._state_key(url, username))
+
+    def save_users(self, url: str, users: list[User]) -> None:
+        self._write(f"users-{urlparse(url).netloc}", [asdict(user) for user in users])
+
+    def load_users(self, url: str) -> Optional[list[User]]:
+        users = self._read(f"users-{urlparse(url).netloc}")
+        return [User(**user) for user in users] if users else None
+
+    def clear(self) -> None:
+        if os.path.isdir(self.directory):
+            for name in os.listdir(self.directory):
+                if name.endswith(".json"):
+                    os.unlink(os.path.join(self.directory, name))
+
+    @staticmethod
+    def _state_key(url: str, username: str) -> str:
+        # The same username on another host is another account.
+        return f"state-{urlparse(url).netloc}-{username}"
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, re.sub(r"[^\w.-]", "_", key) + ".json")
+
+    def _write(self, key: str, payload: Any) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"saved_at": time.time(), "payload": payload}, f)
+        os.replace(tmp_path, self._path(key))
+
+    def _read(self, key: str) -> Any:
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if time.time() - entry.get("saved_at", 0) > self.ttl:
+            self._remove(key)
+            return None
+        return entry.get("payload")
+
+    def _remove(self, key: str) -> None:
+        try:
+            os.unlink(self._path(key))
+        except FileNotFoundError:
+            pass
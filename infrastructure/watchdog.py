@@ -0,0 +1,155 @@
+from collections import deque
+from dataclasses import asdict, dataclass, field
+import json
+import os
+import time
+from typing import Optional
+from weakref import WeakKeyDictionary
+
+from infrastructure.metrics import _write_atomic
+
+
+@dataclass
+class MemorySample:
+    timestamp: float
+    rss_bytes: Optional[int]
+    operations: int
+
+
+@dataclass
+class RecycleEvent:
+    timestamp: float
+    reason: str
+    operations: int
+    rss_bytes: Optional[int]
+    url: str
+
+
+def process_tree_rss(root_pid: int, include_root: bool = False) -> Optional[int]:
+    """
+    Sum the resident memory of every descendant of ``root_pid`` from /proc.
+
+    :return: Resident bytes, or None where /proc is not available.
+    """
+    if not os.path.isdir("/proc"):
+        return None
+    children: dict[int, list[int]] = {}
+    for name in os.listdir("/proc"):
+        if not name.isdigit():
+            continue
+        try:
+            with open(f"/proc/{name}/stat", "rb") as f:
+                # The command name may contain spaces; fields after it are space separated.
+                ppid = int(f.read().rsplit(b")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(name))
+
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    pending = [root_pid] if include_root else list(children.get(root_pid, ()))
+    rss = 0
+    while pending:
+        pid = pending.pop()
+        pending.extend(children.get(pid, ()))
+        try:
+            with open(f"/proc/{pid}/statm", "rb") as f:
+                rss += int(f.read().split()[1]) * page_size
+        except (OSError, IndexError, ValueError):
+            continue
+    return rss
+
+
+@dataclass
+class ResourceWatchdog:
+    """
+    Decides when a long-lived browser context should be replaced by a fresh one.
+
+    Operations are counted per context; the resident memory of the browser process tree
+    is sampled at most every ``interval`` seconds. A context is due for recycling once
+    it ran ``max_operations`` operations or the tree grew past ``max_rss_bytes``; a
+    threshold of 0 disables that check.
+
+    The memory check disarms itself once it asked for a recycle, and rearms when the tree
+    falls below ``rearm_ratio`` of the threshold, so memory that recycling does not give
+    back does not replace a context every interval.
+    """
+    max_operations: int = 0
+    max_rss_bytes: int = 0
+    interval: float = 5.0
+    root_pid: int = field(default_factory=os.getpid)
+    include_root: bool = False
+    rearm_ratio: float = 0.9
+    samples: deque[MemorySample] = field(default_factory=lambda: deque(maxlen=720))
+    events: list[RecycleEvent] = field(default_factory=list)
+    _operations: WeakKeyDictionary = field(default_factory=WeakKeyDictionary, init=False, repr=False)
+    _sampled_at: float = field(default=0.0, init=False, repr=False)
+    _rss_armed: bool = field(default=True, init=False, repr=False)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.max_operations or self.max_rss_bytes)
+
+    def count(self, context: object) -> int:
+        self._operations[context] = self._operations.get(context, 0) + 1
+        return self._operations[context]
+
+    def operations(self, context: object) -> int:
+        return self._operations.get(context, 0)
+
+    def forget(self, context: object) -> None:
+        self._operations.pop(context, None)
+
+    def sample(self) -> MemorySample:
+        sample = MemorySample(
+            time.time(), process_tree_rss(self.root_pid, self.include_root), sum(self._operations.values())
+        )
+        self.samples.append(sample)
+        self._sampled_at = time.monotonic()
+        return sample
+
+    def recycle_reason(self, context: object) -> Optional[str]:
+        """
+        :return: Why ``context`` should be recycled now, or None.
+        """
+        operations = self.operations(context)
+        if self.max_operations and operations >= self.max_operations:
+            return f"{operations} operations"
+        if self.max_rss_bytes and time.monotonic() - self._sampled_at >= self.interval:
+            rss = self.sample().rss_bytes
+            if rss is None:
+                return None
+            if not self._rss_armed:
+                self._rss_armed = rss < self.max_rss_bytes * self.rearm_ratio
+            elif rss >= self.max_rss_bytes:
+                self._rss_armed = False
+                return f"browser RSS {rss / 2 ** 20:.0f} MiB"
+        return None
+
+    def record_recycle(self, context: object, reason: str, url: str) -> RecycleEvent:
+        last = self.samples[-1].rss_bytes if self.samples else None
+        event = RecycleEvent(time.time(), reason, self.operations(context), last, url)
+        self.events.append(event)
+        self.forget(context)
+        return event
+
+    def to_dict(self) -> dict:
+        return {
+            "samples": [asdict(sample) for sample in self.samples],
+            "events": [asdict(event) for event in self.events],
+        }
+
+    def to_prometheus(self, prefix: str = "browser") -> str:
+        last = self.samples[-1] if self.samples else None
+        lines = [
+            f"# HELP {prefix}_rss_bytes Resident memory of the browser process tree.",
+            f"# TYPE {prefix}_rss_bytes gauge",
+            f"{prefix}_rss_bytes {last.rss_bytes if last and last.rss_bytes is not None else 0}",
+            f"# HELP {prefix}_context_recycles_total Browser contexts replaced by the watchdog.",
+            f"# TYPE {prefix}_context_recycles_total counter",
+            f"{prefix}_context_recycles_total {len(self.events)}",
+        ]
+        return "\n".join(lines) + "\n"
+
+    def dump(self, json_path: str = "watchdog.json", prometheus_path: str = "watchdog.prom") -> None:
+        _write_atomic(json_path, json.dumps(self.to_dict(), indent=2))
+        _write_atomic(prometheus_path, self.to_prometheus())
@@ -1,27 +1,130 @@
+import argparse
 import asyncio
+import json
+import logging
 
-from application.checkout_use_case import CheckoutUseCase
-from application.extract_products_use_case import ExtractProductsUseCase
-from application.login_use_case import LoginUseCase
-from settings.containers import get_container
+from settings.configs.general import url_login
+from settings.containers import get_container, get_scenario
 
 
 async def main():
+    from application.scheduler import UseCaseScheduler
+    from infrastructure.browser_service import BrowserService
+    from infrastructure.run_store import RunStore
+
     container = get_container()
-    # Use case execution
-    # Login to the application
-    login_uc = container.resolve(LoginUseCase)
-    users = await login_uc.get_users_credentials()
-    await login_uc.execute(users)
+    browser_service = container.resolve(BrowserService)
+    scheduler = container.resolve(UseCaseScheduler)
+    runs = container.resolve(RunStore)
+    scenario = get_scenario()
+    run_id = runs.start_run(use_case.__name__ for use_case in scenario)
+    status = "failed"
+    try:
+        # Discover users, log in, extract products and check out, as ordered by the scheduler
+        await scheduler.run(scenario)
+        status = "ok"
+    finally:
+        # Per-operation latency and outcome counts of the run
+        browser_service.state.metrics.dump("metrics.json", "metrics.prom")
+        # Browser memory samples and context recycles of the run
+        browser_service.state.watchdog.dump("watchdog.json", "watchdog.prom")
+        await browser_service.close()
+        try:
+            # Step timings, login outcomes, validation errors and the catalog, for trends across runs
+            record_run(runs, run_id, scheduler.last)
+        finally:
+            runs.finish_run(run_id, status)
+            runs.close()
+
+
+async def profiled_main(output: str) -> None:
+    """Run ``main`` with every browser operation, container lookup, export and use case timed."""
+    from infrastructure.profiling import Profiler, instrument_run
+
+    profiler = Profiler()
+    instrument_run(profiler, get_scenario())
+    try:
+        with profiler.span("main"):
+            await main()
+    finally:
+        profiler.restore()
+        print("Profile written to %s and %s" % profiler.dump(output))
+
+
+def record_run(runs, run_id: int, schedule) -> None:
+    """Keep the step timings and outcomes of a run in the run store."""
+    if schedule is None:
+        return
+    runs.record_steps(run_id, schedule.timings)
+    results = schedule.results
+    if results.get("session"):
+        runs.record_logins(run_id, results["session"])
+    if results.get("checkout"):
+        runs.record_validation_errors(run_id, "checkout", results["checkout"]["errors"])
+    if results.get("checkout_matrix"):
+        runs.record_validation_errors(run_id, "checkout_matrix", results["checkout_matrix"].errors)
+    if results.get("products") is not None:
+        runs.record_products(run_id, results["products"])
+
+
+def history(args: argparse.Namespace) -> None:
+    from infrastructure.run_store import RunStore
+
+    runs = get_container().resolve(RunStore)
+    report = {
+        "runs": runs.recent_runs(args.runs),
+        f"p{round(args.quantile * 100)}_step_seconds": runs.step_latency(args.quantile, args.runs),
+        "login_success_rate": runs.login_success_rate(args.runs),
+        "validation_errors": runs.validation_error_counts(args.runs),
+    }
+    runs.close()
+    print(json.dumps(report, indent=2))
+
+
+def load(args: argparse.Namespace) -> None:
+    from application.load_runner import LoadProfile, LoadRunner, write_report
+
+    profile = LoadProfile(
+        url=args.url or url_login(),
+        virtual_users=args.users,
+        ramp_up=args.ramp_up,
+        duration=args.duration,
+        think_time=args.think_time,
+        **({"processes": args.processes} if args.processes else {}),
+    )
+    report = LoadRunner(profile, get_container().resolve(logging.Logger)).run()
+    write_report(report, args.report)
+    print(json.dumps(report["steps"], indent=2))
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Saucedemo automation.")
+    parser.add_argument("--profile", action="store_true", help="Write a wall-clock profile of the run.")
+    parser.add_argument("--profile-output", default="profile", help="Writes <prefix>.folded and <prefix>.txt.")
+    subparsers = parser.add_subparsers(dest="mode")
 
-    # Extract products after login
-    extract_uc = container.resolve(ExtractProductsUseCase)
-    await extract_uc.execute()
+    load_parser = subparsers.add_parser("load", help="Drive virtual users through the flow across a process pool.")
+    load_parser.add_argument("--url", help="Storefront URL, defaults to URL_LOG.")
+    load_parser.add_argument("--users", type=int, default=10, help="Target number of concurrent virtual users.")
+    load_parser.add_argument("--ramp-up", type=float, default=10.0, help="Seconds until all virtual users run.")
+    load_parser.add_argument("--duration", type=float, default=60.0, help="Seconds to hold the target concurrency.")
+    load_parser.add_argument("--processes", type=int, default=None, help="Worker processes, defaults to the CPU count.")
+    load_parser.add_argument("--think-time", type=float, default=0.0, help="Pause between iterations of a virtual user.")
+    load_parser.add_argument("--report", default="load_report.json")
 
-    # Checkout after extracting products
-    checkout_uc = container.resolve(CheckoutUseCase)
-    await checkout_uc.execute()
+    history_parser = subparsers.add_parser("history", help="Summarise the latest runs from the run store.")
+    history_parser.add_argument("--runs", type=int, default=20, help="Number of latest runs to cover.")
+    history_parser.add_argument("--quantile", type=float, default=0.95, help="Step latency quantile to report.")
+    return parser.parse_args()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    args = parse_args()
+    if args.mode == "load":
+        load(args)
+    elif args.mode == "history":
+        history(args)
+    elif args.profile:
+        asyncio.run(profiled_main(args.profile_output))
+    else:
+        asyncio.run(main())
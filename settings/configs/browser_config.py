@@ -1,5 +1,6 @@
 from dataclasses import dataclass
-from fake_useragent import UserAgent
+
+from settings.configs.user_agents import random_user_agent
 
 
 @dataclass
@@ -11,9 +12,33 @@ class BrowserConfig:
     headless: bool = False
     stealth_mode: bool = True
     timeout: int = 30000
+    pool_size: int = 4
+    pacing: str = "human"
+    # "locator" fills form fields one by one with actionability checks, "script" in one evaluation.
+    form_fill: str = "locator"
+    blocked_resource_types: tuple[str, ...] = ()
+    blocked_url_patterns: tuple[str, ...] = ()
+    static_cache_bytes: int = 0
+    browser_server: bool = False
+    browser_server_endpoint: str = None
+    screenshot_dir: str = "automation_screenshots"
+    screenshot_format: str = "png"
+    screenshot_quality: int = 70
+    screenshot_max_files: int = 200
+    screenshot_max_bytes: int = 50 * 1024 * 1024
+    full_page_evidence: bool = False
+    breaker_threshold: int = 5
+    breaker_reset_after: float = 30.0
+    # "record" writes the traffic of the run to har_path, "replay" serves it back offline.
+    har_mode: str = "off"
+    har_path: str = "network.har"
+    # Replace a context after this many operations or once the browser's RSS passes the limit; 0 disables.
+    recycle_max_operations: int = 0
+    recycle_max_rss_bytes: int = 0
+    watchdog_interval: float = 5.0
 
     def __post_init__(self):
-        self.user_agent = self.user_agent or UserAgent().random
+        self.user_agent = self.user_agent or random_user_agent()
         self.custom_headers = self.custom_headers or {
             "Accept-Language": "en-US,en;q=0.9",
             "Sec-Fetch-Dest": "document"
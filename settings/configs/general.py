@@ -1,9 +1,60 @@
-import os 
-from dotenv import load_dotenv
+from functools import lru_cache
+import os
 
 
-load_dotenv()
+@lru_cache(1)
+def _load_env() -> None:
+    """Read ``.env`` once, on the first setting that is looked up."""
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+
+def _getenv(name: str, default: str | None = None) -> str | None:
+    _load_env()
+    return os.getenv(name, default)
 
 
 def url_login() -> str:
-    return os.getenv("URL_LOG")
\ No newline at end of file
+    return _getenv("URL_LOG")
+
+
+def url_inventory() -> str:
+    return f"{url_login().rstrip('/')}/inventory.html"
+
+
+def browser_server_endpoint() -> str | None:
+    return _getenv("BROWSER_WS_ENDPOINT")
+
+
+def log_format() -> str:
+    return _getenv("LOG_FORMAT", "text")
+
+
+def skip_unchanged_export() -> bool:
+    return _getenv("SKIP_UNCHANGED_EXPORT", "false").lower() in ("1", "true", "yes")
+
+
+def crawl_product_details() -> bool:
+    return _getenv("CRAWL_PRODUCT_DETAILS", "false").lower() in ("1", "true", "yes")
+
+
+def har_mode() -> str:
+    return _getenv("HAR_MODE", "off")
+
+
+def har_path() -> str:
+    return _getenv("HAR_PATH", "network.har")
+
+
+def checkout_matrix() -> bool:
+    return _getenv("CHECKOUT_MATRIX", "false").lower() in ("1", "true", "yes")
+
+
+def checkout_matrix_products() -> tuple[str, ...]:
+    products = _getenv("CHECKOUT_MATRIX_PRODUCTS", "sauce-labs-backpack")
+    return tuple(slug.strip() for slug in products.split(",") if slug.strip())
+
+
+def run_store_path() -> str:
+    return _getenv("RUN_STORE_PATH", ".runs.db")
@@ -0,0 +1,68 @@
+"""
+Pool of desktop user agents sampled by ``BrowserConfig``.
+
+The pool is precomputed from the fake_useragent dataset into ``user_agents.json`` so
+that building a config does not load the whole library. Regenerate it with::
+
+    python -m settings.configs.user_agents
+"""
+from functools import lru_cache
+from itertools import accumulate
+import json
+import os
+import random
+
+
+POOL_FILE = os.path.join(os.path.dirname(__file__), "user_agents.json")
+POOL_SIZE = 100
+BROWSERS = ("Chrome", "Firefox", "Edge", "Safari")
+FALLBACK = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/122.0.0.0 Safari/537.36"
+)
+
+
+@lru_cache(1)
+def _pool() -> tuple[list[str], list[float]]:
+    try:
+        with open(POOL_FILE, encoding="utf-8") as f:
+            entries = json.load(f)["user_agents"]
+    except (OSError, ValueError, KeyError):
+        return [FALLBACK], [1.0]
+    return [entry[0] for entry in entries], list(accumulate(entry[1] for entry in entries))
+
+
+def random_user_agent() -> str:
+    """Pick a user agent from the pool, weighted by how common it is."""
+    user_agents, cum_weights = _pool()
+    return random.choices(user_agents, cum_weights=cum_weights)[0]
+
+
+def build_pool(size: int = POOL_SIZE) -> dict:
+    """
+    Select the most common desktop user agents of the fake_useragent dataset.
+
+    :return: The pool as written to ``user_agents.json``.
+    """
+    from importlib.metadata import version
+    from importlib.resources import files
+
+    weights: dict[str, float] = {}
+    with files("fake_useragent").joinpath("data/browsers.jsonl").open(encoding="utf-8") as f:
+        for line in f:
+            entry = json.loads(line)
+            if entry["type"] == "desktop" and entry["browser"] in BROWSERS:
+                weights[entry["useragent"]] = weights.get(entry["useragent"], 0.0) + entry["percent"]
+    top = sorted(weights.items(), key=lambda item: item[1], reverse=True)[:size]
+    return {
+        "source": f"fake-useragent {version('fake-useragent')}",
+        "user_agents": [[user_agent, round(weight, 6)] for user_agent, weight in top],
+    }
+
+
+if __name__ == "__main__":
+    pool = build_pool()
+    entries = ",\n".join(f"  {json.dumps(entry)}" for entry in pool["user_agents"])
+    with open(POOL_FILE, "w", encoding="utf-8") as f:
+        f.write(f'{{\n "source": {json.dumps(pool["source"])},\n "user_agents": [\n{entries}\n ]\n}}\n')
+    print(f"Wrote {len(pool['user_agents'])} user agents from {pool['source']} to {POOL_FILE}")
@@ -1,25 +1,74 @@
 from functools import lru_cache
-import inspect
+from importlib import import_module
 import logging
+from typing import TYPE_CHECKING
 
-import punq
+if TYPE_CHECKING:
+    import punq
 
-from application.checkout_use_case import CheckoutUseCase
-from application.extract_products_use_case import ExtractProductsUseCase
-from application.login_use_case import LoginUseCase
-from application.base import UseCase
-from infrastructure.browser_service import BrowserService, BrowserServiceState
-from infrastructure.csv_exporter import ProductCSVExporter
-from infrastructure.logger import configure_logger
-from settings.configs.browser_config import BrowserConfig
+    from application.base import UseCase
+
+
+# Use cases run by main(); the scheduler orders them by what each requires and provides.
+# Named rather than imported so that importing this module stays cheap.
+SCENARIO: tuple[str, ...] = (
+    "application.discover_users_use_case:DiscoverUsersUseCase",
+    "application.login_use_case:LoginUseCase",
+    "application.extract_products_use_case:ExtractProductsUseCase",
+    "application.checkout_use_case:CheckoutUseCase",
+)
+# Opt-in use cases, added to the scenario when the named setting of settings.configs.general is on.
+OPTIONAL_SCENARIO: dict[str, str] = {
+    "application.checkout_matrix_use_case:CheckoutMatrixUseCase": "checkout_matrix",
+}
 
 
 @lru_cache(1)
-def get_container() -> punq.Container:
+def get_container() -> "punq.Container":
     return _init_container()
 
 
-def _init_container() -> punq.Container:
+def get_scenario() -> list[type["UseCase"]]:
+    from settings.configs import general
+
+    optional = [path for path, setting in OPTIONAL_SCENARIO.items() if getattr(general, setting)()]
+    return [_load(path) for path in (*SCENARIO, *optional)]
+
+
+def _load(path: str) -> type:
+    module, name = path.split(":")
+    return getattr(import_module(module), name)
+
+
+def _init_container() -> "punq.Container":
+    """
+    Import every provider and register it, eagerly: resolving takes the classes as keys.
+
+    This is where playwright and the rest of the application get imported, so it runs on
+    the first ``get_container()`` call rather than when ``main`` or this module is imported.
+    """
+    import punq
+
+    from application.checkout_matrix_use_case import CheckoutMatrixUseCase
+    from application.checkout_use_case import CheckoutUseCase
+    from application.discover_users_use_case import DiscoverUsersUseCase
+    from application.extract_products_use_case import ExtractProductsUseCase
+    from application.login_use_case import LoginUseCase
+    from application.scheduler import UseCaseScheduler
+    from infrastructure.browser_service import BrowserService, BrowserServiceState
+    from infrastructure.catalog_snapshot import CatalogSnapshotStore
+    from infrastructure.csv_exporter import ProductCSVExporter
+    from infrastructure.detail_crawler import ProductDetailCrawler
+    from infrastructure.logger import configure_logger
+    from infrastructure.product_exporter import ProductStreamExporter
+    from infrastructure.run_store import RunStore
+    from infrastructure.session_store import SessionStore
+    from settings.configs.browser_config import BrowserConfig
+    from settings.configs.general import (
+        browser_server_endpoint, checkout_matrix_products, crawl_product_details, har_mode, har_path, log_format,
+        run_store_path, skip_unchanged_export, url_login,
+    )
+
     container = punq.Container()
 
     def init_browser_config() -> BrowserConfig:
@@ -27,9 +76,21 @@ def _init_container() -> punq.Container:
             user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3',
             headless=True,
             stealth_mode=True,
+            pool_size=6,
+            pacing="adaptive",
+            blocked_resource_types=("image", "media", "font"),
+            blocked_url_patterns=(r"google-analytics\.com", r"googletagmanager\.com", r"backtrace\.io"),
+            static_cache_bytes=32 * 1024 * 1024,
+            browser_server=True,
+            browser_server_endpoint=browser_server_endpoint(),
+            screenshot_format="jpeg",
+            har_mode=har_mode(),
+            har_path=har_path(),
+            recycle_max_operations=2000,
+            recycle_max_rss_bytes=1536 * 1024 * 1024,
         )
 
-    container.register(logging.Logger, instance=configure_logger())
+    container.register(logging.Logger, instance=configure_logger(structured=log_format() == "json"))
 
     container.register(
         BrowserService,
@@ -40,12 +101,56 @@ def _init_container() -> punq.Container:
             logger=container.resolve(logging.Logger),
         ),
     )
+    container.register(SessionStore, instance=SessionStore(directory=".sessions", ttl=3600))
     container.register(LoginUseCase)
 
     container.register(
         ProductCSVExporter, 
         factory=lambda: ProductCSVExporter(logger=container.resolve(logging.Logger))
     )
-    container.register(ExtractProductsUseCase)
+    container.register(
+        ProductStreamExporter,
+        factory=lambda: ProductStreamExporter(logger=container.resolve(logging.Logger))
+    )
+    container.register(
+        ProductDetailCrawler,
+        factory=lambda: ProductDetailCrawler(
+            browser_service=container.resolve(BrowserService),
+            logger=container.resolve(logging.Logger),
+            base_url=url_login(),
+            concurrency=6,
+            timeout=15.0,
+            retries=2,
+        )
+    )
+    container.register(CatalogSnapshotStore, instance=CatalogSnapshotStore(directory=".catalog"))
+    container.register(RunStore, scope=punq.Scope.singleton, factory=lambda: RunStore(path=run_store_path()))
+    container.register(
+        ExtractProductsUseCase,
+        factory=lambda: ExtractProductsUseCase(
+            container.resolve(BrowserService),
+            exporter=container.resolve(ProductStreamExporter),
+            snapshots=container.resolve(CatalogSnapshotStore),
+            logger=container.resolve(logging.Logger),
+            skip_unchanged=skip_unchanged_export(),
+            details=container.resolve(ProductDetailCrawler) if crawl_product_details() else None,
+        ),
+    )
     container.register(CheckoutUseCase)
+    container.register(
+        CheckoutMatrixUseCase,
+        factory=lambda: CheckoutMatrixUseCase(
+            container.resolve(BrowserService),
+            logger=container.resolve(logging.Logger),
+            products=checkout_matrix_products(),
+        ),
+    )
+    container.register(DiscoverUsersUseCase)
+
+    container.register(
+        UseCaseScheduler,
+        factory=lambda: UseCaseScheduler(
+            container=container, logger=container.resolve(logging.Logger), max_parallel=4, step_budget=120.0
+        )
+    )
     return container
\ No newline at end of file
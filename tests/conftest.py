@@ -1,4 +1,8 @@
+import logging
+import os
+
 import pytest
+import pytest_asyncio
 
 from settings.containers import get_container
 
@@ -8,9 +12,214 @@ def container():
     return get_container()
 
 
+class FakeRequest:
+    def __init__(self, url, resource_type="document", method="GET"):
+        self.url = url
+        self.resource_type = resource_type
+        self.method = method
+
+
+class FakeResponse:
+    ok = True
+    status = 200
+    headers = {"content-type": "text/javascript", "content-encoding": "gzip", "cache-control": "max-age=60"}
+
+    async def body(self):
+        return b"console.log(1)"
+
+
+class FakeRoute:
+    """Records how a route was handled in ``outcome``; ``fetch`` raises ``fetch_error`` when set."""
+
+    def __init__(self, request, fetch_error=None):
+        self.request = request
+        self.fetch_error = fetch_error
+        self.outcome = None
+        self.fetches = 0
+
+    async def abort(self, error_code=None):
+        self.outcome = ("abort", error_code)
+
+    async def fetch(self):
+        self.fetches += 1
+        if self.fetch_error:
+            raise self.fetch_error
+        return FakeResponse()
+
+    async def fulfill(self, response=None, status=None, headers=None, body=None):
+        self.outcome = ("fulfill", status, headers, body) if response is None else ("fetched", body)
+
+    async def continue_(self):
+        self.outcome = ("continue",)
+
+
+@pytest.fixture
+def fake_route():
+    """
+    Builds Playwright route stand-ins: ``fake_route(url, resource_type, method, fetch_error)``.
+    """
+    def make(url, resource_type="document", method="GET", fetch_error=None) -> FakeRoute:
+        return FakeRoute(FakeRequest(url, resource_type, method), fetch_error=fetch_error)
+
+    return make
+
+
+class FakePage:
+    def __init__(self, url="about:blank"):
+        self.url = url
+        self.scripts = []
+        self.storage = {}
+        self.closed = False
+
+    async def goto(self, url, timeout=None):
+        self.url = url
+
+    async def evaluate(self, script, arg=None):
+        self.scripts.append(script)
+        if isinstance(arg, list):
+            self.storage.update({item["name"]: item["value"] for item in arg})
+
+    def is_closed(self):
+        return self.closed
+
+
+class FakeContext:
+    def __init__(self, url="about:blank", cookies=()):
+        self.pages = [FakePage(url)]
+        self.cookies = list(cookies)
+        self.closed = False
+
+    async def storage_state(self):
+        return {
+            "cookies": [{"name": "session-username", "value": "standard_user"}],
+            "origins": [{"origin": "https://www.saucedemo.com", "localStorage": [{"name": "cart", "value": "[4]"}]}],
+        }
+
+    async def add_cookies(self, cookies):
+        self.cookies.extend(cookies)
+
+    async def clear_cookies(self):
+        self.cookies.clear()
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_context():
+    """
+    Browser context stand-in with a single page: ``fake_context(url, cookies)``.
+    """
+    return FakeContext
+
+
+@pytest.fixture
+def new_slot():
+    """
+    Async factory of ``(context, page)`` stand-ins, as a context pool or ``BrowserService._new_page``
+    creates them. Every slot made is kept in ``new_slot.created``.
+    """
+    created = []
+
+    async def make(url="about:blank", cookies=()):
+        context = FakeContext(url, cookies)
+        created.append((context, context.pages[0]))
+        return created[-1]
+
+    make.created = created
+    return make
+
+
 @pytest.fixture(scope="session")
-def event_loop():
-    import asyncio
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
\ No newline at end of file
+def worker_dir(tmp_path_factory) -> str:
+    """
+    Scratch directory of this test process, distinct for every pytest-xdist worker.
+
+    :return: The directory path.
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    return str(tmp_path_factory.mktemp(f"browser-{worker}"))
+
+
+@pytest.fixture(scope="session")
+def browser_config(worker_dir):
+    from settings.configs.browser_config import BrowserConfig
+
+    # A private browser per worker: a shared browser server would mix the workers' contexts.
+    return BrowserConfig(
+        headless=True,
+        pacing="fast",
+        # ``authenticated_state`` leases a context while a test's ``browser`` holds another.
+        pool_size=max(2, int(os.getenv("TEST_POOL_SIZE", "4"))),
+        blocked_resource_types=("image", "media", "font"),
+        screenshot_dir=os.path.join(worker_dir, "screenshots"),
+    )
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def browser_service(browser_config):
+    """
+    The browser of the test session, launched once per worker.
+
+    Tests should not drive its main page; they lease their own context through ``browser``.
+    """
+    from infrastructure.browser_service import BrowserService, BrowserServiceState
+
+    service = BrowserService(config=browser_config, logger=logging.getLogger("tests"), state=BrowserServiceState())
+    await service.initialize()
+    yield service
+    await service.close()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def browser(browser_service):
+    """
+    A context and page of the session browser for one test, wiped of cookies and storage on return.
+    """
+    async with browser_service.lease() as leased:
+        yield leased
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def authenticated_state(browser_service) -> dict:
+    """
+    Storage state of ``standard_user``, signed in once per worker.
+    """
+    from infrastructure.page_objects import InventoryPage, LoginPage
+    from settings.configs.general import url_login
+
+    async with browser_service.lease() as leased:
+        await leased.go_to(url_login())
+        await leased.page_object(LoginPage).submit_credentials("standard_user", "secret_sauce")
+        await leased.wait_for_outcome("inventory", LoginPage.ERROR)
+        await leased.page_object(InventoryPage).wait_until_visible()
+        return await leased.storage_state()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def authenticated_browser(browser, authenticated_state):
+    """
+    Like ``browser``, but already signed in and on the inventory page.
+    """
+    from settings.configs.general import url_inventory
+
+    await browser.restore_session(authenticated_state, url_inventory())
+    return browser
+
+
+@pytest.fixture
+def session_store(tmp_path):
+    from infrastructure.session_store import SessionStore
+
+    return SessionStore(directory=str(tmp_path / "sessions"))
+
+
+@pytest.fixture
+def login_use_case(browser, session_store):
+    """
+    Login bound to the test's leased page. A leased page has no pool to lease from, so
+    ``execute`` takes a single user here; concurrent logins need the session browser.
+    """
+    from application.login_use_case import LoginUseCase
+
+    return LoginUseCase(browser, logging.getLogger("tests"), session_store)
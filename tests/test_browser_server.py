@@ -0,0 +1,87 @@
+import json
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from infrastructure.browser_server import BrowserServer, is_healthy
+from settings.configs.browser_config import BrowserConfig
+
+
+# Listens like a browser server and prints its endpoint, without needing a browser.
+FAKE_SERVER = """
+import socket, sys
+listener = socket.create_server(("127.0.0.1", 0))
+print(f"ws://127.0.0.1:{listener.getsockname()[1]}/fake", flush=True)
+while True:
+    listener.accept()[0].close()
+"""
+
+
+class FakeServer(BrowserServer):
+    launched: int = 0
+
+    def command(self, browser_type: str) -> list[str]:
+        self.launched += 1
+        return [sys.executable, "-c", FAKE_SERVER]
+
+
+@pytest.fixture
+def server(tmp_path):
+    server = FakeServer(
+        state_file=str(tmp_path / "server.json"),
+        log_file=str(tmp_path / "server.log"),
+        options_file=str(tmp_path / "options.json"),
+        startup_timeout=10.0,
+    )
+    yield server
+    server.stop()
+
+
+def test_start_launches_and_records_the_server(server):
+    endpoint = server.start(BrowserConfig(browser_type="firefox", headless=True))
+
+    assert endpoint.startswith("ws://127.0.0.1:")
+    assert is_healthy(endpoint)
+    assert server.endpoint() == endpoint
+    with open(server.state_file) as f:
+        assert json.load(f)["browser_type"] == "firefox"
+    with open(server.options_file) as f:
+        assert json.load(f)["headless"] is True
+
+
+def test_start_reuses_a_running_server(server):
+    config = BrowserConfig()
+    endpoint = server.start(config)
+    pid = server.pid()
+
+    assert server.start(config) == endpoint
+    assert server.launched == 1
+    assert server.pid() == pid
+
+
+def test_stale_state_is_cleaned_up_and_replaced(server):
+    dead = subprocess.Popen([sys.executable, "-c", "pass"])
+    dead.wait()
+    with open(server.state_file, "w") as f:
+        json.dump({"pid": dead.pid, "ws_endpoint": "ws://127.0.0.1:9/gone", "browser_type": "chromium"}, f)
+
+    assert server.endpoint() is None
+    assert not os.path.exists(server.state_file)
+    endpoint = server.start(BrowserConfig())
+    assert endpoint != "ws://127.0.0.1:9/gone"
+    assert server.launched == 1
+
+
+def test_stop_terminates_the_server(server):
+    endpoint = server.start(BrowserConfig())
+
+    assert server.stop()
+    deadline = time.monotonic() + 5
+    while is_healthy(endpoint) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert not is_healthy(endpoint)
+    assert server.endpoint() is None
+    assert not server.stop()
@@ -0,0 +1,129 @@
+import csv
+import logging
+
+import pytest
+
+from application.extract_products_use_case import ExtractProductsUseCase
+from benchmarks.standin_server import StandInServer, generate_catalog
+from infrastructure.browser_service import BrowserService
+from infrastructure.catalog_snapshot import CatalogSnapshotStore
+from infrastructure.product_exporter import ProductStreamExporter
+from settings.configs.browser_config import BrowserConfig
+
+
+def item(item_id, name, price):
+    return {"name": name, "price": price, "id": item_id, "image": f"/img/{item_id}.jpg"}
+
+
+class FakeNextLink:
+    def __init__(self, page):
+        self.page = page
+        self.first = self
+
+    async def click(self, timeout=None):
+        if not self.page.stuck:
+            self.page.index += 1
+
+
+class FakeListingPage:
+    """Inventory split over ``listings``, one list of extracted records per page."""
+
+    def __init__(self, *listings, stuck=False):
+        self.listings = listings
+        # The next-page link is shown but clicking it stays on the page.
+        self.stuck = stuck
+        self.index = 0
+        self.evaluations = []
+
+    @property
+    def url(self):
+        return f"http://standin/inventory.html?page={self.index + 1}"
+
+    async def eval_on_selector_all(self, selector, script):
+        self.evaluations.append(self.index)
+        return list(self.listings[self.index])
+
+    async def query_selector(self, selector):
+        return object() if self.index + 1 < len(self.listings) else None
+
+    def locator(self, selector):
+        return FakeNextLink(self)
+
+    async def wait_for_load_state(self, state=None, timeout=None):
+        pass
+
+    def is_closed(self):
+        return False
+
+
+def make_service(page) -> BrowserService:
+    service = BrowserService(config=BrowserConfig(pacing="fast"), logger=logging.getLogger("test_browser_service"))
+    service.page = page
+    return service
+
+
+@pytest.mark.asyncio
+async def test_rows_with_an_empty_price_are_left_out_of_the_export(tmp_path):
+    page = FakeListingPage(
+        [item(4, "Sauce Labs Backpack", "29.99"), item(0, "Sauce Labs Bike Light", "")],
+        [item(1, "", "15.99"), item(2, "Sauce Labs Onesie", "7.99")],
+    )
+    logger = logging.getLogger("test_browser_service")
+    use_case = ExtractProductsUseCase(
+        make_service(page),
+        exporter=ProductStreamExporter(logger),
+        snapshots=CatalogSnapshotStore(directory=str(tmp_path / ".catalog")),
+        logger=logger,
+    )
+    filename = tmp_path / "products.csv"
+
+    catalog = await use_case.execute(str(filename))
+
+    with open(filename, newline="") as f:
+        rows = list(csv.reader(f))[1:]
+    assert [row[:3] for row in rows] == [["Sauce Labs Backpack", "29.99", "4"], ["Sauce Labs Onesie", "7.99", "2"]]
+    assert len(catalog) == 2
+
+
+@pytest.mark.asyncio
+async def test_pages_are_read_once_and_split_into_batches():
+    first = [item(i, f"Item {i}", "1.99") for i in range(5)]
+    second = [item(i, f"Item {i}", "2.99") for i in range(5, 7)]
+    page = FakeListingPage(first, second)
+    service = make_service(page)
+
+    batches = [batch async for batch in service.paginate(batch_size=2)]
+
+    assert [[product.id for product in batch] for batch in batches] == [[0, 1], [2, 3], [4], [5, 6]]
+    # One evaluation per page, the next-page link followed once.
+    assert page.evaluations == [0, 1]
+    assert service.state.current_url == page.url
+    assert batches[0][0].image_url == "/img/0.jpg"
+
+
+@pytest.mark.asyncio
+async def test_pagination_stops_when_the_next_link_does_not_navigate():
+    page = FakeListingPage([item(0, "Item 0", "1.99")], [item(1, "Item 1", "1.99")], stuck=True)
+    service = make_service(page)
+
+    batches = [batch async for batch in service.paginate()]
+
+    assert [[product.id for product in batch] for batch in batches] == [[0]]
+    assert page.evaluations == [0]
+
+
+@pytest.mark.asyncio
+async def test_listing_ids_and_images_are_read_from_the_standin(browser):
+    """Launches a browser: walks the three inventory pages of the stand-in server."""
+    with StandInServer(catalog_size=1200, page_size=500) as server:
+        cookie = {"name": "session-username", "value": "standard_user", "url": server.url}
+        await browser.restore_session({"cookies": [cookie]}, f"{server.url}inventory.html")
+
+        batches = [batch async for batch in browser.paginate(batch_size=400)]
+
+    assert [len(batch) for batch in batches] == [400, 100, 400, 100, 200]
+    products = [product for batch in batches for product in batch]
+    expected = generate_catalog(1200)
+    assert [product.id for product in products] == [catalog_item.id for catalog_item in expected]
+    assert products[0].name == "Sauce Labs Backpack" and products[0].price == "29.99"
+    assert products[0].image_url == f"{server.url}static/item_4.svg"
@@ -0,0 +1,69 @@
+import json
+import logging
+
+import pytest
+
+from application.extract_products_use_case import ExtractProductsUseCase
+from domain.entities.product import Product
+from infrastructure.catalog_snapshot import CatalogSnapshotStore
+from infrastructure.product_exporter import ProductStreamExporter
+
+
+class FakeBrowserService:
+    def __init__(self, products):
+        self.products = products
+
+    async def paginate(self):
+        yield list(self.products)
+
+
+def make_use_case(tmp_path, products, skip_unchanged=False):
+    logger = logging.getLogger("test_catalog_snapshot")
+    return ExtractProductsUseCase(
+        FakeBrowserService(products),
+        exporter=ProductStreamExporter(logger),
+        snapshots=CatalogSnapshotStore(directory=str(tmp_path / ".catalog")),
+        logger=logger,
+        skip_unchanged=skip_unchanged,
+    )
+
+
+@pytest.mark.asyncio
+async def test_diff_reports_added_removed_and_repriced(tmp_path):
+    filename = str(tmp_path / "products.csv")
+    await make_use_case(tmp_path, [
+        Product("Backpack", "$29.99", id=4),
+        Product("Bike Light", "$9.99", id=0),
+    ]).execute(filename)
+
+    await make_use_case(tmp_path, [
+        Product("Backpack", "$24.99", id=4),
+        Product("Onesie", "$7.99", id=2),
+    ]).execute(filename)
+
+    with open(tmp_path / "products.diff.json") as f:
+        diff = json.load(f)
+    assert [item["name"] for item in diff["added"]] == ["Onesie"]
+    assert [item["name"] for item in diff["removed"]] == ["Bike Light"]
+    assert diff["repriced"] == [
+        {"name": "Backpack", "price": "24.99", "id": 4, "image_url": None, "description": None, "previous_price": "29.99"}
+    ]
+    assert diff["changed"] == []
+
+
+@pytest.mark.asyncio
+async def test_skip_unchanged_leaves_export_untouched(tmp_path):
+    filename = tmp_path / "products.csv"
+    products = [Product("Backpack", "$29.99", id=4)]
+    await make_use_case(tmp_path, products).execute(str(filename))
+    filename.write_text("sentinel")
+
+    catalog = await make_use_case(tmp_path, products, skip_unchanged=True).execute(str(filename))
+
+    assert len(catalog) == 1
+    assert filename.read_text() == "sentinel"
+    assert sorted(p.name for p in tmp_path.iterdir()) == [".catalog", "products.csv", "products.diff.json"]
+    with open(tmp_path / "products.diff.json") as f:
+        diff = json.load(f)
+    # The first run's diff listed the backpack as added; it must not linger.
+    assert diff["added"] == [] and diff["removed"] == [] and diff["repriced"] == []
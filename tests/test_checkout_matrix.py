@@ -0,0 +1,129 @@
+import asyncio
+from contextlib import asynccontextmanager
+import logging
+
+import pytest
+
+from application.checkout_matrix_use_case import (
+    REQUIRED_ERRORS, CheckoutCase, CheckoutMatrixUseCase, checkout_cases,
+)
+from infrastructure.page_objects import CheckoutOverviewPage, CheckoutPage
+
+
+class FakeForm:
+    """Stands in for every page object; the checkout form rejects empty fields like saucedemo."""
+
+    def __init__(self, browser):
+        self.browser = browser
+
+    async def add_to_cart(self, slug):
+        if slug == "unknown-item":
+            raise RuntimeError(f"No add-to-cart button for {slug}")
+
+    async def open_cart(self):
+        pass
+
+    async def checkout(self):
+        pass
+
+    async def submit_information(self, first_name=None, last_name=None, postal_code=None):
+        await asyncio.sleep(0.01)
+        values = {"first_name": first_name, "last_name": last_name, "postal_code": postal_code}
+        self.browser.errors = [REQUIRED_ERRORS[name] for name, value in values.items() if not value][:1]
+
+
+class FakeBrowser:
+    def __init__(self, pool):
+        self.pool = pool
+        self.errors = []
+        self.cookies = None
+
+    async def restore_session(self, state, url=None):
+        self.cookies = state["cookies"]
+
+    async def go_to(self, url):
+        assert self.cookies, "cases must run signed in"
+
+    def page_object(self, cls):
+        return FakeForm(self)
+
+    async def wait_for_any(self, *selectors):
+        return CheckoutPage.ERROR if self.errors else CheckoutOverviewPage.FINISH
+
+    async def get_validation_errors(self):
+        return self.errors
+
+
+class FakeService:
+    def __init__(self, size):
+        self.semaphore = asyncio.Semaphore(size)
+        self.active = self.peak = 0
+
+    async def storage_state(self):
+        return {"cookies": [{"name": "session-username", "value": "standard_user"}], "origins": [{"origin": "x"}]}
+
+    @asynccontextmanager
+    async def lease(self):
+        async with self.semaphore:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            try:
+                yield FakeBrowser(self)
+            finally:
+                self.active -= 1
+
+
+def test_matrix_covers_every_combination():
+    cases = checkout_cases(("sauce-labs-backpack", "sauce-labs-bike-light"))
+
+    assert len(cases) == 54
+    assert len({(case.product, tuple(case.states.values())) for case in cases}) == 54
+    control = CheckoutCase("sauce-labs-backpack", {"first_name": "valid", "last_name": "valid", "postal_code": "valid"})
+    assert control.expected_errors == []
+    case = CheckoutCase("x", {"first_name": "invalid", "last_name": "missing", "postal_code": "missing"})
+    assert case.values == {"first_name": "   ", "last_name": None, "postal_code": None}
+    assert case.expected_errors == ["Error: Last Name is required"]
+
+
+@pytest.mark.asyncio
+async def test_cases_run_concurrently_and_are_reported(monkeypatch):
+    monkeypatch.setenv("URL_LOG", "https://www.saucedemo.com")
+    service = FakeService(size=4)
+    use_case = CheckoutMatrixUseCase(
+        service, logging.getLogger("test_checkout_matrix"), products=("sauce-labs-backpack", "unknown-item")
+    )
+
+    report = await use_case.execute()
+
+    assert service.peak == 4
+    assert report.summary() == {"cases": 54, "accepted": 8, "rejected": 19, "failed": 27, "mismatched": 27}
+    assert {case.product for case in report.mismatches} == {"unknown-item"}
+    assert report.error_counts()["Error: First Name is required"] == 9
+    assert report.to_dict()["cases"][0]["matched"] is True
+
+
+class UnleasableService(FakeService):
+    @asynccontextmanager
+    async def lease(self):
+        raise RuntimeError("Browser closed")
+        yield
+
+
+@pytest.mark.asyncio
+async def test_lease_failures_are_reported_per_case(monkeypatch):
+    monkeypatch.setenv("URL_LOG", "https://www.saucedemo.com")
+    use_case = CheckoutMatrixUseCase(UnleasableService(size=1), logging.getLogger("test_checkout_matrix"))
+
+    report = await use_case.execute()
+
+    assert report.summary()["failed"] == 27
+    assert {case.failure for case in report.cases} == {"Browser closed"}
+
+
+def test_matrix_is_opt_in(monkeypatch):
+    from settings.containers import get_scenario
+
+    monkeypatch.delenv("CHECKOUT_MATRIX", raising=False)
+    assert CheckoutMatrixUseCase not in get_scenario()
+    monkeypatch.setenv("CHECKOUT_MATRIX", "true")
+    assert CheckoutMatrixUseCase in get_scenario()
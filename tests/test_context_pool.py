@@ -0,0 +1,68 @@
+import asyncio
+
+import pytest
+
+from infrastructure.context_pool import BrowserContextPool
+
+
+def make_pool(new_slot, size=2, **kwargs):
+    pool = BrowserContextPool(lambda: new_slot(cookies=["session-username"]), size=size, **kwargs)
+    return pool, new_slot.created
+
+
+def test_pool_size_must_be_positive():
+    with pytest.raises(ValueError):
+        BrowserContextPool(lambda: None, size=0)
+
+
+@pytest.mark.asyncio
+async def test_released_slots_are_wiped_and_reused(new_slot):
+    pool, created = make_pool(new_slot)
+
+    async with pool.lease() as (context, page):
+        page.url = "https://www.saucedemo.com/inventory.html"
+    async with pool.lease() as slot:
+        pass
+
+    assert len(created) == 1
+    assert slot == created[0]
+    assert context.cookies == []
+    assert page.url == "about:blank"
+    assert "localStorage.clear()" in page.scripts[0]
+
+
+@pytest.mark.asyncio
+async def test_leases_are_bounded_by_size(new_slot):
+    pool, created = make_pool(new_slot, size=2)
+    active = peak = 0
+
+    async def work():
+        nonlocal active, peak
+        async with pool.lease():
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    await asyncio.gather(*(work() for _ in range(6)))
+
+    assert peak == 2
+    assert len(created) == 2
+
+
+@pytest.mark.asyncio
+async def test_closed_and_retired_slots_are_discarded(new_slot):
+    pool, created = make_pool(new_slot, size=1, should_retire=lambda slot: slot is created[0])
+
+    async with pool.lease():
+        pass
+    async with pool.lease() as (_, page):
+        page.closed = True
+    async with pool.lease() as slot:
+        pass
+
+    assert [context.closed for context, _ in created] == [True, True, False]
+    assert slot == created[2]
+
+    await pool.close()
+    assert created[2][0].closed
@@ -0,0 +1,111 @@
+import asyncio
+import logging
+import time
+
+import pytest
+
+from infrastructure.browser_service import BrowserServiceState
+from infrastructure.deadline import (
+    CircuitBreaker, CircuitOpenError, DeadlineExceeded, deadline, effective_timeout, remaining,
+)
+from infrastructure.handle_errors import BrowserOperationError, handle_errors
+
+
+class _Service:
+    def __init__(self):
+        self.logger = logging.getLogger("test_deadline")
+        self.state = BrowserServiceState(breaker=CircuitBreaker(threshold=2, reset_after=0.2))
+        self.evidence = 0
+
+    async def _capture_error_evidence(self):
+        self.evidence += 1
+
+    @handle_errors(log_message="Navigation failed")
+    async def go_to(self, url: str, delay: float = 0.0, fail: bool = False) -> None:
+        await asyncio.sleep(delay)
+        if fail:
+            raise RuntimeError("connection refused")
+
+    @handle_errors(log_message="Failed to restore session")
+    async def restore_session(self, url: str) -> None:
+        await self.go_to(url, fail=True)
+
+
+def test_nested_budgets_never_extend_the_outer_one():
+    assert remaining() is None
+    assert effective_timeout(30000) == 30000
+    with deadline(1.0):
+        with deadline(10.0):
+            assert remaining() <= 1.0
+            assert effective_timeout(30000) <= 1000
+        with deadline(0.0):
+            time.sleep(0.001)
+            with pytest.raises(DeadlineExceeded):
+                effective_timeout(30000)
+    assert remaining() is None
+
+
+@pytest.mark.asyncio
+async def test_operations_are_cut_at_the_deadline():
+    service = _Service()
+
+    started = time.perf_counter()
+    with deadline(0.1):
+        with pytest.raises(DeadlineExceeded):
+            await service.go_to("https://www.saucedemo.com/", delay=5)
+        with pytest.raises(DeadlineExceeded):
+            await service.go_to("https://www.saucedemo.com/")
+
+    assert time.perf_counter() - started < 1
+    assert service.evidence == 0
+    assert not service.state.breaker.is_open("www.saucedemo.com")
+
+
+@pytest.mark.asyncio
+async def test_circuit_opens_after_repeated_failures_and_recovers():
+    service = _Service()
+    url = "https://www.saucedemo.com/"
+
+    for _ in range(2):
+        with pytest.raises(BrowserOperationError):
+            await service.go_to(url, fail=True)
+    with pytest.raises(CircuitOpenError):
+        await service.go_to(url)
+    await service.go_to("https://example.com/")
+
+    await asyncio.sleep(0.25)
+    await service.go_to(url)
+    assert not service.state.breaker.is_open("www.saucedemo.com")
+
+
+@pytest.mark.asyncio
+async def test_nested_operations_fail_once():
+    service = _Service()
+
+    for _ in range(2):
+        with pytest.raises(BrowserOperationError) as error:
+            await service.restore_session("https://www.saucedemo.com/")
+        assert isinstance(error.value.__cause__, RuntimeError)
+
+    assert service.evidence == 2
+    assert service.state.metrics.by_operation()["restore_session"].error == 2
+    assert "go_to" not in service.state.metrics.by_operation()
+    # Two failures reach the threshold of 2; four would have been recorded when nested calls counted too.
+    assert service.state.breaker._circuits["www.saucedemo.com"].failures == 2
+
+
+@pytest.mark.asyncio
+async def test_half_open_circuit_lets_one_trial_through():
+    service = _Service()
+    url = "https://www.saucedemo.com/"
+    for _ in range(2):
+        with pytest.raises(BrowserOperationError):
+            await service.go_to(url, fail=True)
+    await asyncio.sleep(0.25)
+
+    outcomes = await asyncio.gather(*(service.go_to(url, delay=0.05) for _ in range(5)), return_exceptions=True)
+
+    assert outcomes.count(None) == 1
+    assert all(isinstance(outcome, CircuitOpenError) for outcome in outcomes if outcome is not None)
+    assert not service.state.breaker.is_open("www.saucedemo.com")
+    await asyncio.gather(*(service.go_to(url) for _ in range(5)))
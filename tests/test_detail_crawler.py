@@ -0,0 +1,91 @@
+import asyncio
+from contextlib import asynccontextmanager
+import logging
+
+import pytest
+
+from domain.entities.product import Product
+from infrastructure.detail_crawler import ProductDetailCrawler
+
+
+class FakeBrowserService:
+    def __init__(self, flaky=(), broken=(), slow=(), unseedable=False):
+        self.flaky, self.broken, self.slow = set(flaky), set(broken), set(slow)
+        self.unseedable = unseedable
+        self.active = self.peak = 0
+        self.seeded = []
+
+    async def storage_state(self):
+        return {"cookies": [{"name": "session-username", "value": "standard_user"}]}
+
+    @asynccontextmanager
+    async def lease(self):
+        yield self
+
+    async def restore_session(self, state, url=None):
+        if self.unseedable:
+            raise RuntimeError("context closed")
+        self.seeded.append(state)
+
+    async def extract_product_detail(self, url):
+        item_id = int(url.rsplit("=", 1)[1])
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(1 if item_id in self.slow else 0.01)
+            if item_id in self.broken or item_id in self.flaky:
+                self.flaky.discard(item_id)
+                raise RuntimeError(f"item {item_id} failed")
+            return {"name": f"Item {item_id}", "price": "9.99", "description": f"About {item_id}", "image": f"/{item_id}.jpg"}
+        finally:
+            self.active -= 1
+
+
+def make_crawler(browser_service, **kwargs):
+    return ProductDetailCrawler(
+        browser_service=browser_service,
+        logger=logging.getLogger("test_detail_crawler"),
+        base_url="https://www.saucedemo.com/",
+        backoff=0,
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_enrich_keeps_order_and_caps_concurrency():
+    browser_service = FakeBrowserService()
+    crawler = make_crawler(browser_service, concurrency=3)
+    products = [Product(f"Item {i}", "9.99", id=i) for i in range(10)] + [Product("No id", "1.00")]
+
+    enriched = await crawler.enrich(products)
+
+    assert [product.description for product in enriched] == [f"About {i}" for i in range(10)] + [None]
+    assert enriched[4].image_url == "/4.jpg"
+    assert browser_service.peak == 3
+    assert len(browser_service.seeded) == 3
+    assert (crawler.stats.crawled, crawler.stats.skipped) == (10, 1)
+
+
+@pytest.mark.asyncio
+async def test_enrich_retries_and_passes_failures_through():
+    browser_service = FakeBrowserService(flaky={1}, broken={2}, slow={3})
+    crawler = make_crawler(browser_service, concurrency=2, timeout=0.2, retries=1)
+    products = [Product(f"Item {i}", "9.99", id=i) for i in range(4)]
+
+    enriched = await crawler.enrich(products)
+
+    assert enriched[1].description == "About 1"
+    assert enriched[2] == products[2]
+    assert enriched[3] == products[3]
+    assert (crawler.stats.crawled, crawler.stats.retried, crawler.stats.failed) == (2, 3, 2)
+
+
+@pytest.mark.asyncio
+async def test_worker_failures_pass_items_through():
+    crawler = make_crawler(FakeBrowserService(unseedable=True), concurrency=2)
+    products = [Product(f"Item {i}", "9.99", id=i) for i in range(3)]
+
+    enriched = await crawler.enrich(products)
+
+    assert enriched == products
+    assert crawler.stats.failed == 3
@@ -1,5 +1,12 @@
+import csv
+import gzip
+import json
+
+import pytest
+
 from domain.entities.product import Product
 from infrastructure.csv_exporter import ProductCSVExporter
+from infrastructure.product_exporter import ProductStreamExporter
 
 
 def test_csv_export(tmp_path, container):
@@ -11,4 +18,56 @@ def test_csv_export(tmp_path, container):
     
     with open(file_path) as f:
         content = f.read()
-        assert "Test,$10" in content
\ No newline at end of file
+        assert "Test,$10" in content
+
+
+async def _stream(products):
+    for product in products:
+        yield product
+
+
+@pytest.mark.asyncio
+async def test_stream_export_csv(tmp_path, container):
+    exporter = container.resolve(ProductStreamExporter)
+    exporter.chunk_size = 2
+    products = [Product(name=f"Item {i}", price=f"{i}.99", id=i) for i in range(1, 6)]
+
+    file_path = tmp_path / "products.csv"
+    count = await exporter.export(_stream(products), file_path)
+
+    with open(file_path, newline="") as f:
+        rows = list(csv.reader(f))
+    assert count == 5
+    assert rows[0] == ["Product Name", "Price", "Id", "Image", "Description"]
+    assert rows[1] == ["Item 1", "1.99", "1", "", ""]
+    assert len(rows) == 6
+    assert [p.name for p in tmp_path.iterdir()] == ["products.csv"]
+
+
+@pytest.mark.asyncio
+async def test_stream_export_jsonl_gzip_append(tmp_path, container):
+    exporter = container.resolve(ProductStreamExporter)
+    file_path = tmp_path / "products.jsonl.gz"
+
+    await exporter.export(_stream([Product(name="First", price="1.00")]), file_path)
+    await exporter.export(_stream([Product(name="Second", price="2.00")]), file_path, append=True)
+
+    with gzip.open(file_path, "rt") as f:
+        names = [json.loads(line)["name"] for line in f]
+    assert names == ["First", "Second"]
+
+
+@pytest.mark.asyncio
+async def test_stream_export_skips_invalid_rows(tmp_path, container, caplog):
+    exporter = container.resolve(ProductStreamExporter)
+    exporter.chunk_size = 2
+    products = [Product(name=f"Item {i}", price="n/a" if i == 3 else f"{i}.99", id=i) for i in range(1, 6)]
+
+    file_path = tmp_path / "products.csv"
+    count = await exporter.export(_stream(products), file_path)
+
+    with open(file_path, newline="") as f:
+        names = [row[0] for row in csv.reader(f)][1:]
+    assert count == 4
+    assert names == ["Item 1", "Item 2", "Item 4", "Item 5"]
+    assert "row 2: invalid price 'n/a'" in caplog.text
@@ -0,0 +1,62 @@
+import json
+import logging
+
+import pytest
+
+from infrastructure.har import HarArchive, merge_har
+from infrastructure.request_router import RequestRouter
+from settings.configs.browser_config import BrowserConfig
+
+
+def write_part(path, url, started):
+    entry = {"startedDateTime": started, "request": {"method": "GET", "url": url}, "response": {"status": 200}}
+    path.write_text(json.dumps({"log": {"version": "1.2", "pages": [], "entries": [entry]}}))
+    return str(path)
+
+
+def test_recorded_contexts_are_merged_in_time_order(tmp_path):
+    config = BrowserConfig(har_mode="record", har_path=str(tmp_path / "network.har"))
+    archive = HarArchive(config, logging.getLogger("test_har"))
+
+    first, second = archive.context_options(), archive.context_options()
+    assert first["record_har_content"] == "embed"
+    write_part(tmp_path / "network.har.parts" / "context-0.har", "https://www.saucedemo.com/inventory.html", "2")
+    write_part(tmp_path / "network.har.parts" / "context-1.har", "https://www.saucedemo.com/", "1")
+    assert [first["record_har_path"], second["record_har_path"]] == [
+        str(tmp_path / "network.har.parts" / "context-0.har"), str(tmp_path / "network.har.parts" / "context-1.har")
+    ]
+
+    archive.finish()
+
+    with open(config.har_path) as f:
+        entries = json.load(f)["log"]["entries"]
+    assert [entry["request"]["url"] for entry in entries] == [
+        "https://www.saucedemo.com/", "https://www.saucedemo.com/inventory.html"
+    ]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["network.har"]
+    assert merge_har([str(tmp_path / "missing.har")], str(tmp_path / "out.har")) == 0
+
+
+@pytest.mark.asyncio
+async def test_replay_reports_missing_requests_once(fake_route):
+    config = BrowserConfig(har_mode="replay", blocked_url_patterns=(r"google-analytics\.com",))
+    logger = logging.getLogger("test_har")
+    archive = HarArchive(config, logger, router=RequestRouter(config, logger))
+
+    routes = [
+        fake_route("https://www.saucedemo.com/static/js/new.js", "script"),
+        fake_route("https://www.saucedemo.com/static/js/new.js", "script"),
+        fake_route("https://www.google-analytics.com/collect", "xhr"),
+    ]
+    for route in routes:
+        await archive._abort_missing(route)
+
+    assert archive.missing == ["GET https://www.saucedemo.com/static/js/new.js"]
+    assert [route.outcome for route in routes] == [
+        ("abort", "internetdisconnected"), ("abort", "internetdisconnected"), ("abort", "blockedbyclient")
+    ]
+
+
+def test_unknown_mode_is_rejected():
+    with pytest.raises(ValueError, match="HAR mode"):
+        HarArchive(BrowserConfig(har_mode="replay-all"), logging.getLogger("test_har"))
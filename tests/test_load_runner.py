@@ -0,0 +1,42 @@
+import time
+
+from application.load_runner import STEPS, LoadProfile, StepSamples, percentile, run_worker, summarize
+from benchmarks.standin_server import StandInServer
+
+
+def test_percentile_uses_nearest_rank():
+    values = [float(i) for i in range(1, 101)]
+    assert percentile(values, 0.50) == 50.0
+    assert percentile(values, 0.95) == 95.0
+    assert percentile(values, 0.99) == 99.0
+    assert percentile([], 0.99) == 0.0
+
+
+def test_summarize_merges_worker_samples():
+    first, second = StepSamples(), StepSamples()
+    for seconds in (0.1, 0.2, 0.3):
+        first.observe(seconds, ok=True)
+    second.observe(2.0, ok=False)
+    first.merge(second)
+
+    report = summarize({"login": first}, elapsed=2.0)
+
+    assert report["login"]["count"] == 4
+    assert report["login"]["error_rate"] == 0.25
+    assert report["login"]["p99_seconds"] == 2.0
+    assert report["login"]["throughput_per_second"] == 2.0
+
+
+def test_worker_runs_the_flow_against_the_standin(tmp_path, monkeypatch):
+    """Launches a browser: two virtual users repeat login, extract and checkout for a second."""
+    monkeypatch.chdir(tmp_path)
+    with StandInServer() as server:
+        monkeypatch.setenv("URL_LOG", server.url)
+        profile = LoadProfile(
+            url=server.url, virtual_users=2, ramp_up=0.0, duration=1.0, processes=1, start_at=time.time()
+        )
+        samples = run_worker(profile, 0, [0, 1])
+
+    for step in STEPS:
+        assert samples[step].latencies, step
+        assert samples[step].errors == 0, step
@@ -0,0 +1,58 @@
+import json
+import logging
+import threading
+
+from infrastructure.logger import JsonFormatter, configure_logger, shutdown_logging
+
+
+def test_configure_logger_is_idempotent(tmp_path):
+    log_file = tmp_path / "automation.log"
+    logger = configure_logger("test-idempotent", filename=str(log_file))
+    logger = configure_logger("test-idempotent", filename=str(log_file))
+
+    logger.info("hello %s", "world")
+    shutdown_logging("test-idempotent")
+
+    assert len(logger.handlers) == 1
+    assert log_file.read_text().count("hello world") == 1
+
+
+def test_structured_logging_writes_json_lines(tmp_path):
+    log_file = tmp_path / "automation.jsonl"
+    logger = configure_logger("test-structured", filename=str(log_file), structured=True)
+
+    logger.info("User %s logged in", "standard_user", extra={"use_case": "login", "user": "standard_user", "duration": 0.5})
+    shutdown_logging("test-structured")
+
+    entry = json.loads(log_file.read_text().splitlines()[0])
+    assert entry["message"] == "User standard_user logged in"
+    assert entry["use_case"] == "login"
+    assert entry["duration"] == 0.5
+    assert entry["level"] == logging.getLevelName(logging.INFO)
+
+
+def test_records_are_formatted_on_the_listener_thread(tmp_path, monkeypatch):
+    threads = []
+    original = JsonFormatter.format
+
+    def format(self, record):
+        threads.append(threading.current_thread())
+        return original(self, record)
+
+    monkeypatch.setattr(JsonFormatter, "format", format)
+    log_file = tmp_path / "automation.jsonl"
+    logger = configure_logger("test-listener", filename=str(log_file), structured=True)
+    users = ["standard_user"]
+
+    logger.info("Users: %s", users)
+    users.append("locked_out_user")
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        logger.exception("Failed")
+    shutdown_logging("test-listener")
+
+    assert threads and threading.current_thread() not in threads
+    first, second = (json.loads(line) for line in log_file.read_text().splitlines())
+    assert first["message"] == "Users: ['standard_user']"
+    assert "ValueError: boom" in second["exc_info"]
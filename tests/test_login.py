@@ -1,35 +1,40 @@
-from application.login_use_case import LoginUseCase
 import pytest
 
 from domain.entities.user import User
+from infrastructure.page_objects import InventoryPage
 from settings.configs.general import url_login
 
 
 @pytest.mark.asyncio
-async def test_successful_login(container):
-    login_uc = container.resolve(LoginUseCase)
-    async with login_uc.browser_service as browser:
-        await browser.go_to(url_login())   
-        users = [User(username="standard_user", password="secret_sauce")]
-        await login_uc.execute(users)
-        
-        page = login_uc.browser_service.page
-        await page.wait_for_selector("#inventory_container")
-        content = await page.content()
-        
-        assert "inventory" in page.url
-        assert "Sauce Labs Backpack" in content
+async def test_successful_login(login_use_case):
+    browser = login_use_case.browser_service
+    await browser.go_to(url_login())
+    users = [User(username="standard_user", password="secret_sauce")]
+    await login_use_case.execute(users)
+
+    page = browser.page
+    await page.wait_for_selector("#inventory_container")
+    content = await page.content()
+
+    assert "inventory" in page.url
+    assert "Sauce Labs Backpack" in content
 
 
 @pytest.mark.asyncio
-async def test_failed_login(container):
-    login_uc = container.resolve(LoginUseCase)
-    async with login_uc.browser_service as browser:
-        await browser.go_to(url_login())
-        users = [User(username="invalid_user", password="wrong_password")]
-        await login_uc.execute(users)
+async def test_failed_login(login_use_case):
+    browser = login_use_case.browser_service
+    await browser.go_to(url_login())
+    users = [User(username="invalid_user", password="wrong_password")]
+    await login_use_case.execute(users)
+
+    page = browser.page
+    error = await page.content()
 
-        page = login_uc.browser_service.page
-        error = await page.content()
+    assert "Epic sadface: Username and password do not match any user in this service" in error
+
+
+@pytest.mark.asyncio
+async def test_authenticated_browser_skips_the_login_form(authenticated_browser):
+    await authenticated_browser.page_object(InventoryPage).wait_until_visible()
 
-        assert "Epic sadface: Username and password do not match any user in this service" in error
\ No newline at end of file
+    assert "inventory" in authenticated_browser.current_url
@@ -0,0 +1,78 @@
+import asyncio
+from contextlib import asynccontextmanager
+import logging
+
+import pytest
+
+from application.login_use_case import LoginUseCase
+from domain.entities.user import User
+from infrastructure.page_objects import InventoryPage
+from infrastructure.session_store import SessionStore
+from settings.configs.browser_config import BrowserConfig
+
+
+class FakeLoginPage:
+    def __init__(self, browser):
+        self.browser = browser
+
+    async def submit_credentials(self, username, password):
+        service = self.browser.service
+        service.active += 1
+        service.peak = max(service.peak, service.active)
+        await asyncio.sleep(0.01)
+        service.active -= 1
+        if password == "secret_sauce":
+            self.browser.current_url = "https://www.saucedemo.com/inventory.html"
+
+
+class FakeBrowser:
+    def __init__(self, service):
+        self.service = service
+        self.current_url = "https://www.saucedemo.com/"
+
+    async def go_to(self, url):
+        self.current_url = url
+
+    async def restore_session(self, state, url=None):
+        self.current_url = url
+
+    async def wait_for_any(self, *selectors):
+        return InventoryPage.CONTAINER
+
+    def page_object(self, cls):
+        return FakeLoginPage(self)
+
+    async def wait_for_outcome(self, *outcomes):
+        pass
+
+    async def storage_state(self):
+        return {"cookies": [], "origins": []}
+
+    async def take_screenshot(self, path):
+        pass
+
+
+class FakeService(FakeBrowser):
+    def __init__(self, pool_size):
+        self.config = BrowserConfig(pool_size=pool_size)
+        self.active = self.peak = 0
+        super().__init__(self)
+
+    @asynccontextmanager
+    async def lease(self):
+        yield FakeBrowser(self)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_logins_count_the_shared_page(tmp_path, monkeypatch):
+    monkeypatch.setenv("URL_LOG", "https://www.saucedemo.com/")
+    service = FakeService(pool_size=3)
+    use_case = LoginUseCase(service, logging.getLogger("test_login_use_case"), SessionStore(str(tmp_path)))
+    users = [User("locked_out_user", "secret")] + [User(f"user_{n}", "secret_sauce") for n in range(7)]
+
+    results = await use_case.execute(users)
+
+    assert service.peak == 3
+    assert results == {"locked_out_user": False, **{f"user_{n}": True for n in range(7)}}
+    # The shared page is signed in with the first user that succeeded.
+    assert "inventory" in service.current_url
@@ -0,0 +1,47 @@
+import logging
+
+import pytest
+
+from infrastructure.browser_service import BrowserServiceState
+from infrastructure.handle_errors import BrowserOperationError, handle_errors
+from infrastructure.metrics import OperationMetrics
+
+
+class _Service:
+    def __init__(self):
+        self.logger = logging.getLogger("test")
+        self.state = BrowserServiceState()
+
+    async def _capture_error_evidence(self):
+        pass
+
+    @handle_errors(log_message="Failed to click element")
+    async def click(self, selector: str) -> None:
+        if selector == "#missing":
+            raise TimeoutError("not found")
+
+
+@pytest.mark.asyncio
+async def test_handle_errors_records_latency_and_outcomes():
+    service = _Service()
+    await service.click("#present")
+    await service.click("#present")
+    with pytest.raises(BrowserOperationError):
+        await service.click("#missing")
+
+    stats = service.state.metrics.stats
+    assert stats[("click", "#present")].success == 2
+    assert stats[("click", "#missing")].error == 1
+    assert service.state.metrics.by_operation()["click"].latency.count == 3
+
+
+def test_prometheus_output_has_cumulative_buckets():
+    metrics = OperationMetrics()
+    metrics.observe("go_to", 'https://example.com/"x"', 0.2)
+    metrics.observe("go_to", 'https://example.com/"x"', 3.0, ok=False)
+
+    text = metrics.to_prometheus()
+
+    assert 'browser_operation_duration_seconds_bucket{operation="go_to",selector="https://example.com/\\"x\\"",le="0.25"} 1' in text
+    assert 'le="+Inf"} 2' in text
+    assert 'outcome="error"} 1' in text
@@ -0,0 +1,87 @@
+import logging
+
+import pytest
+
+from infrastructure.browser_service import BrowserService
+from infrastructure.pacing import AdaptivePacing, FastPacing, HumanPacing, pacing_policy
+from settings.configs.browser_config import BrowserConfig
+
+
+class FakePage:
+    def __init__(self):
+        self.waits = []
+
+    async def wait_for_timeout(self, timeout):
+        self.waits.append(("timeout", timeout))
+
+    async def wait_for_selector(self, selector, state=None, timeout=None):
+        self.waits.append(("selector", selector, state))
+
+    async def wait_for_load_state(self, state=None, timeout=None):
+        self.waits.append(("load_state", state))
+
+    async def wait_for_function(self, expression, arg=None, timeout=None):
+        self.waits.append(("function", arg, timeout))
+
+    def is_closed(self):
+        return False
+
+
+@pytest.mark.asyncio
+async def test_human_pacing_pauses_within_its_delays():
+    page = FakePage()
+    pacing = HumanPacing(fill_delay=(10, 20), click_delay=(30, 40))
+
+    await pacing.after_fill(page, "#user-name")
+    await pacing.after_click(page, "#login-button")
+    await pacing.settle(page, ".inventory_list")
+
+    (_, fill), (_, click), settle = page.waits
+    assert 10 <= fill <= 20 and 30 <= click <= 40
+    assert settle == ("selector", ".inventory_list", "visible")
+
+
+@pytest.mark.asyncio
+async def test_fast_pacing_only_waits_for_the_expected_selector():
+    page = FakePage()
+    pacing = FastPacing()
+
+    await pacing.after_fill(page, "#user-name")
+    await pacing.after_click(page, "#login-button")
+    await pacing.settle(page)
+    assert page.waits == []
+
+    await pacing.settle(page, ".inventory_list")
+    assert page.waits == [("selector", ".inventory_list", "visible")]
+
+
+@pytest.mark.asyncio
+async def test_adaptive_pacing_falls_back_to_network_idle():
+    page = FakePage()
+    pacing = AdaptivePacing()
+
+    await pacing.after_click(page, "#login-button")
+    await pacing.settle(page)
+    await pacing.settle(page, ".inventory_list")
+
+    assert page.waits == [("load_state", "networkidle"), ("selector", ".inventory_list", "visible")]
+
+
+def test_pacing_policy_follows_the_configured_mode():
+    policy = pacing_policy(BrowserConfig(pacing="adaptive", timeout=5000))
+    assert isinstance(policy, AdaptivePacing) and policy.timeout == 5000
+
+    with pytest.raises(ValueError, match="Unknown pacing mode 'slow'") as error:
+        pacing_policy(BrowserConfig(pacing="slow"))
+    assert error.value.__suppress_context__
+
+
+@pytest.mark.asyncio
+async def test_wait_for_outcome_waits_on_the_url_or_the_selector():
+    page = FakePage()
+    service = BrowserService(config=BrowserConfig(pacing="fast", timeout=5000), logger=logging.getLogger("test_pacing"))
+    service.page = page
+
+    await service.wait_for_outcome("inventory", ".error-message-container")
+
+    assert page.waits == [("function", ["inventory", ".error-message-container"], 5000)]
@@ -0,0 +1,140 @@
+import asyncio
+import logging
+
+import pytest
+
+from infrastructure.browser_service import BrowserService
+from infrastructure.page_objects import CheckoutPage, LoginPage
+from settings.configs.browser_config import BrowserConfig
+
+
+class FakeLocator:
+    def __init__(self, page, selector):
+        self.page = page
+        self.selector = selector
+        self.first = self
+
+    async def fill(self, value, timeout=None):
+        self.page.actions.append(("fill", self.selector, value))
+
+    async def click(self, timeout=None):
+        self.page.actions.append(("click", self.selector))
+        await asyncio.sleep(0.01)
+
+
+class FakePage:
+    def __init__(self, missing=()):
+        self.missing = list(missing)
+        self.created = []
+        self.actions = []
+        self.evaluations = []
+
+    def locator(self, selector):
+        self.created.append(selector)
+        return FakeLocator(self, selector)
+
+    async def evaluate(self, script, arg):
+        self.evaluations.append(arg)
+        return self.missing
+
+    def is_closed(self):
+        return False
+
+
+def make_service(page, form_fill="locator") -> BrowserService:
+    service = BrowserService(
+        config=BrowserConfig(pacing="fast", form_fill=form_fill), logger=logging.getLogger("test_page_objects")
+    )
+    service.page = page
+    return service
+
+
+def test_selectors_are_collected_from_constants():
+    assert LoginPage.selectors() == {
+        "USERNAME": "#user-name",
+        "PASSWORD": "#password",
+        "SUBMIT": '[data-test="login-button"]',
+        "ERROR": ".error-message-container",
+    }
+
+
+def test_page_objects_and_locators_are_cached_per_page():
+    page = FakePage()
+    service = make_service(page)
+
+    login = service.page_object(LoginPage)
+    assert service.page_object(LoginPage) is login
+    assert service.locator(LoginPage.USERNAME) is service.locator(LoginPage.USERNAME)
+    # No round trip to the browser to build a page object.
+    assert page.evaluations == []
+    assert sorted(page.created) == sorted(LoginPage.selectors().values())
+
+    service.page = FakePage()
+    assert service.page_object(LoginPage) is not login
+
+
+@pytest.mark.asyncio
+async def test_forms_are_filled_through_locators_by_default():
+    page = FakePage()
+    service = make_service(page)
+    checkout = service.page_object(CheckoutPage)
+
+    await checkout.submit_information(last_name="Doe", postal_code="12345")
+
+    assert page.actions == [
+        ("fill", CheckoutPage.LAST_NAME, "Doe"),
+        ("fill", CheckoutPage.POSTAL_CODE, "12345"),
+        ("click", CheckoutPage.CONTINUE),
+    ]
+    assert page.evaluations == []
+
+
+@pytest.mark.asyncio
+async def test_script_form_fill_is_one_evaluation():
+    page = FakePage()
+    service = make_service(page, form_fill="script")
+    checkout = service.page_object(CheckoutPage)
+
+    await checkout.submit_information(last_name="Doe", postal_code="12345")
+
+    assert page.evaluations == [
+        [[(CheckoutPage.LAST_NAME, "Doe"), (CheckoutPage.POSTAL_CODE, "12345")], CheckoutPage.CONTINUE]
+    ]
+    assert page.actions == []
+
+    page.missing = [CheckoutPage.CONTINUE]
+    with pytest.raises(Exception, match="Form elements not found"):
+        await checkout.submit_information(first_name="John")
+
+
+class SlowPacing:
+    async def after_click(self, page, selector):
+        await asyncio.sleep(0.2)
+
+    async def settle(self, page, wait_for=None):
+        if wait_for:
+            await asyncio.sleep(0.15)
+
+
+@pytest.mark.asyncio
+async def test_pacing_is_kept_out_of_operation_latency():
+    service = make_service(FakePage())
+    service.pacing = SlowPacing()
+
+    await service.click(LoginPage.SUBMIT)
+
+    stats = service.state.metrics.by_operation()
+    assert stats["click"].latency.total < 0.1
+    assert stats["pacing"].latency.total >= 0.2
+
+
+@pytest.mark.asyncio
+async def test_waiting_for_the_outcome_counts_towards_click_latency():
+    service = make_service(FakePage())
+    service.pacing = SlowPacing()
+
+    await service.click(LoginPage.SUBMIT, wait_for=".inventory_list")
+
+    stats = service.state.metrics.by_operation()
+    assert 0.15 <= stats["click"].latency.total < 0.3
+    assert 0.2 <= stats["pacing"].latency.total < 0.35
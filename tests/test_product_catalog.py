@@ -0,0 +1,69 @@
+import pytest
+
+from domain.entities.product import Product
+from domain.entities.product_catalog import CatalogValidationError, ProductCatalog, parse_prices
+
+
+def make_catalog() -> ProductCatalog:
+    return ProductCatalog.from_records([
+        {"name": "Backpack", "price": "29.99", "id": 4, "image": "/backpack.jpg"},
+        {"name": "Bike Light", "price": "$9.99", "id": 0, "image": None},
+        {"name": "Onesie", "price": "7.9", "id": 2, "image": None},
+        {"name": "Fleece Jacket", "price": "49.99", "id": 5, "image": None},
+    ])
+
+
+def test_prices_are_parsed_to_cents():
+    cents, errors = parse_prices(["$29.99", "7.9", "10", 15.5, "free"])
+    assert list(cents) == [2999, 790, 1000, 1550, 0]
+    assert errors == ["row 4: invalid price 'free'"]
+
+
+def test_catalog_round_trips_products():
+    catalog = make_catalog()
+
+    assert len(catalog) == 4
+    assert catalog[1] == Product("Bike Light", "9.99", 0)
+    assert ProductCatalog.from_products(catalog).price_cents == catalog.price_cents
+    assert list(catalog.rows())[0] == ("Backpack", "29.99", 4, "/backpack.jpg", None)
+
+
+def test_bulk_validation_rejects_whole_batch():
+    catalog = make_catalog()
+
+    with pytest.raises(CatalogValidationError) as error:
+        catalog.add_columns(["", "Ok"], ["1.00", "n/a"], [None, None], [None, None], [None, None])
+
+    assert error.value.errors == ["row 1: invalid price 'n/a'", "row 0: empty name"]
+    assert len(catalog) == 4
+
+
+def test_indexes_and_stats():
+    catalog = make_catalog()
+
+    assert catalog.find("Onesie") == [Product("Onesie", "7.90", 2)]
+    assert catalog.find("Missing") == []
+    assert [product.name for product in catalog.price_range(700, 3000)] == ["Onesie", "Bike Light", "Backpack"]
+
+    catalog.extend([Product("T-Shirt", "15.99", 1)])
+    assert [product.name for product in catalog.price_range(1500, 1600)] == ["T-Shirt"]
+
+    stats = catalog.stats()
+    assert (stats.count, stats.min_cents, stats.max_cents) == (5, 790, 4999)
+    assert stats.mean_cents == pytest.approx((2999 + 999 + 790 + 4999 + 1599) / 5)
+    histogram = catalog.histogram(bins=3)
+    assert [count for _, _, count in histogram] == [3, 1, 1]
+    assert histogram[0][0] == 790 and histogram[-1][1] == 4999
+
+
+def test_bulk_validation_can_skip_invalid_rows():
+    catalog = make_catalog()
+
+    errors = catalog.add_columns(
+        ["", "Ok", "Bad"], ["1.00", "2.50", "n/a"], [None, 7, 8], [None, None, None], [None, None, None],
+        skip_invalid=True, first_row=10,
+    )
+
+    assert errors == ["row 12: invalid price 'n/a'", "row 10: empty name"]
+    assert catalog[4] == Product("Ok", "2.50", 7)
+    assert len(catalog) == 5
@@ -0,0 +1,69 @@
+import asyncio
+import logging
+
+import pytest
+
+from infrastructure.browser_service import BrowserServiceState
+from infrastructure.handle_errors import handle_errors
+from infrastructure.profiling import Profiler
+
+
+class _Service:
+    def __init__(self):
+        self.logger = logging.getLogger("test_profiling")
+        self.state = BrowserServiceState()
+
+    @handle_errors(log_message="Navigation failed")
+    async def go_to(self, url: str) -> None:
+        await asyncio.sleep(0.02)
+
+    async def visit_all(self, urls: list[str]) -> None:
+        await asyncio.gather(*(self.go_to(url) for url in urls))
+
+    @staticmethod
+    def parse(text: str) -> list[str]:
+        return text.split()
+
+
+@pytest.mark.asyncio
+async def test_spans_follow_tasks_and_separate_handle_errors():
+    profiler = Profiler()
+    original = _Service.__dict__["go_to"]
+    profiler.instrument(_Service, "go_to", "visit_all", "parse")
+    service = _Service()
+
+    with profiler.span("main"):
+        await service.visit_all(["https://www.saucedemo.com/", "https://www.saucedemo.com/cart.html"])
+        assert service.parse("a b") == ["a", "b"]
+    profiler.restore()
+
+    assert _Service.__dict__["go_to"] is original
+    assert isinstance(_Service.__dict__["parse"], staticmethod)
+    stacks = profiler.spans
+    body = ("main", "_Service.visit_all", "handle_errors[go_to]", "_Service.go_to")
+    assert stacks[body].calls == 2
+    assert stacks[body[:-1]].total >= stacks[body].total
+    assert stacks[("main", "_Service.parse")].calls == 1
+    # The operations still reach the decorator's metrics.
+    assert service.state.metrics.by_operation()["go_to"].success == 2
+
+    folded = profiler.folded().splitlines()
+    assert any(line.startswith("main;_Service.visit_all;handle_errors[go_to];_Service.go_to ") for line in folded)
+    assert all(int(line.rsplit(" ", 1)[1]) > 0 for line in folded)
+    summary = profiler.summary()
+    # Concurrent calls add up, so the two operations outrank the wall time of main.
+    assert summary.splitlines()[2].startswith("handle_errors[go_to] ")
+    assert "handle_errors overhead:" in summary and "over 2 calls" in summary
+
+
+def test_recursive_spans_are_counted_once(tmp_path):
+    profiler = Profiler()
+    with profiler.span("resolve"):
+        with profiler.span("resolve"):
+            pass
+    total_line = next(line for line in profiler.summary().splitlines() if line.startswith("resolve"))
+    assert total_line.split()[1] == "2"
+    assert float(total_line.split()[2]) == pytest.approx(profiler.spans[("resolve",)].total, abs=1e-3)
+
+    folded, text = profiler.dump(str(tmp_path / "out" / "profile"))
+    assert folded.endswith("profile.folded") and text.endswith("profile.txt")
@@ -0,0 +1,93 @@
+import logging
+
+import pytest
+
+from infrastructure.request_router import CachedResponse, RequestRouter, StaticAssetCache
+from settings.configs.browser_config import BrowserConfig
+
+
+def make_router() -> RequestRouter:
+    config = BrowserConfig(
+        blocked_resource_types=("image",),
+        blocked_url_patterns=(r"google-analytics\.com",),
+        static_cache_bytes=1024,
+    )
+    return RequestRouter(config, logging.getLogger("test_request_router"))
+
+
+async def route(router: RequestRouter, fake):
+    await router.handle(fake)
+    return fake
+
+
+def test_static_asset_cache_evicts_least_recently_used():
+    cache = StaticAssetCache(max_bytes=10)
+    cache.put("a.js", CachedResponse(200, {}, b"aaaa"))
+    cache.put("b.css", CachedResponse(200, {}, b"bbbb"))
+    assert cache.get("a.js").body == b"aaaa"
+
+    cache.put("c.js", CachedResponse(200, {}, b"cccc"))
+
+    assert cache.get("b.css") is None
+    assert cache.get("a.js") is not None
+    assert len(cache) == 2
+
+
+def test_static_asset_cache_skips_oversized_bodies():
+    cache = StaticAssetCache(max_bytes=4)
+    cache.put("big.js", CachedResponse(200, {}, b"0123456789"))
+    assert cache.get("big.js") is None
+
+
+@pytest.mark.asyncio
+async def test_blocked_types_and_urls_are_aborted(fake_route):
+    router = make_router()
+
+    image = await route(router, fake_route("https://www.saucedemo.com/static/media/bolt.jpg", "image"))
+    tracker = await route(router, fake_route("https://www.google-analytics.com/collect", "xhr"))
+
+    assert image.outcome == tracker.outcome == ("abort", "blockedbyclient")
+    assert router.stats.blocked == 2
+
+
+@pytest.mark.asyncio
+async def test_static_assets_are_served_from_cache_after_the_first_fetch(fake_route):
+    router = make_router()
+    url = "https://www.saucedemo.com/static/js/main.js"
+
+    first = await route(router, fake_route(url, "script"))
+    second = await route(router, fake_route(url, "script"))
+
+    assert first.outcome == ("fetched", b"console.log(1)")
+    assert second.fetches == 0
+    # Replayed without the transfer encoding of the original response.
+    headers = {"content-type": "text/javascript", "cache-control": "max-age=60"}
+    assert second.outcome == ("fulfill", 200, headers, b"console.log(1)")
+    assert (router.stats.cached, router.stats.passed) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_other_requests_pass_through(fake_route):
+    router = make_router()
+
+    document = await route(router, fake_route("https://www.saucedemo.com/inventory.html", "document"))
+    post = await route(router, fake_route("https://www.saucedemo.com/static/js/main.js", "script", method="POST"))
+
+    assert document.outcome == post.outcome == ("continue",)
+    assert post.fetches == 0
+    assert router.stats.passed == 2
+    assert len(router.cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_fetches_are_left_to_the_browser(fake_route):
+    router = make_router()
+    fake = fake_route(
+        "https://www.saucedemo.com/static/js/main.js", "script", fetch_error=RuntimeError("net::ERR_CONNECTION_RESET")
+    )
+
+    await router.handle(fake)
+
+    assert fake.outcome == ("continue",)
+    assert (router.stats.failed, router.stats.passed) == (1, 0)
+    assert len(router.cache) == 0
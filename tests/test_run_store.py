@@ -0,0 +1,69 @@
+import sqlite3
+
+from application.scheduler import StepTiming
+from domain.entities.product_catalog import ProductCatalog
+from domain.entities.product import Product
+from infrastructure.run_store import RunStore, quantile
+
+
+def _step(name: str, duration: float, status: str = "ok") -> StepTiming:
+    return StepTiming(name, status=status, queued=0.0, started=1.0, finished=1.0 + duration)
+
+
+def test_quantile_uses_nearest_rank():
+    assert quantile([], 0.95) == 0.0
+    assert quantile([3.0, 1.0, 2.0], 0.5) == 2.0
+    assert quantile([float(n) for n in range(1, 101)], 0.95) == 95.0
+
+
+def test_runs_are_batched_and_queryable(tmp_path):
+    path = str(tmp_path / "runs.db")
+    store = RunStore(path=path, batch_size=100)
+    catalog = ProductCatalog.from_products(
+        [Product(f"Item {n}", f"{n}.99", n) for n in range(250)] + [Product("Bike Light", "$9.99")]
+    )
+
+    for n in range(1, 6):
+        run_id = store.start_run(["LoginUseCase", "CheckoutUseCase"])
+        store.record_steps(run_id, [_step("LoginUseCase", n), _step("CheckoutUseCase", 0.5, status="failed")])
+        store.record_logins(run_id, {"standard_user": True, "locked_out_user": n == 5})
+        store.record_validation_errors(run_id, "checkout", ["Error: First Name is required"])
+        # Nothing reaches the database before a batch fills up or the run finishes.
+        assert sqlite3.connect(path).execute("SELECT COUNT(*) FROM steps").fetchone()[0] == 2 * (n - 1)
+        store.finish_run(run_id)
+    store.record_products(run_id, catalog)
+    store.close()
+
+    reader = RunStore(path=path)
+    assert reader._connection().execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert reader.step_latency(0.95) == {"LoginUseCase": 5.0}
+    assert reader.step_latency(0.5, runs=3, name="LoginUseCase") == {"LoginUseCase": 4.0}
+    assert reader.login_success_rate() == {"locked_out_user": 0.2, "standard_user": 1.0}
+    assert reader.validation_error_counts(runs=2) == {"Error: First Name is required": 2}
+    assert reader.price_history("Item 7") == [(5, 799)]
+    assert reader.price_history("Bike Light") == [(5, 999)]
+    assert [run["status"] for run in reader.recent_runs(2)] == ["ok", "ok"]
+    assert reader._connection().execute(
+        "SELECT product_id FROM product_snapshots WHERE name = 'Bike Light'"
+    ).fetchone() == (None,)
+    reader.close()
+
+
+class Schedule:
+    def __init__(self, results):
+        self.timings = [_step("ExtractProductsUseCase", 1.0)]
+        self.results = results
+
+
+def test_run_records_the_extracted_catalog(tmp_path):
+    from main import record_run
+
+    store = RunStore(path=str(tmp_path / "runs.db"))
+    run_id = store.start_run(["ExtractProductsUseCase"])
+    catalog = ProductCatalog.from_products([Product("Backpack", "$29.99", 4)])
+
+    record_run(store, run_id, Schedule({"products": catalog}))
+    store.finish_run(run_id)
+
+    assert store.price_history("Backpack") == [(run_id, 2999)]
+    store.close()
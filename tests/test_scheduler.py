@@ -0,0 +1,138 @@
+import asyncio
+from dataclasses import dataclass
+import logging
+
+import punq
+import pytest
+
+from application.base import UseCase
+from application.scheduler import SchedulingError, UseCaseScheduler
+
+
+events: list[str] = []
+
+
+@dataclass
+class FakeUseCase(UseCase[str]):
+    delay = 0.05
+
+    @property
+    def browser_service(self):
+        return None
+
+    async def execute(self, **kwargs) -> str:
+        events.append(f"start:{type(self).__name__}")
+        await asyncio.sleep(self.delay)
+        events.append(f"end:{type(self).__name__}")
+        return type(self).__name__
+
+
+class Users(FakeUseCase):
+    provides = "users"
+
+
+class Login(FakeUseCase):
+    requires = ("users",)
+    provides = "session"
+    resources = frozenset({"page"})
+
+    async def execute(self, users: str) -> str:
+        assert users == "Users"
+        return await super().execute()
+
+
+class Extract(FakeUseCase):
+    requires = ("session",)
+    provides = "products"
+    resources = frozenset({"page"})
+
+
+class Report(FakeUseCase):
+    requires = ("session",)
+    provides = "report"
+
+
+class Broken(FakeUseCase):
+    requires = ("session",)
+    delay = 0.0
+
+    async def execute(self) -> str:
+        raise RuntimeError("boom")
+
+
+def make_scheduler(*use_cases: type[UseCase]) -> UseCaseScheduler:
+    events.clear()
+    container = punq.Container()
+    for use_case in use_cases:
+        container.register(use_case)
+    return UseCaseScheduler(container=container, logger=logging.getLogger("test_scheduler"))
+
+
+@pytest.mark.asyncio
+async def test_runs_in_dependency_order_and_passes_results():
+    scheduler = make_scheduler(Users, Login, Extract, Report)
+
+    schedule = await scheduler.run([Extract, Report, Login, Users])
+
+    assert schedule.results == {"users": "Users", "session": "Login", "products": "Extract", "report": "Report"}
+    assert events.index("end:Users") < events.index("start:Login")
+    assert events.index("end:Login") < events.index("start:Extract")
+    assert all(timing.status == "ok" for timing in schedule.timings)
+
+
+@pytest.mark.asyncio
+async def test_independent_steps_overlap_but_resources_serialize():
+    scheduler = make_scheduler(Users, Login, Extract, Report)
+
+    await scheduler.run([Users, Login, Extract, Report])
+
+    # Report shares no resource with Extract, so both start before either ends.
+    assert events.index("start:Report") < events.index("end:Extract")
+    assert events.index("start:Extract") < events.index("end:Report")
+
+
+@pytest.mark.asyncio
+async def test_failure_cancels_pending_steps():
+    scheduler = make_scheduler(Users, Login, Extract, Broken)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await scheduler.run([Users, Login, Broken, Extract])
+
+    assert "end:Extract" not in events
+
+
+def test_rejects_unsatisfiable_requirements():
+    scheduler = make_scheduler(Login, Extract)
+
+    with pytest.raises(SchedulingError, match="Login"):
+        asyncio.run(scheduler.run([Login, Extract]))
+
+
+def test_rejects_duplicate_providers():
+    scheduler = make_scheduler(Users, Login)
+
+    class OtherUsers(FakeUseCase):
+        provides = "users"
+
+    with pytest.raises(SchedulingError, match="both provide"):
+        asyncio.run(scheduler.run([Users, OtherUsers]))
+
+
+def test_default_scenario_orders_shared_resources_explicitly():
+    from settings.containers import get_scenario
+
+    scenario = get_scenario()
+    providers = {use_case.provides: use_case for use_case in scenario if use_case.provides}
+
+    def upstream(use_case) -> set:
+        found = set()
+        for requirement in use_case.requires:
+            found |= {providers[requirement]} | upstream(providers[requirement])
+        return found
+
+    for first in scenario:
+        for second in scenario:
+            if first is not second and first.resources & second.resources:
+                assert first in upstream(second) or second in upstream(first), (first, second)
+    after_login = [use_case for use_case in scenario if use_case.requires == ("session",)]
+    assert sum(1 for use_case in after_login if "page" in use_case.resources) == 1
@@ -0,0 +1,69 @@
+import logging
+import os
+
+import pytest
+
+from infrastructure.screenshot_service import ScreenshotService
+
+
+@pytest.mark.asyncio
+async def test_identical_frames_are_deduplicated(tmp_path):
+    service = ScreenshotService(logger=logging.getLogger("test"), directory=str(tmp_path))
+
+    service.submit(str(tmp_path / "first.png"), b"frame")
+    service.submit(str(tmp_path / "second.png"), b"frame")
+    await service.close()
+
+    assert service.stats.saved == 1
+    assert service.stats.deduplicated == 1
+    assert os.path.samefile(tmp_path / "first.png", tmp_path / "second.png")
+
+
+@pytest.mark.asyncio
+async def test_retention_keeps_newest_files(tmp_path):
+    service = ScreenshotService(logger=logging.getLogger("test"), directory=str(tmp_path), max_files=2)
+
+    for i in range(4):
+        service.submit(str(tmp_path / f"shot_{i}.png"), f"frame {i}".encode())
+        await service.flush()
+        os.utime(tmp_path / f"shot_{i}.png", (i, i))
+    await service.close()
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["shot_2.png", "shot_3.png"]
+    assert service.stats.evicted == 2
+
+
+class FakePage:
+    def __init__(self, frame: bytes):
+        self.frame = frame
+
+    async def screenshot(self, full_page=False, **options):
+        return self.frame
+
+
+@pytest.mark.asyncio
+async def test_bare_names_are_written_to_the_retained_directory(tmp_path):
+    service = ScreenshotService(logger=logging.getLogger("test"), directory=str(tmp_path / "shots"), max_files=1)
+
+    first = await service.capture(FakePage(b"inventory"), "success_standard_user.png")
+    await service.flush()
+    os.utime(first, (0, 0))
+    second = await service.capture(FakePage(b"checkout"), "checkout_validation_error.png")
+    await service.close()
+
+    assert first == str(tmp_path / "shots" / "success_standard_user.png")
+    assert os.listdir(tmp_path / "shots") == [os.path.basename(second)]
+
+
+@pytest.mark.asyncio
+async def test_overwritten_files_are_not_linked_as_duplicates(tmp_path):
+    service = ScreenshotService(logger=logging.getLogger("test"), directory=str(tmp_path))
+
+    service.submit(str(tmp_path / "x.png"), b"A")
+    service.submit(str(tmp_path / "x.png"), b"B")
+    service.submit(str(tmp_path / "y.png"), b"A")
+    await service.close()
+
+    assert (tmp_path / "x.png").read_bytes() == b"B"
+    assert (tmp_path / "y.png").read_bytes() == b"A"
+    assert service.stats.deduplicated == 0
@@ -0,0 +1,25 @@
+from domain.entities.user import User
+from infrastructure.session_store import SessionStore
+
+
+def test_session_store_round_trip(tmp_path):
+    store = SessionStore(directory=str(tmp_path))
+    state = {"cookies": [{"name": "session-username", "value": "standard_user"}], "origins": []}
+
+    store.save_state("https://www.saucedemo.com/", "standard_user", state)
+    store.save_users("https://www.saucedemo.com/", [User("standard_user", "secret_sauce")])
+
+    assert store.load_state("https://www.saucedemo.com/inventory.html", "standard_user") == state
+    assert store.load_users("https://www.saucedemo.com") == [User("standard_user", "secret_sauce")]
+    # The same user on another host has a session of its own.
+    assert store.load_state("http://127.0.0.1:8000/", "standard_user") is None
+
+    store.invalidate("https://www.saucedemo.com/", "standard_user")
+    assert store.load_state("https://www.saucedemo.com/", "standard_user") is None
+
+
+def test_session_store_expires_entries(tmp_path):
+    store = SessionStore(directory=str(tmp_path), ttl=-1)
+    store.save_state("https://www.saucedemo.com/", "standard_user", {"cookies": []})
+    assert store.load_state("https://www.saucedemo.com/", "standard_user") is None
+    assert list(tmp_path.iterdir()) == []
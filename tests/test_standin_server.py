@@ -0,0 +1,59 @@
+from urllib.error import HTTPError
+from urllib.request import HTTPRedirectHandler, Request, build_opener, urlopen
+
+import pytest
+
+from benchmarks.standin_server import StandInServer, generate_catalog
+
+
+class _NoRedirect(HTTPRedirectHandler):
+    def redirect_request(self, *args, **kwargs):
+        return None
+
+
+@pytest.fixture
+def standin():
+    with StandInServer(catalog_size=2500, page_size=1000) as server:
+        yield server
+
+
+def _get(url: str, cookie: str | None = None) -> str:
+    request = Request(url, headers={"Cookie": cookie} if cookie else {})
+    with urlopen(request) as response:
+        return response.read().decode()
+
+
+def test_catalog_starts_with_the_real_inventory():
+    catalog = generate_catalog(1000)
+    assert len(catalog) == 1000
+    assert catalog[0].name == "Sauce Labs Backpack" and catalog[0].price == "$29.99"
+    assert len({item.id for item in catalog}) == 1000
+
+
+def test_inventory_is_paginated(standin):
+    cookie = "session-username=standard_user"
+    first = _get(f"{standin.url}inventory.html", cookie)
+    last = _get(f"{standin.url}inventory.html?page=3", cookie)
+
+    assert first.count('class="inventory_item"') == 1000
+    assert 'data-test="pagination-next" href="/inventory.html?page=2"' in first
+    assert last.count('class="inventory_item"') == 500
+    assert "pagination-next" not in last
+
+
+def test_protected_pages_redirect_to_login(standin):
+    with pytest.raises(HTTPError) as error:
+        build_opener(_NoRedirect).open(f"{standin.url}inventory.html")
+    assert error.value.code == 302
+    assert error.value.headers["Location"] == "/?error=inventory"
+
+    login = _get(standin.url)
+    assert "standard_user" in login and "secret_sauce" in login
+
+
+@pytest.mark.parametrize("path", ["inventory.html?page=two", "inventory-item.html?id=x"])
+def test_non_numeric_queries_are_bad_requests(standin, path):
+    request = Request(f"{standin.url}{path}", headers={"Cookie": "session-username=standard_user"})
+    with pytest.raises(HTTPError) as error:
+        urlopen(request)
+    assert error.value.code == 400
@@ -0,0 +1,50 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Project packages that importing the entry point may load; everything else waits for get_container().
+ENTRY_POINT_MODULES = {"main", "settings", "settings.configs", "settings.configs.general", "settings.containers"}
+HEAVY_DEPENDENCIES = ("playwright", "fake_useragent", "dotenv", "punq")
+
+
+def imported_modules(statement: str) -> set[str]:
+    """
+    Run ``statement`` in a fresh interpreter.
+
+    :return: The names of every module loaded once it ran.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-c", f"import sys\n{statement}\nprint('\\n'.join(sys.modules))"],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    return set(completed.stdout.split())
+
+
+def project_modules(modules: set[str]) -> set[str]:
+    packages = {name for name in os.listdir(ROOT) if os.path.isdir(os.path.join(ROOT, name))}
+    return {name for name in modules if name == "main" or name.split(".")[0] in packages}
+
+
+@pytest.mark.parametrize("module", ["main", "settings.containers"])
+def test_import_loads_only_the_entry_point(module):
+    modules = imported_modules(f"import {module}")
+
+    assert project_modules(modules) <= ENTRY_POINT_MODULES
+    assert not any(name.split(".")[0] in HEAVY_DEPENDENCIES for name in modules)
+
+
+def test_building_the_container_loads_the_providers():
+    modules = imported_modules("from settings.containers import _init_container; _init_container()")
+
+    assert {"infrastructure.browser_service", "application.login_use_case", "punq"} <= modules
+
+
+def test_browser_config_does_not_load_fake_useragent():
+    modules = imported_modules(
+        "from settings.configs.browser_config import BrowserConfig; assert BrowserConfig().user_agent"
+    )
+    assert "fake_useragent" not in modules
@@ -0,0 +1,117 @@
+import json
+import logging
+import os
+import subprocess
+import sys
+
+import pytest
+
+from infrastructure.browser_service import BrowserService
+from infrastructure.context_pool import BrowserContextPool
+from infrastructure.watchdog import ResourceWatchdog, process_tree_rss
+from settings.configs.browser_config import BrowserConfig
+
+
+async def make_service(new_slot, max_operations: int) -> BrowserService:
+    config = BrowserConfig(pacing="fast", recycle_max_operations=max_operations)
+    service = BrowserService(config=config, logger=logging.getLogger("test_watchdog"))
+    service._context, service.page = await new_slot("https://www.saucedemo.com/inventory.html")
+    service._playwright = object()
+    service._new_page = new_slot
+    return service
+
+
+def test_process_tree_rss_counts_descendants():
+    if not os.path.isdir("/proc"):
+        pytest.skip("requires /proc")
+    child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(5)"])
+    try:
+        assert process_tree_rss(os.getpid()) > 0
+        assert process_tree_rss(os.getpid(), include_root=True) > process_tree_rss(os.getpid())
+        assert process_tree_rss(child.pid) == 0
+    finally:
+        child.kill()
+        child.wait()
+
+
+def test_thresholds_and_report(tmp_path, fake_context):
+    context = fake_context()
+    watchdog = ResourceWatchdog(max_operations=3, max_rss_bytes=1, interval=60, include_root=True)
+    for _ in range(2):
+        watchdog.count(context)
+    # The first check samples memory, the next one waits for the interval.
+    if os.path.isdir("/proc"):
+        assert watchdog.recycle_reason(context).startswith("browser RSS")
+    assert watchdog.recycle_reason(context) is None
+    watchdog.count(context)
+    assert watchdog.recycle_reason(context) == "3 operations"
+
+    watchdog.record_recycle(context, "3 operations", "https://www.saucedemo.com/")
+    assert watchdog.operations(context) == 0
+    watchdog.dump(str(tmp_path / "watchdog.json"), str(tmp_path / "watchdog.prom"))
+    report = json.loads((tmp_path / "watchdog.json").read_text())
+    assert report["events"][0]["operations"] == 3
+    assert len(report["samples"]) == 1
+    assert "browser_context_recycles_total 1" in (tmp_path / "watchdog.prom").read_text()
+    assert not ResourceWatchdog().enabled
+
+
+@pytest.mark.asyncio
+async def test_context_is_recycled_with_its_session(new_slot):
+    service = await make_service(new_slot, max_operations=2)
+    old_context = service._context
+
+    await service.go_to("https://www.saucedemo.com/inventory.html")
+    assert service._context is old_context
+    await service.go_to("https://www.saucedemo.com/cart.html")
+
+    assert old_context.closed
+    assert service._context is not old_context
+    assert service._context.cookies == [{"name": "session-username", "value": "standard_user"}]
+    assert service.page.url == "https://www.saucedemo.com/cart.html"
+    assert service.page.storage == {"cart": "[4]"}
+    [event] = service.state.watchdog.events
+    assert (event.reason, event.url) == ("2 operations", "https://www.saucedemo.com/inventory.html")
+    # Operations run while restoring the session are not counted.
+    assert service.state.watchdog.operations(service._context) == 0
+
+
+@pytest.mark.asyncio
+async def test_pool_retires_worn_contexts(new_slot):
+    watchdog = ResourceWatchdog(max_operations=1)
+
+    pool = BrowserContextPool(new_slot, size=1, should_retire=lambda slot: watchdog.recycle_reason(slot[0]) is not None)
+    async with pool.lease() as (context, _):
+        watchdog.count(context)
+    async with pool.lease() as (fresh, _):
+        pass
+
+    [(worn, _), (created, _)] = new_slot.created
+    assert worn.closed
+    assert fresh is created
+
+
+def test_memory_check_rearms_below_the_threshold(monkeypatch, fake_context):
+    rss = iter([200, 150, 95, 89, 120])
+    monkeypatch.setattr("infrastructure.watchdog.process_tree_rss", lambda *args: next(rss))
+    watchdog = ResourceWatchdog(max_rss_bytes=100, interval=0)
+    context = fake_context()
+
+    assert watchdog.recycle_reason(context) is not None
+    # Still above the threshold after the recycle: not recycled again.
+    assert watchdog.recycle_reason(context) is None
+    assert watchdog.recycle_reason(context) is None
+    # Fell below 90% of the threshold, so growing past it counts again.
+    assert watchdog.recycle_reason(context) is None
+    assert watchdog.recycle_reason(context) is not None
+
+
+def test_operation_counts_do_not_outlive_contexts(fake_context):
+    watchdog = ResourceWatchdog(max_operations=10)
+    context = fake_context()
+    watchdog.count(context)
+    watchdog.count(context)
+
+    assert watchdog.operations(context) == 2
+    del context
+    assert len(watchdog._operations) == 0